@@ -57,6 +57,7 @@ MYAQI_APPS = [
     'au_epa_data',
     'common',
     'epa_data',
+    'forecasting',
     'geo_data'
 ]
 
@@ -168,6 +169,21 @@ MEDIA_URL = '/media/'
 
 MEDIA_ROOT = os.path.join(BASE_DIR, '../../media')
 
+# Caches
+# https://docs.djangoproject.com/en/2.1/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Shared with the import commands, which clear it
+    'experiments': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, '../../cache/experiments'),
+        'TIMEOUT': 7 * 24 * 60 * 60,
+    },
+}
+
 # Rest Framework
 
 API_PREFIX = 'api'
@@ -14,3 +14,12 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "aqi_backend.settings")
 
 application = get_wsgi_application()
+
+# Load the forecasting models before the first request, which would
+# otherwise spend its latency budget on it
+from forecasting import registry  # noqa: E402
+from forecasting.constants import (  # noqa: E402
+    AU_SITES_FORECAST, FORECASTABLE_POLLUTANTS, MULTI_OUTPUT_TARGET)
+
+registry.preload_models(
+    AU_SITES_FORECAST, FORECASTABLE_POLLUTANTS + [MULTI_OUTPUT_TARGET])
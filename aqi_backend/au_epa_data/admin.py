@@ -1,9 +1,12 @@
 from django.contrib import admin
 
 from .models import (
+    BackfillCheckpoint,
     EquipmentType,
     IncidentSite,
+    LiveSnapshot,
     Measurement,
+    MeasurementWatermark,
     Monitor,
     MonitorTimeBasis,
     Site,
@@ -72,9 +75,30 @@ class MeasurementAdmin(admin.ModelAdmin):
         'aqi_category_threshold', 'health_category_threshold')
 
 
+class MeasurementWatermarkAdmin(admin.ModelAdmin):
+    list_display = (
+        'site', 'monitor', 'time_basis', 'date_time_start', 'modified', )
+    list_filter = ('site', 'monitor', 'time_basis', )
+
+
+class BackfillCheckpointAdmin(admin.ModelAdmin):
+    list_display = (
+        'site_id', 'monitor_id', 'time_basis_id', 'from_date', 'to_date',
+        'status', 'entries_count', 'modified', )
+    list_filter = ('status', 'site_id', 'monitor_id', )
+
+
+class LiveSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('source', 'fetched_at', )
+    exclude = ('content', )
+
+
 admin.site.register(Monitor, MonitorAdmin)
 admin.site.register(EquipmentType, EquipmentTypeAdmin)
 admin.site.register(Site, SiteAdmin)
 admin.site.register(SiteList)
 admin.site.register(TimeBasis, TimeBasisAdmin)
 admin.site.register(Measurement, MeasurementAdmin)
+admin.site.register(MeasurementWatermark, MeasurementWatermarkAdmin)
+admin.site.register(BackfillCheckpoint, BackfillCheckpointAdmin)
+admin.site.register(LiveSnapshot, LiveSnapshotAdmin)
@@ -34,7 +34,23 @@ TIME_BASIS = 'time_basis'
 UNIQUE_PARAMS = 'unique_params'
 VIC_ROADS_LIVE = 'vic_roads_live'
 DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+URL_DATE_FORMAT = '%Y%m%d%H'
+UPSERT_BATCH_SIZE = 500
+BACKFILL_WORKERS = 8
+BACKFILL_PER_HOST = 4
+BACKFILL_TIMEOUT = 60
+DEFAULT_TIME_BASIS = '1HR_AV'
 WEATHERBIT_FORECAST = 'weatherbit'
+UPSTREAM_POOL_SIZE = 10
+UPSTREAM_CACHE_SIZE = 64
+# (connect, read) seconds
+UPSTREAM_TIMEOUT = (3.05, 15)
+# Seconds a request waits for the same data being fetched by another one
+UPSTREAM_WAIT_TIMEOUT = 30
+# Seconds between the polls of the live AirWatch snapshot
+LIVE_POLL_INTERVAL = 5 * 60
+# Seconds after which the stored snapshot is fetched again on request
+LIVE_SNAPSHOT_MAX_AGE = 2 * 60 * 60
 
 AU_VIC_URL_MAP = (
     (MONITOR, 'http://sciwebsvc.epa.vic.gov.au/aqapi/Monitors'),
@@ -47,6 +63,26 @@ AU_VIC_URL_MAP = (
     (WEATHERBIT_FORECAST, 'https://api.weatherbit.io/v2.0/forecast/airquality')
 )
 
+# Timeouts of each upstream of the live proxies, (connect, read) seconds
+UPSTREAM_TIMEOUTS = {
+    SITE_WITH_MEASUREMENTS: (3.05, 10),
+    MEASUREMENT: (3.05, 30),
+    FIRES: (3.05, 10),
+    VIC_ROADS_LIVE: (3.05, 10),
+    WEATHERBIT_FORECAST: (3.05, 10),
+}
+
+# Seconds the responses of each upstream are cached for, following how often
+# they are updated. The URL of the hourly AirWatch snapshot changes every
+# hour, but the snapshot of the current hour is filled in during the hour.
+UPSTREAM_TTLS = {
+    SITE_WITH_MEASUREMENTS: 10 * 60,
+    MEASUREMENT: 60 * 60,
+    FIRES: 2 * 60,
+    VIC_ROADS_LIVE: 5 * 60,
+    WEATHERBIT_FORECAST: 60 * 60,
+}
+
 COMMAND_MODEL_MAP = (
     (SITE, Site),
     (INCIDENT_SITE, IncidentSite),
@@ -184,7 +220,7 @@ MONITOR_TIME_BASIS_SERVICE_METADATA = (
 MEASUREMENT_TABLE_FIELD_MAP = (
     ('DateTimeStart', 'date_time_start'),
     ('DateTimeRecorded', 'date_time_recorded'),
-    ('Value', 'value'),
+    ('Value', 'raw_value'),
     ('QualityStatus', 'quality_status'),
     ('AQIIndex', 'aqi_index'),
     ('AQICategoryAbbreviation', 'aqi_category_threshold'),
@@ -228,6 +264,27 @@ SERVICES_METADATA = (
 )
 
 VIC_ROADS_MAPSJS_START = 'var preload_data = '
+# Bytes read at a time from maps.js while looking for the preload_data line
+VIC_ROADS_MAPSJS_CHUNK_SIZE = 64 * 1024
+# Keys of the coordinates and type of the VicRoads incidents
+VIC_ROADS_LATITUDE_KEYS = ('latitude', 'lat')
+VIC_ROADS_LONGITUDE_KEYS = ('longitude', 'long', 'lng')
+VIC_ROADS_TYPE_KEYS = ('incident_type', 'type')
+# Properties of the incidents kept in the GeoJSON features
+VIC_ROADS_GEOJSON_PROPERTIES = (
+    'id', 'title', 'description', 'closed_road_name', 'start_date',
+    'last_updated')
+# Decimals of the GeoJSON coordinates, about 1 meter
+GEOJSON_COORDINATE_DECIMALS = 5
+# Tolerance, in degrees, of the simplified VicEmergency geometries (~100 m)
+VIC_EMERGENCY_SIMPLIFY_TOLERANCE = 0.001
+# Default radius, in kilometers, of the ?near= VicEmergency queries
+VIC_EMERGENCY_NEAR_RADIUS = 10
+# Properties of the VicEmergency features matched by ?category=
+VIC_EMERGENCY_CATEGORY_KEYS = ('category1', 'category2')
+# Properties of the VicEmergency features matched by ?since=, first found
+VIC_EMERGENCY_DATE_KEYS = ('updated', 'created')
+EARTH_RADIUS_KM = 6371.0
 
 POLLUTANT_TO_MONITOR = {
     'BPM2.5': 'PM2.5',
@@ -0,0 +1,205 @@
+import json
+
+import numpy as np
+from django.contrib.gis.gdal import GDALException
+from django.contrib.gis.geos import GEOSException, GEOSGeometry
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from common.utils import round_coordinates
+from .constants import (
+    EARTH_RADIUS_KM, FIRES, GEOJSON_COORDINATE_DECIMALS,
+    VIC_EMERGENCY_CATEGORY_KEYS, VIC_EMERGENCY_DATE_KEYS,
+    VIC_EMERGENCY_SIMPLIFY_TOLERANCE)
+from .upstream import client
+
+
+def parse_timestamp(value):
+    """Returns the POSIX timestamp of a date of the VicEmergency feed (an
+    ISO 8601 string, local time if naive, or seconds or milliseconds since
+    the epoch), NaN if it cannot be parsed.
+
+    :rtype: float
+
+    """
+    if isinstance(value, (int, float)):
+        return value / 1000.0 if value > 1e11 else float(value)
+    try:
+        date = parse_datetime(value)
+    except (TypeError, ValueError):
+        date = None
+    if date is None:
+        return float('nan')
+    if timezone.is_naive(date):
+        date = timezone.make_aware(date, is_dst=False)
+    return date.timestamp()
+
+
+def _positions(geometry):
+    """Yields the [lng, lat] positions of a GeoJSON geometry."""
+    if geometry.get('type') == 'GeometryCollection':
+        for g in geometry.get('geometries', []):
+            yield from _positions(g)
+        return
+    stack = [geometry.get('coordinates', [])]
+    while stack:
+        coordinates = stack.pop()
+        if coordinates and isinstance(coordinates[0], (list, tuple)):
+            stack.extend(coordinates)
+        elif len(coordinates) >= 2:
+            yield coordinates
+
+
+def _round_geometry(geometry):
+    if geometry.get('type') == 'GeometryCollection':
+        return dict(geometry, geometries=[
+            _round_geometry(g) for g in geometry.get('geometries', [])])
+    return dict(geometry, coordinates=round_coordinates(
+        geometry.get('coordinates', []), GEOJSON_COORDINATE_DECIMALS))
+
+
+def simplify_geometry(geometry, tolerance=VIC_EMERGENCY_SIMPLIFY_TOLERANCE):
+    """Simplifies a GeoJSON geometry, preserving its topology, and rounds its
+    coordinates. The geometries that cannot be simplified are only rounded.
+
+    :param geometry: the GeoJSON geometry.
+    :type geometry: dict
+    :param tolerance: the tolerance of the simplification, in degrees.
+    :type tolerance: float
+    :rtype: dict
+
+    """
+    if geometry.get('type') not in ('Point', 'MultiPoint'):
+        try:
+            geometry = json.loads(GEOSGeometry(json.dumps(geometry)).simplify(
+                tolerance, preserve_topology=True).json)
+        except (GDALException, GEOSException, ValueError):
+            pass
+    return _round_geometry(geometry)
+
+
+class FeatureIndex(object):
+    """
+    The features of the VicEmergency feed, parsed once per refresh: their
+    geometries are simplified and their bounding boxes, dates and categories
+    are kept in arrays, sorted by their minimum longitude, so the bbox, near,
+    category and date queries only scan the candidate features.
+
+        >>> index = FeatureIndex(collection)
+        >>> index.query(bbox=(144.5, -38.2, 145.5, -37.5), categories={'fire'})
+
+    """
+
+    def __init__(self, collection):
+        """
+        :param collection: the GeoJSON feature collection of the feed.
+        :type collection: dict
+        """
+        self.collection = collection
+        features, bounds, dates, categories = [], [], [], []
+        for feature in collection.get('features', []):
+            geometry = feature.get('geometry') or {}
+            positions = np.array(list(_positions(geometry)), dtype=float)
+            if positions.ndim != 2 or not len(positions):
+                # Without a location it cannot be queried
+                continue
+            properties = feature.get('properties') or {}
+            features.append(dict(
+                feature, geometry=simplify_geometry(geometry)))
+            bounds.append(np.concatenate((
+                positions[:, :2].min(axis=0), positions[:, :2].max(axis=0))))
+            dates.append(next((
+                parse_timestamp(properties[k])
+                for k in VIC_EMERGENCY_DATE_KEYS
+                if properties.get(k) is not None), float('nan')))
+            categories.append(set(
+                str(properties[k]).lower()
+                for k in VIC_EMERGENCY_CATEGORY_KEYS if properties.get(k)))
+
+        order = np.argsort(
+            [b[0] for b in bounds], kind='mergesort').astype(np.int64)
+        self.features = [features[i] for i in order]
+        self.categories = [categories[i] for i in order]
+        self.bounds = np.array(bounds, dtype=float).reshape(-1, 4)[order]
+        self.dates = np.array(dates, dtype=float)[order]
+
+    def __len__(self):
+        return len(self.features)
+
+    def query(
+            self, bbox=None, near=None, radius=None, categories=None,
+            since=None):
+        """Returns the features matching all the given filters.
+
+        :param bbox: min_lng, min_lat, max_lng, max_lat the features
+            intersect.
+        :type bbox: tuple(float, float, float, float)
+        :param near: (lat, lng) the features are within *radius* of.
+        :type near: tuple(float, float)
+        :param radius: the distance to *near*, in kilometers, measured to
+            the bounding box of each feature.
+        :type radius: float
+        :param categories: the categories to keep (any of
+            VIC_EMERGENCY_CATEGORY_KEYS, case insensitive).
+        :type categories: set
+        :param since: POSIX timestamp the features were updated after.
+        :type since: float
+        :rtype: dict[]
+
+        """
+        min_lng, min_lat, max_lng, max_lat = self.bounds.T
+        # The features whose bounding box starts after the query are skipped
+        end = len(self.features)
+        if near is not None:
+            lat, lng = near
+            # Degrees of longitude shrink with the latitude
+            d_lat = np.degrees(radius / EARTH_RADIUS_KM)
+            d_lng = d_lat / max(np.cos(np.radians(lat)), 1e-6)
+            near_bbox = (lng - d_lng, lat - d_lat, lng + d_lng, lat + d_lat)
+            bbox = near_bbox if bbox is None else (
+                max(bbox[0], near_bbox[0]), max(bbox[1], near_bbox[1]),
+                min(bbox[2], near_bbox[2]), min(bbox[3], near_bbox[3]))
+        if bbox is not None:
+            end = np.searchsorted(min_lng, bbox[2], side='right')
+        candidates = np.arange(end)
+
+        keep = np.ones(end, dtype=bool)
+        if bbox is not None:
+            keep &= (max_lng[:end] >= bbox[0]) & \
+                (min_lat[:end] <= bbox[3]) & (max_lat[:end] >= bbox[1])
+        if near is not None:
+            # Haversine distance to the closest point of each bounding box
+            c_lng = np.radians(np.clip(lng, min_lng[:end], max_lng[:end]))
+            c_lat = np.radians(np.clip(lat, min_lat[:end], max_lat[:end]))
+            a = np.sin((c_lat - np.radians(lat)) / 2) ** 2 + \
+                np.cos(np.radians(lat)) * np.cos(c_lat) * \
+                np.sin((c_lng - np.radians(lng)) / 2) ** 2
+            keep &= 2 * EARTH_RADIUS_KM * np.arcsin(
+                np.sqrt(np.minimum(a, 1))) <= radius
+        if since is not None:
+            keep &= self.dates[:end] >= since
+
+        candidates = candidates[keep]
+        if categories:
+            categories = set(c.lower() for c in categories)
+            candidates = [
+                i for i in candidates if self.categories[i] & categories]
+        return [self.features[i] for i in candidates]
+
+
+def feed_index(r):
+    """Parses the VicEmergency feed response into a FeatureIndex."""
+    return FeatureIndex(r.json())
+
+
+def fetch_feed_index(params=None):
+    """Returns the index of the live VicEmergency feed, built once per
+    refresh of the feed (the TTL of VicEmergency).
+
+    Raises:
+        au_epa_data.upstream.UpstreamUnavailable: if VicEmergency failed.
+
+    """
+    headers = {'content-type': 'application/json'}
+    return client.fetch(
+        FIRES, params=params, headers=headers, parse=feed_index)
@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from .constants import AU_VIC_URL_MAP, SITE_WITH_MEASUREMENTS
+from .models import LiveSnapshot, Site
+from .serializers import MonitorSerializer
+from .upstream import client
+
+
+def site_monitors(site_ids, request=None):
+    """Returns the serialized monitors of each of the given sites, loading
+    the sites, their monitors and their equipment types and time basis in a
+    constant number of queries. Monitors shared by several sites are
+    serialized once.
+
+    :param site_ids: the ids of the sites.
+    :type site_ids: int[]
+    :param request: the request to build the monitor URLs for, relative URLs
+        without it.
+    :type request: rest_framework.request.Request
+    :rtype: dict
+
+    """
+    local_sites = Site.objects.prefetch_related(
+        'monitors__equipment_type',
+        'monitors__monitor_time_basis__time_basis'
+    ).in_bulk(site_ids)
+    monitors = {}
+    site_monitors = {}
+    for site_id, local_site in local_sites.items():
+        site_monitors[site_id] = []
+        for monitor in local_site.monitors.all():
+            if monitor.pk not in monitors:
+                monitors[monitor.pk] = MonitorSerializer(
+                    monitor, context={'request': request}).data
+            site_monitors[site_id].append(monitors[monitor.pk])
+    return site_monitors
+
+
+def normalize_sites(response, request=None):
+    """Turns the AirWatch hourly snapshot of the sites into the
+    representation of the /sites-proxy endpoint, with the monitors of each
+    site stored locally.
+
+    :param response: the decoded SitesHourlyAirQuality response.
+    :type response: dict
+    :param request: the request to build the monitor URLs for.
+    :type request: rest_framework.request.Request
+    :rtype: dict
+
+    """
+    response = response['IncidentSites'] + response['NonIncidentSites']
+    monitors = site_monitors([s['SiteId'] for s in response], request)
+    sites = []
+    for s in response:
+        live_measurements = [{
+            "aqi_value": m["AQIValue"],
+            "name": m["ShortName"],
+            "value": m["Value"],
+            "time_basis": m["TimeBasisID"],
+            "description": m["Description"].capitalize() if m[
+                "Description"] else m["Abbreviation"]
+        } for m in s.get("Measurements", []) if m["ShortName"] is not None]
+        sites.append({
+            "site_id": s['SiteId'],
+            "name": s['Name'],
+            "latitude": s['Latitude'],
+            "longitude": s['Longitude'],
+            "fire_hazard_category": s.get('FireHazardCategory'),
+            "is_station_offline": s.get('IsStationOffline', False),
+            "has_incident": s.get('HasIncident', False),
+            "incident_type": s.get('SiteType', 'Non-incident'),
+            "incidents": [
+                {}
+            ],
+            "site_list": [
+                {
+                    "name": s["Region"]
+                }
+            ],
+            "current_status": live_measurements,
+            "monitors": monitors.get(s['SiteId'], [])
+        })
+    return {'count': len(sites), 'results': sites}
+
+
+def fetch_sites(params=None, request=None, refresh=False):
+    """Fetches the AirWatch snapshot of the sites of the current hour.
+
+    :param params: query parameters of the upstream request.
+    :type params: dict
+    :param request: the request to build the monitor URLs for, relative URLs
+        without it (see absolute_urls).
+    :type request: rest_framework.request.Request
+    :param refresh: if to fetch it again even if it is cached.
+    :type refresh: boolean
+    :rtype: dict
+
+    Raises:
+        au_epa_data.upstream.UpstreamUnavailable: if AirWatch failed.
+
+    """
+    now = timezone.localtime().strftime('%Y%m%d%H')
+    url = OrderedDict(AU_VIC_URL_MAP)[SITE_WITH_MEASUREMENTS].format(now)
+    headers = {'content-type': 'application/json'}
+    response = client.fetch(
+        SITE_WITH_MEASUREMENTS, url=url, params=params, headers=headers,
+        refresh=refresh)
+    return normalize_sites(response, request)
+
+
+def absolute_urls(data, request):
+    """Makes the relative monitor URLs of the sites built without a request,
+    e.g. the stored snapshot, absolute URLs for the request, as the ones of
+    the sites fetched with it.
+
+    :param data: the sites, see normalize_sites.
+    :type data: dict
+    :param request: the request to build the URLs for.
+    :type request: rest_framework.request.Request
+    :rtype: dict
+
+    """
+    for site in data['results']:
+        for monitor in site['monitors']:
+            if monitor.get('url'):
+                monitor['url'] = request.build_absolute_uri(monitor['url'])
+    return data
+
+
+def store_snapshot(source, data):
+    """Stores the serialized data of a source as its last known good
+    snapshot.
+
+    :rtype: au_epa_data.models.LiveSnapshot
+
+    """
+    snapshot, created = LiveSnapshot.objects.update_or_create(
+        source=source, defaults={
+            'content': JSONRenderer().render(data).decode('utf-8'),
+            'fetched_at': timezone.now()
+        })
+    return snapshot
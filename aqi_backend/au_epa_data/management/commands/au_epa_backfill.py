@@ -0,0 +1,262 @@
+import logging
+import time
+import threading
+import urllib
+import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from django.core.management.base import BaseCommand
+from requests.adapters import HTTPAdapter
+
+from au_epa_data.constants import (
+    AU_VIC_URL_MAP,
+    BACKFILL_PER_HOST,
+    BACKFILL_TIMEOUT,
+    BACKFILL_WORKERS,
+    DEFAULT_TIME_BASIS,
+    MEASUREMENT,
+    UPSERT_BATCH_SIZE,
+)
+from au_epa_data.models import BackfillCheckpoint
+from au_epa_data.management.commands.au_epa_update import (
+    Command as UpdateCommand)
+from forecasting.constants import SITES_MONITORS, TIME_BASIS, DATES
+
+logger = logging.getLogger('myaqi.commands')
+
+
+def construct_url_args(site_id, monitor_id, timebasis_id, from_date, to_date):
+    url_args = {
+        "siteId": site_id,
+        "monitorId": monitor_id,
+        "fromDate": from_date,
+        "timebasisid": timebasis_id,
+        "toDate": to_date
+    }
+
+    return url_args
+
+
+class Command(BaseCommand):
+    help = (
+        'Backfill the measurements of many sites, monitors and dates '
+        'concurrently, resuming from the last run.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--level', '-l',
+            help='Level of logging'
+        )
+        parser.add_argument(
+            '--url', '-u',
+            action="store",
+            type=str,
+            default="",
+            help='The url of the measurements web service.'
+        )
+        parser.add_argument(
+            '--sites',
+            action='store',
+            nargs='+',
+            default=None,
+            help='Ids of the sites to backfill, all SITES_MONITORS if none.'
+        )
+        parser.add_argument(
+            '--workers', '-w',
+            action='store',
+            type=int,
+            default=BACKFILL_WORKERS,
+            help='Number of concurrent requests.'
+        )
+        parser.add_argument(
+            '--per_host',
+            action='store',
+            type=int,
+            default=BACKFILL_PER_HOST,
+            help='Maximum number of concurrent requests to the same host.'
+        )
+        parser.add_argument(
+            '--timeout',
+            action='store',
+            type=float,
+            default=BACKFILL_TIMEOUT,
+            help='Seconds to wait for each response.'
+        )
+        parser.add_argument(
+            '--batch_size',
+            action='store',
+            type=int,
+            default=UPSERT_BATCH_SIZE,
+            help='Number of entries written per bulk upsert statement.'
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            default=False,
+            help='Ignore the stored progress and fetch every window again.'
+        )
+
+    def handle(self, *args, **options):
+        # Setting logging
+        level = options.get('level')
+        if level:
+            try:
+                logger.setLevel(getattr(logging, level.upper()))
+            except AttributeError:
+                pass
+
+        start_time = time.time()
+        url = options.get('url') or OrderedDict(AU_VIC_URL_MAP)[MEASUREMENT]
+        workers = options.get('workers')
+        self.timeout = options.get('timeout')
+        self.batch_size = options.get('batch_size')
+
+        checkpoints = self.pending_checkpoints(
+            options.get('sites'), options.get('restart'))
+        logger.info('Backfilling {0} measurement windows from {1}.'.format(
+            len(checkpoints), url))
+
+        # One keep-alive connection pool shared by all the workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.host_limits = {
+            urllib.parse.urlparse(url).netloc: threading.BoundedSemaphore(
+                options.get('per_host'))
+        }
+        self.updater = UpdateCommand()
+
+        done = failed = 0
+        checkpoints = iter(checkpoints)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Keep a bounded number of requests in flight, and write each
+                # response while the next ones are being fetched.
+                in_flight = set()
+                for checkpoint in checkpoints:
+                    in_flight.add(executor.submit(self.fetch, url, checkpoint))
+                    if len(in_flight) >= workers * 2:
+                        break
+                while in_flight:
+                    finished, in_flight = wait(
+                        in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        if self.write(*future.result()):
+                            done += 1
+                        else:
+                            failed += 1
+                        checkpoint = next(checkpoints, None)
+                        if checkpoint is not None:
+                            in_flight.add(
+                                executor.submit(self.fetch, url, checkpoint))
+                    logger.info('{0} windows done, {1} failed.'.format(
+                        done, failed))
+        finally:
+            # Once per run, even if it was interrupted
+            self.updater.invalidate_experimental_data()
+            self.session.close()
+
+        logger.info(
+            "Done! Backfill was executed successfully (%d windows, %d failed)."
+            " It took %.4f minutes." % (
+                done, failed, (time.time() - start_time) / 60.0))
+
+    def pending_checkpoints(self, sites=None, restart=False):
+        """ Creates the missing checkpoints of every site, monitor, time basis
+        and date window to backfill, and returns the ones not yet done.
+
+        :param sites: ids of the sites to backfill, all if None.
+        :type sites: string[]
+        :param restart: if to return the checkpoints already done as well.
+        :type restart: boolean
+        :rtype: BackfillCheckpoint[]
+
+        """
+        windows = []
+        for site, monitors in SITES_MONITORS.items():
+            if sites is not None and site not in sites:
+                continue
+            for monitor in monitors:
+                for tb in TIME_BASIS[monitor]:
+                    for date in DATES:
+                        windows.append((
+                            int(site), monitor,
+                            DEFAULT_TIME_BASIS if tb is None else tb,
+                            date[0], date[1]))
+
+        fields = (
+            'site_id', 'monitor_id', 'time_basis_id', 'from_date', 'to_date')
+        existing = {
+            tuple(c[f] for f in fields): c for c in
+            BackfillCheckpoint.objects.filter(
+                site_id__in={w[0] for w in windows}).values('id', *fields)
+        }
+        BackfillCheckpoint.objects.bulk_create([
+            BackfillCheckpoint(**dict(zip(fields, w)))
+            for w in windows if w not in existing
+        ])
+
+        checkpoints = BackfillCheckpoint.objects.filter(
+            site_id__in={w[0] for w in windows}).order_by(
+                'site_id', 'monitor_id', 'time_basis_id', 'from_date')
+        if not restart:
+            checkpoints = checkpoints.exclude(status=BackfillCheckpoint.DONE)
+        windows = set(windows)
+        return [
+            c for c in checkpoints
+            if tuple(getattr(c, f) for f in fields) in windows
+        ]
+
+    def fetch(self, url, checkpoint):
+        """ Requests the measurements of a checkpoint window. Runs on the
+        worker threads, so it must not touch the database.
+
+        :rtype: tuple(BackfillCheckpoint, dict, string)
+
+        Returns:
+            (checkpoint, root, error): the decoded response or the error
+            message if the request failed.
+
+        """
+        url_args = construct_url_args(
+            checkpoint.site_id, checkpoint.monitor_id,
+            checkpoint.time_basis_id, checkpoint.from_date,
+            checkpoint.to_date)
+        host_limit = self.host_limits[urllib.parse.urlparse(url).netloc]
+        try:
+            with host_limit:
+                r = self.session.get(
+                    url, params=url_args, timeout=self.timeout,
+                    headers={'content-type': 'application/json'})
+            if r.status_code >= 300:
+                return checkpoint, None, 'HTTP {0}'.format(r.status_code)
+            return checkpoint, r.json(), None
+        except (requests.RequestException, ValueError) as e:
+            return checkpoint, None, str(e)
+
+    def write(self, checkpoint, root, error):
+        """ Writes the fetched measurements and records the progress of the
+        checkpoint.
+
+        :rtype: boolean
+
+        """
+        if error is None:
+            try:
+                checkpoint.entries_count = self.updater.import_entries(
+                    MEASUREMENT, root, batch_size=self.batch_size)
+            except Exception as e:
+                logger.exception(e)
+                error = str(e)
+
+        if error is not None:
+            logger.error('Error while backfilling {0}: {1}'.format(
+                checkpoint, error))
+            checkpoint.status = BackfillCheckpoint.FAILED
+        else:
+            checkpoint.status = BackfillCheckpoint.DONE
+        checkpoint.error = error
+        checkpoint.save(update_fields=(
+            'status', 'entries_count', 'error', 'modified'))
+        return error is None
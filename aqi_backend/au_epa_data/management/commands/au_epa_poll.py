@@ -0,0 +1,84 @@
+import time
+import logging
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from au_epa_data.constants import LIVE_POLL_INTERVAL, SITE_WITH_MEASUREMENTS
+from au_epa_data.live import fetch_sites, store_snapshot
+from au_epa_data.upstream import UpstreamUnavailable
+
+logger = logging.getLogger('myaqi.commands')
+
+
+class Command(BaseCommand):
+    help = ('Poll the AirWatch hourly snapshot of the sites and store it for'
+            ' the /sites-proxy endpoint, keeping the last good one when'
+            ' AirWatch fails.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--level', '-l',
+            help='Level of logging'
+        )
+        parser.add_argument(
+            '--interval', '-i',
+            action='store',
+            type=int,
+            default=LIVE_POLL_INTERVAL,
+            help='Seconds between polls.'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            default=False,
+            help='Poll once and exit, e.g. to run it from cron.'
+        )
+
+    def handle(self, *args, **options):
+        # Setting logging
+        level = options.get('level')
+        if level:
+            try:
+                logger.setLevel(getattr(logging, level.upper()))
+            except AttributeError:
+                pass
+
+        interval = options.get('interval')
+        while True:
+            start_time = time.time()
+            try:
+                self.poll()
+            except Exception:
+                # e.g., a malformed response or a database error, the next
+                # poll may succeed
+                logger.exception('Polling the sites snapshot failed.')
+            if options.get('once'):
+                break
+            time.sleep(max(0, interval - (time.time() - start_time)))
+
+    def poll(self):
+        """ Fetches the snapshot of the sites and stores it, unless AirWatch
+        failed or returned no sites.
+
+        :rtype: boolean
+        """
+        # The connections of a long running command may have expired
+        close_old_connections()
+        try:
+            # Without a request the monitor URLs are relative, SitesProxy
+            # makes them absolute when serving the snapshot
+            data = fetch_sites(refresh=True)
+        except (UpstreamUnavailable, KeyError) as e:
+            logger.warning(
+                'Keeping the last sites snapshot, AirWatch failed: {0}'.format(
+                    e))
+            return False
+        if not data['count']:
+            logger.warning(
+                'Keeping the last sites snapshot, AirWatch returned no sites.')
+            return False
+
+        snapshot = store_snapshot(SITE_WITH_MEASUREMENTS, data)
+        logger.info('Stored the snapshot of {0} sites fetched at {1}.'.format(
+            data['count'], snapshot.fetched_at))
+        return True
@@ -8,6 +8,7 @@ import requests
 import xml.etree.ElementTree as ET
 from collections import OrderedDict
 from django.core.management.base import BaseCommand, CommandError
+from django.db import router, transaction
 from django.utils import timezone
 
 from au_epa_data.constants import (
@@ -26,8 +27,13 @@ from au_epa_data.constants import (
     SERVICES_METADATA,
     TABLE_STRUCTURE,
     UNIQUE_PARAMS,
+    UPSERT_BATCH_SIZE,
+    URL_DATE_FORMAT,
 )
+from au_epa_data.models import Measurement, MeasurementWatermark
+from au_epa_data.upsert import bulk_get_or_create, bulk_upsert, chunked
 from common.models import AQICategoryThreshold
+from forecasting.cache import invalidate_experimental_data
 
 logger = logging.getLogger('myaqi.commands')
 
@@ -35,6 +41,11 @@ logger = logging.getLogger('myaqi.commands')
 class Command(BaseCommand):
     help = 'Import a set of measurements to the database tables'
 
+    def __init__(self, *args, **kwargs):
+        super(Command, self).__init__(*args, **kwargs)
+        # Measurements written since the experiments data was invalidated
+        self.measurements_written = 0
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--level', '-l',
@@ -67,6 +78,27 @@ class Command(BaseCommand):
             default=None,
             help='Extra parameter to use on the url endpoint in JSON format.'
         )
+        parser.add_argument(
+            '--batch_size',
+            action='store',
+            type=int,
+            default=UPSERT_BATCH_SIZE,
+            help='Number of entries written per bulk upsert statement.'
+        )
+        parser.add_argument(
+            '--row_by_row',
+            action='store_true',
+            default=False,
+            help='Write each entry with its own update_or_create call.'
+        )
+        parser.add_argument(
+            '--incremental', '-i',
+            action='store_true',
+            default=False,
+            help=(
+                'Only fetch the measurements newer than the last imported '
+                'ones and skip the entries that did not change.')
+        )
 
     def handle(self, *args, **options):
         # Setting logging
@@ -78,21 +110,23 @@ class Command(BaseCommand):
                 pass
 
         model_type = options.get('type')
-        # Get AQI THRESHOLDS
-        if model_type == MEASUREMENT:
-            aqi_thresholds = OrderedDict(AQICategoryThreshold.objects.filter(
-                aqi_organization='AUEPA').values_list('abbreviation', 'id'))
-
         model_dict = OrderedDict(COMMAND_MODEL_MAP)
         try:
             model = model_dict[model_type]
         except KeyError:
-            logger.error('Invalid model type: %e' % model_type)
+            logger.error('Invalid model type: %s' % model_type)
             raise
 
         start_time = time.time()
         url = options.get('url')
         url_args = options.get('url_args')
+        incremental = options.get('incremental')
+        if incremental:
+            if model_type != MEASUREMENT:
+                raise CommandError(
+                    'Incremental updates are only supported for %ss.' %
+                    MEASUREMENT)
+            url_args = self.incremental_url_args(url_args)
         if not url:
             url = OrderedDict(AU_VIC_URL_MAP)[model_type]
         if url_args is not None:
@@ -111,101 +145,402 @@ class Command(BaseCommand):
                     url, (time.time() - start_time) / 60.0))
             return False
 
-        metadata = OrderedDict(SERVICES_METADATA)
-        model_metadata = OrderedDict(metadata[model_type])
-        model_table = OrderedDict(model_metadata[TABLE_STRUCTURE])
-        model_rel_table = OrderedDict(
-            model_metadata[RELATIONAL_TABLE_STRUCTURE])
-        root = r.json()
+        self.import_entries(
+            model_type, r.json(), bulk=not options.get('row_by_row'),
+            batch_size=options.get('batch_size'), only_changed=incremental)
+        self.invalidate_experimental_data()
+
+        logger.info(
+            "Done! Command was executed successfully."
+            " It took %.4f minutes." % ((time.time() - start_time) / 60.0))
+
+    def incremental_url_args(self, url_args):
+        """ Moves the fromDate of the measurements request to the watermark
+        of its site, monitor and time basis, and the toDate to the next hour
+        if it is not given.
+
+        :param url_args: the measurements request parameters, must include
+            siteId, monitorId and timebasisid.
+        :type url_args: dict
+        :rtype: dict
+
+        """
+        url_args = dict(url_args or {})
+        try:
+            key = (
+                url_args['siteId'], url_args['monitorId'],
+                url_args['timebasisid'])
+        except KeyError:
+            raise CommandError(
+                'Incremental updates need the siteId, monitorId and '
+                'timebasisid url_args.')
+
+        watermark = MeasurementWatermark.get_watermark(*key)
+        if watermark is not None:
+            # The last hour is fetched again, as it may have been revised
+            url_args['fromDate'] = timezone.localtime(watermark).strftime(
+                URL_DATE_FORMAT)
+        elif 'fromDate' not in url_args:
+            raise CommandError(
+                'No measurements imported yet for %s, a fromDate url_arg is '
+                'needed.' % (key, ))
+        if 'toDate' not in url_args:
+            url_args['toDate'] = (
+                timezone.localtime() + datetime.timedelta(hours=1)).strftime(
+                    URL_DATE_FORMAT)
+        logger.info('Fetching measurements of {0} since {1}.'.format(
+            key, url_args['fromDate']))
+        return url_args
+
+    def import_entries(
+            self, model_type, root, bulk=True, batch_size=UPSERT_BATCH_SIZE,
+            only_changed=False):
+        """ Writes the entries of an AirWatch API response to the database.
+
+        :param model_type: one of the COMMAND_MODEL_MAP keys.
+        :type model_type: string
+        :param root: the decoded JSON response of the API.
+        :type root: dict
+        :param bulk: if to write the entries in chunks with bulk upserts
+            instead of one update_or_create per entry.
+        :type bulk: boolean
+        :param batch_size: number of entries per chunk in bulk mode.
+        :type batch_size: int
+        :param only_changed: if to skip the measurements already stored with
+            the same date_time_recorded.
+        :type only_changed: boolean
+        :rtype: int
+
+        Returns:
+            count (int): the number of entries processed.
+
+        """
+        self.model_type = model_type
+        self.model_dict = OrderedDict(COMMAND_MODEL_MAP)
+        self.model = self.model_dict[model_type]
+        self.metadata = OrderedDict(SERVICES_METADATA)
+        self.model_metadata = OrderedDict(self.metadata[model_type])
+        self.model_table = OrderedDict(self.model_metadata[TABLE_STRUCTURE])
+        self.model_rel_table = OrderedDict(
+            self.model_metadata[RELATIONAL_TABLE_STRUCTURE])
+        # Get AQI THRESHOLDS
+        if model_type == MEASUREMENT:
+            self.aqi_thresholds = OrderedDict(
+                AQICategoryThreshold.objects.filter(
+                    aqi_organization='AUEPA').values_list(
+                        'abbreviation', 'id'))
 
         logger.info('Fetched {0} {1}s!'.format(
-            root[model_metadata[ENTRIES_COUNT]], model_type))
-        for i, entry in enumerate(root[model_metadata[ENTRIES]]):
-            logger.debug('{0} #{1}: {2}'.format(model_type, i, entry))
-            unique_fields = {}
-            default_fields = {}
-            for k, attr in model_table.items():
-                if k in model_metadata[UNIQUE_PARAMS]:
-                    if (model_type == MEASUREMENT and
-                            attr == 'date_time_start'):
-                        unique_fields[attr] = timezone.make_aware(
+            root[self.model_metadata[ENTRIES_COUNT]], model_type))
+        entries = root[self.model_metadata[ENTRIES]]
+        count = len(entries)
+        if model_type == MEASUREMENT:
+            keys = [self.measurement_key(entry) for entry in entries]
+            watermarks = {}
+            for key, date_time_recorded in keys:
+                if None in key:
+                    continue
+                date_time_start, key = key[0], key[1:]
+                watermarks[key] = max(
+                    date_time_start, watermarks.get(key, date_time_start))
+            if only_changed:
+                entries = self.changed_entries(entries, keys)
+                logger.info('{0} of {1} measurements changed.'.format(
+                    len(entries), count))
+
+        if bulk:
+            for chunk in chunked(entries, batch_size):
+                self.bulk_update_entries(chunk)
+        else:
+            for i, entry in enumerate(entries):
+                logger.debug('{0} #{1}: {2}'.format(model_type, i, entry))
+                self.update_entry(entry)
+
+        if model_type == MEASUREMENT:
+            MeasurementWatermark.advance(watermarks)
+            self.measurements_written += len(entries)
+        return count
+
+    def invalidate_experimental_data(self):
+        """ Drops the cached experiments data if measurements were written
+        since the last call. Called once at the end of a run rather than
+        after each import_entries.
+
+        :rtype: boolean
+        """
+        if not self.measurements_written:
+            return False
+        logger.info(
+            'Invalidating the experiments data, {0} measurements '
+            'written.'.format(self.measurements_written))
+        invalidate_experimental_data()
+        self.measurements_written = 0
+        return True
+
+    def measurement_key(self, entry):
+        """ Returns the unique key and the recording date of a measurement
+        entry.
+
+        :param entry: one of the measurements of the API response.
+        :type entry: dict
+        :rtype: tuple(tuple, datetime.datetime)
+
+        Returns:
+            ((date_time_start, site_id, monitor_id, time_basis_id),
+            date_time_recorded)
+
+        """
+        dates = [
+            None if entry[k] is None else timezone.make_aware(
+                datetime.datetime.strptime(entry[k], DATETIME_FORMAT),
+                is_dst=False)
+            for k in ('DateTimeStart', 'DateTimeRecorded')
+        ]
+        return (
+            (dates[0], entry['SiteId'], entry['MonitorId'],
+             entry['TimeBaseId']),
+            dates[1])
+
+    def changed_entries(self, entries, keys):
+        """ Filters out the measurement entries already stored with the same
+        date_time_recorded, with one query.
+
+        :param entries: the measurements of the API response.
+        :type entries: dict[]
+        :param keys: the measurement_key of each entry.
+        :type keys: tuple[]
+        :rtype: dict[]
+
+        """
+        dates = [key[0] for key, recorded in keys if key[0] is not None]
+        if not dates:
+            return entries
+        stored = {
+            (date_time_start, site_id, monitor_id, time_basis_id):
+                date_time_recorded
+            for date_time_start, site_id, monitor_id, time_basis_id,
+                date_time_recorded in Measurement.objects.filter(
+                    site_id__in={key[1] for key, recorded in keys},
+                    monitor_id__in={key[2] for key, recorded in keys},
+                    time_basis_id__in={key[3] for key, recorded in keys},
+                    date_time_start__range=(min(dates), max(dates))
+                ).values_list(
+                    'date_time_start', 'site_id', 'monitor_id',
+                    'time_basis_id', 'date_time_recorded').iterator()
+        }
+        return [
+            entry for entry, (key, recorded) in zip(entries, keys)
+            if key not in stored or stored[key] != recorded
+        ]
+
+    def entry_fields(self, entry):
+        """ Maps an API entry to the model's unique and default fields.
+
+        :param entry: one of the entries of the API response.
+        :type entry: dict
+        :rtype: tuple(dict, dict)
+
+        """
+        unique_fields = {}
+        default_fields = {}
+        for k, attr in self.model_table.items():
+            if k in self.model_metadata[UNIQUE_PARAMS]:
+                if (self.model_type == MEASUREMENT and
+                        attr == 'date_time_start'):
+                    unique_fields[attr] = timezone.make_aware(
+                        datetime.datetime.strptime(
+                            entry[k], DATETIME_FORMAT), is_dst=False)
+                else:
+                    unique_fields[attr] = entry[k]
+            else:
+                if self.model_type == MEASUREMENT:
+                    if attr == 'aqi_category_threshold':
+                        default_fields[attr] = (
+                            None if entry[k] is None else
+                            self.aqi_thresholds[entry[k]])
+                    elif attr == 'raw_value':
+                        default_fields[attr] = entry[k]
+                        default_fields['value'], \
+                            default_fields['invalid_value'] = \
+                            Measurement.parse_value(entry[k])
+                    elif attr == 'date_time_recorded':
+                        default_fields[attr] = timezone.make_aware(
                             datetime.datetime.strptime(
                                 entry[k], DATETIME_FORMAT), is_dst=False)
-                    else:
-                        unique_fields[attr] = entry[k]
-                else:
-                    if model_type == MEASUREMENT:
-                        if attr == 'aqi_category_threshold':
-                            default_fields[attr] = (
-                                None if entry[k] is None else
-                                aqi_thresholds[entry[k]])
-                        elif attr == 'date_time_recorded':
-                            default_fields[attr] = timezone.make_aware(
-                                datetime.datetime.strptime(
-                                    entry[k], DATETIME_FORMAT), is_dst=False)
-                        else:
-                            default_fields[attr] = entry[k]
                     else:
                         default_fields[attr] = entry[k]
+                else:
+                    default_fields[attr] = entry[k]
 
-            logger.debug('unique_fields: {0}\ndefault_fields: {1}'.format(
-                unique_fields, default_fields))
+        logger.debug('unique_fields: {0}\ndefault_fields: {1}'.format(
+            unique_fields, default_fields))
+        return unique_fields, default_fields
 
-            obj, created = model.objects.update_or_create(
-                **unique_fields, defaults=default_fields)
+    def rel_entries(self, entry, f):
+        """ Returns the related metadata and the list of related entries
+        nested in the attribute *f* of an API entry.
 
-            if model_rel_table is not None:
-                obj_needs_update = False
-                for f, rel_type in model_rel_table.items():
-                    logger.debug('rel_type: {0}'.format(rel_type))
-                    entry_attributes = entry[f]
-                    if entry_attributes is None:
-                        continue
+        :param entry: one of the entries of the API response.
+        :type entry: dict
+        :param f: the name of the relational attribute in the entry.
+        :type f: string
+        :rtype: tuple(OrderedDict, list)
 
-                    rel_metadata = OrderedDict(metadata[rel_type])
-                    if rel_metadata[TABLE_STRUCTURE] is not None:
-                        rel_table = OrderedDict(rel_metadata[TABLE_STRUCTURE])
-                        rel_model = model_dict[rel_type]
-                    else:
-                        rel_table = None
-                    rel_func = rel_metadata[REL_FIELD_TYPE]
-                    rel_entry_list = []
+        """
+        rel_metadata = OrderedDict(self.metadata[self.model_rel_table[f]])
+        entry_attributes = entry[f]
+        if entry_attributes is None:
+            return rel_metadata, []
+        if type(entry_attributes) == dict:
+            entry_attributes = [entry_attributes]
+        if rel_metadata[TABLE_STRUCTURE] is None:
+            if type(entry_attributes) != list:
+                entry_attributes = [entry_attributes]
+            return rel_metadata, entry_attributes
 
-                    if type(entry[f]) == dict:
-                        entry_attributes = [entry_attributes]
+        rel_table = OrderedDict(rel_metadata[TABLE_STRUCTURE])
+        return rel_metadata, [
+            {attr: rel_entry[k] for k, attr in rel_table.items()}
+            for rel_entry in entry_attributes
+        ]
 
-                    if rel_func == MANY_2_MANY and rel_table is None:
-                        rel_entry_list = [entry_attributes]
-                    else:
-                        for rel_entry in entry_attributes:
-                            fields = {
-                                attr: rel_entry[k]
-                                for k, attr in rel_table.items()
-                            }
-
-                            if rel_func == FOREIGN_KEY:
-                                fields[rel_metadata[REL_FIELD_NAME]] = obj
-                            logger.debug('rel_fields: {0}'.format(fields))
-                            rel_obj, rel_created = \
-                                rel_model.objects.get_or_create(**fields)
-
-                            if rel_func == FOREIGN_KEY_SELF:
-                                setattr(
-                                    obj,
-                                    rel_metadata[REL_FIELD_NAME],
-                                    rel_obj
-                                )
-                                obj_needs_update = True
-
-                            if rel_func == MANY_2_MANY:
-                                rel_entry_list.append(rel_obj)
-
-                    if rel_func == MANY_2_MANY and len(rel_entry_list) > 0:
-                        obj.update_m2m_field(rel_type, rel_entry_list)
-
-                if obj_needs_update:
-                    obj.save()
+    def update_entry(self, entry):
+        """ Writes one API entry and its relations to the database, one query
+        at a time.
 
-        logger.info(
-            "Done! Command was executed successfully."
-            " It took %.4f minutes." % ((time.time() - start_time) / 60.0))
+        :param entry: one of the entries of the API response.
+        :type entry: dict
+
+        """
+        unique_fields, default_fields = self.entry_fields(entry)
+        obj, created = self.model.objects.update_or_create(
+            **unique_fields, defaults=default_fields)
+
+        obj_needs_update = False
+        for f, rel_type in self.model_rel_table.items():
+            logger.debug('rel_type: {0}'.format(rel_type))
+            if entry[f] is None:
+                continue
+
+            rel_metadata, rel_entries = self.rel_entries(entry, f)
+
+            rel_func = rel_metadata[REL_FIELD_TYPE]
+            rel_entry_list = []
+
+            if (rel_func == MANY_2_MANY and
+                    rel_metadata[TABLE_STRUCTURE] is None):
+                rel_entry_list = rel_entries
+            else:
+                rel_model = self.model_dict[rel_type]
+                for fields in rel_entries:
+                    if rel_func == FOREIGN_KEY:
+                        fields[rel_metadata[REL_FIELD_NAME]] = obj
+                    logger.debug('rel_fields: {0}'.format(fields))
+                    rel_obj, rel_created = \
+                        rel_model.objects.get_or_create(**fields)
+
+                    if rel_func == FOREIGN_KEY_SELF:
+                        setattr(obj, rel_metadata[REL_FIELD_NAME], rel_obj)
+                        obj_needs_update = True
+
+                    if rel_func == MANY_2_MANY:
+                        rel_entry_list.append(rel_obj)
+
+            if rel_func == MANY_2_MANY and len(rel_entry_list) > 0:
+                obj.update_m2m_field(rel_type, rel_entry_list)
+
+        if obj_needs_update:
+            obj.save()
+
+    def bulk_update_entries(self, entries):
+        """ Writes a chunk of API entries and their relations to the database
+        with a constant number of queries: the self foreign keys are resolved
+        first, then the entries are written with one INSERT ... ON CONFLICT
+        statement, and finally the foreign key and many to many relations are
+        created in bulk.
+
+        :param entries: a chunk of entries of the API response.
+        :type entries: dict[]
+
+        """
+        model = self.model
+        unique_attrs = [
+            self.model_table[k] for k in self.model_metadata[UNIQUE_PARAMS]]
+        update_attrs = []
+        # The self foreign keys of the entries without the relation are kept,
+        # as update_entry does
+        coalesce_attrs = []
+
+        # Build the instances, the last entry wins for repeated unique keys
+        objs = OrderedDict()
+        for entry in entries:
+            unique_fields, default_fields = self.entry_fields(entry)
+            for attr in default_fields:
+                if attr not in update_attrs:
+                    update_attrs.append(attr)
+            key = tuple(unique_fields[attr] for attr in unique_attrs)
+            if None in key:
+                # Nulls never conflict in a unique index
+                self.update_entry(entry)
+                continue
+            objs.pop(key, None)
+            objs[key] = (
+                model(**unique_fields, **default_fields), entry)
+        if not objs:
+            return
+        objs, entries = zip(*objs.values())
+
+        db = router.db_for_write(model)
+        with transaction.atomic(using=db):
+            for f, rel_type in self.model_rel_table.items():
+                rel_metadata = OrderedDict(self.metadata[rel_type])
+                if rel_metadata[REL_FIELD_TYPE] != FOREIGN_KEY_SELF:
+                    continue
+                rel_field = model._meta.get_field(rel_metadata[REL_FIELD_NAME])
+                targets = []
+                for obj, entry in zip(objs, entries):
+                    rel_entries = self.rel_entries(entry, f)[1]
+                    if rel_entries:
+                        targets.append((obj, rel_entries[-1]))
+                rel_objs = bulk_get_or_create(
+                    self.model_dict[rel_type], [t[1] for t in targets])
+                for (obj, fields), rel_obj in zip(targets, rel_objs):
+                    setattr(obj, rel_field.name, rel_obj)
+                coalesce_attrs.append(rel_field.attname)
+
+            bulk_upsert(
+                model, objs, unique_attrs, update_attrs,
+                coalesce_fields=coalesce_attrs, using=db)
+
+            for f, rel_type in self.model_rel_table.items():
+                rel_metadata = OrderedDict(self.metadata[rel_type])
+                rel_func = rel_metadata[REL_FIELD_TYPE]
+                if rel_func == FOREIGN_KEY_SELF:
+                    continue
+
+                links = []
+                lookups = []
+                for obj, entry in zip(objs, entries):
+                    rel_entries = self.rel_entries(entry, f)[1]
+                    if rel_func == FOREIGN_KEY:
+                        rel_model = self.model_dict[rel_type]
+                        attname = rel_model._meta.get_field(
+                            rel_metadata[REL_FIELD_NAME]).attname
+                        for fields in rel_entries:
+                            fields[attname] = obj.pk
+                        lookups.extend(rel_entries)
+                    elif rel_entries:
+                        links.append((obj, rel_entries))
+
+                if rel_func == FOREIGN_KEY:
+                    bulk_get_or_create(self.model_dict[rel_type], lookups)
+                elif rel_func == MANY_2_MANY and len(links) > 0:
+                    if rel_metadata[TABLE_STRUCTURE] is not None:
+                        rel_objs = iter(bulk_get_or_create(
+                            self.model_dict[rel_type],
+                            [l for obj, ls in links for l in ls]))
+                        links = [
+                            (obj, [next(rel_objs) for l in ls])
+                            for obj, ls in links
+                        ]
+                    model.bulk_update_m2m_field(rel_type, links)
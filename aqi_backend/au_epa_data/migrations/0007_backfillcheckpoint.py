@@ -0,0 +1,37 @@
+# Generated by Django 2.1.5 on 2026-10-18 10:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('au_epa_data', '0006_auto_20190515_1528'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackfillCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('site_id', models.IntegerField(verbose_name='Site ID')),
+                ('monitor_id', models.CharField(max_length=15, verbose_name='Monitor ID')),
+                ('time_basis_id', models.CharField(max_length=15, verbose_name='Time Basis ID')),
+                ('from_date', models.CharField(max_length=10, verbose_name='From Date')),
+                ('to_date', models.CharField(max_length=10, verbose_name='To Date')),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('done', 'done'), ('failed', 'failed')], default='pending', max_length=7, verbose_name='Status')),
+                ('entries_count', models.PositiveIntegerField(default=0, verbose_name='Entries Count')),
+                ('error', models.TextField(blank=True, null=True, verbose_name='Error')),
+                ('modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+            ],
+            options={
+                'verbose_name': 'Backfill Checkpoint',
+                'verbose_name_plural': 'Backfill Checkpoints',
+                'db_table': 'backfill_checkpoint',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='backfillcheckpoint',
+            unique_together={('site_id', 'monitor_id', 'time_basis_id', 'from_date', 'to_date')},
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 2.1.5 on 2026-10-18 11:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('au_epa_data', '0007_backfillcheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MeasurementWatermark',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date_time_start', models.DateTimeField(verbose_name='Last Date Time Start')),
+                ('modified', models.DateTimeField(auto_now=True, verbose_name='Last Modified')),
+                ('monitor', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='watermarks', to='au_epa_data.Monitor', verbose_name='Monitor')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='watermarks', to='au_epa_data.Site', verbose_name='Site')),
+                ('time_basis', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='watermarks', to='au_epa_data.TimeBasis', verbose_name='Time Basis')),
+            ],
+            options={
+                'verbose_name': 'Measurement Watermark',
+                'verbose_name_plural': 'Measurement Watermarks',
+                'db_table': 'measurement_watermark',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='measurementwatermark',
+            unique_together={('site', 'monitor', 'time_basis')},
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 2.1.5 on 2026-10-18 12:10
+
+from django.db import migrations, models
+
+NUMBER_REGEX = r'^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$'
+
+BACKFILL_VALUES_SQL = """
+UPDATE measurement SET
+    value = CASE
+        WHEN raw_value ~ '{0}' THEN trim(raw_value)::double precision
+    END,
+    invalid_value = (
+        raw_value IS NOT NULL AND trim(raw_value) <> '' AND
+        raw_value !~ '{0}')
+""".format(NUMBER_REGEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('au_epa_data', '0008_measurementwatermark'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='measurement',
+            old_name='value',
+            new_name='raw_value',
+        ),
+        migrations.AlterField(
+            model_name='measurement',
+            name='raw_value',
+            field=models.CharField(blank=True, max_length=31, null=True, verbose_name='Raw Value'),
+        ),
+        migrations.AddField(
+            model_name='measurement',
+            name='value',
+            field=models.FloatField(blank=True, null=True, verbose_name='Value'),
+        ),
+        migrations.AddField(
+            model_name='measurement',
+            name='invalid_value',
+            field=models.BooleanField(default=False, help_text='The raw value could not be parsed as a number.', verbose_name='Invalid Value'),
+        ),
+        migrations.RunSQL(BACKFILL_VALUES_SQL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='measurement',
+            index=models.Index(fields=['site', 'monitor', 'time_basis', 'date_time_start'], name='measurement_series_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 2.1.5 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('au_epa_data', '0009_measurement_numeric_value'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LiveSnapshot',
+            fields=[
+                ('source', models.CharField(max_length=31, primary_key=True, serialize=False, verbose_name='Source')),
+                ('content', models.TextField(verbose_name='Content')),
+                ('fetched_at', models.DateTimeField(verbose_name='Fetched At')),
+            ],
+            options={
+                'verbose_name': 'Live Snapshot',
+                'verbose_name_plural': 'Live Snapshots',
+                'db_table': 'live_snapshot',
+            },
+        ),
+    ]
@@ -1,27 +1,53 @@
 import logging
-import copy
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 from django.utils.translation import ugettext_lazy as _
 from django.db import models, IntegrityError, connections
 from django.utils import timezone
 from django.utils.text import slugify
-from django.db.models import Avg
-from django.db.models.functions import Cast
+from django.db.models import Max
 from django.contrib.gis.geos import Point
 from django.contrib.gis.geos import GEOSGeometry
 
 from geo_data.utils import with_metric_buffer
 from forecasting.constants import (
-    FIRE_SITUATIONS_RADIUS, FIRE_SITUATION_STATION_RADIUS)
+    FIRE_AREAS_CACHE_SIZE, FIRE_SITUATIONS_RADIUS,
+    FIRE_SITUATION_STATION_RADIUS)
 
 logger = logging.getLogger('myaqi')
 
 
+@lru_cache(maxsize=FIRE_AREAS_CACHE_SIZE)
+def _buffered_areas(location_wkt, radii):
+    """ Buffers a location by each of the radii, in meters, with one query to
+    the geo_data database.
+
+    :rtype: tuple(GEOSGeometry)
+
+    """
+    raw_query = "SELECT {0}".format(", ".join(
+        ["ST_Buffer(ST_GeomFromText(%s, 4326)::geography, %s)"] * len(radii)))
+    params = []
+    for radius in radii:
+        params.extend([location_wkt, radius])
+    with connections['geo_data'].cursor() as cursor:
+        cursor.execute(raw_query, params)
+        return tuple(GEOSGeometry(area) for area in cursor.fetchone())
+
+
 class UpdateM2MModel(models.Model):
     def update_m2m_field(self, m2m_field, entries):
         raise NotImplementedError(
             "Child classes of the UpdateM2MModel must implement the "
             "update_m2m_field method.")
 
+    @classmethod
+    def bulk_update_m2m_field(cls, m2m_field, links):
+        raise NotImplementedError(
+            "Child classes of the UpdateM2MModel must implement the "
+            "bulk_update_m2m_field method.")
+
     class Meta:
         abstract = True
 
@@ -66,19 +92,23 @@ class Site(UpdateM2MModel):
     @property
     def fire_area(self):
         # return with_metric_buffer(self.location_point, self._fire_area_radius)
-        raw_query = (
-            "SELECT ST_Buffer(ST_GeomFromText('{location_point}', 4326)"
-            "::geography, {radius})".format(
-                location_point=self.location_point,
-                radius=self._fire_area_radius
-            )
-        )
-        fire_area = None
-        with connections['geo_data'].cursor() as cursor:
-            cursor.execute(raw_query)
-            fire_area = GEOSGeometry(cursor.fetchone()[0])
-
-        return fire_area
+        return self.get_fire_areas((self._fire_area_radius, ))[0]
+
+    def get_fire_areas(self, radii):
+        """ Returns the areas within the given distances of the site. The
+        buffers are computed by the geo_data database once per location and
+        radius, and kept in memory, so changing the coordinates of the site
+        computes them again.
+
+        :param radii: the distances to the site, in meters.
+        :type radii: float[]
+        :rtype: GEOSGeometry[]
+
+        """
+        return [
+            area.clone() for area in
+            _buffered_areas(self.location_point.wkt, tuple(radii))
+        ]
 
     @property
     def fire_areas(self):
@@ -94,17 +124,18 @@ class Site(UpdateM2MModel):
         return self._fire_area_radius
 
     def get_fire_situations_areas(self, furthest_fire_area_radius=None):
-        areas = []
         if furthest_fire_area_radius is not None:
             furthest_radius = furthest_fire_area_radius
         else:
             furthest_radius = FIRE_SITUATION_STATION_RADIUS[str(self.site_id)]
 
-        for situation, radius_prop in FIRE_SITUATIONS_RADIUS.items():
-            self.set_fire_area_radius(furthest_radius * radius_prop)
-            areas.append(self.fire_area)
+        radii = [
+            furthest_radius * radius_prop
+            for radius_prop in FIRE_SITUATIONS_RADIUS.values()
+        ]
+        self.set_fire_area_radius(radii[-1])
 
-        return areas
+        return self.get_fire_areas(radii)
 
     def update_m2m_field(self, m2m_field, entries):
         from .constants import SITE_LIST
@@ -114,6 +145,16 @@ class Site(UpdateM2MModel):
             return True
         return False
 
+    @classmethod
+    def bulk_update_m2m_field(cls, m2m_field, links):
+        from .constants import SITE_LIST
+        from .upsert import bulk_add_m2m
+
+        if m2m_field == SITE_LIST:
+            bulk_add_m2m(cls.site_list, links)
+            return True
+        return False
+
     class Meta:
         db_table = 'site'
         verbose_name = _('Site')
@@ -189,10 +230,26 @@ class Monitor(UpdateM2MModel):
             return True
         return False
 
-    def save(self, *args, **kwargs):
+    @classmethod
+    def bulk_update_m2m_field(cls, m2m_field, links):
+        from .constants import SITES
+        from .upsert import bulk_add_m2m
+
+        if m2m_field == SITES:
+            created, missing = bulk_add_m2m(cls.sites, links)
+            if missing:
+                logger.error('Unknown sites for {0}: {1}'.format(
+                    cls.__name__, missing))
+            return True
+        return False
+
+    def pre_bulk_save(self):
         if not self.slug:
             self.slug = slugify(self.monitor_id)
 
+    def save(self, *args, **kwargs):
+        self.pre_bulk_save()
+
         super(Monitor, self).save(*args, **kwargs)
 
     class Meta:
@@ -232,6 +289,19 @@ class TimeBasis(UpdateM2MModel):
             return True
         return False
 
+    @classmethod
+    def bulk_update_m2m_field(cls, m2m_field, links):
+        from .constants import SITES
+        from .upsert import bulk_add_m2m
+
+        if m2m_field == SITES:
+            created, missing = bulk_add_m2m(cls.sites, links)
+            if missing:
+                logger.error('Unknown sites for {0}: {1}'.format(
+                    cls.__name__, missing))
+            return True
+        return False
+
     class Meta:
         db_table = 'time_basis'
         verbose_name = _('Time Basis')
@@ -267,8 +337,12 @@ class MonitorTimeBasis(models.Model):
 class Measurement(UpdateM2MModel):
     date_time_start = models.DateTimeField(_("Date Time Start"))
     date_time_recorded = models.DateTimeField(_("Date Time Recorded"))
-    value = models.CharField(
-        _("Value"), max_length=31, blank=True, null=True)
+    value = models.FloatField(_("Value"), blank=True, null=True)
+    raw_value = models.CharField(
+        _("Raw Value"), max_length=31, blank=True, null=True)
+    invalid_value = models.BooleanField(
+        _("Invalid Value"), default=False,
+        help_text=_("The raw value could not be parsed as a number."))
     quality_status = models.PositiveSmallIntegerField(
         _("Quality Status"), default=9)
     aqi_index = models.PositiveSmallIntegerField(
@@ -296,6 +370,26 @@ class Measurement(UpdateM2MModel):
     def __str__(self):
         return self.monitor_id
 
+    @staticmethod
+    def parse_value(raw_value):
+        """ Parses the value of a measurement as reported by the API.
+
+        :param raw_value: the value as reported by the API.
+        :type raw_value: string
+        :rtype: tuple(float, boolean)
+
+        Returns:
+            (value, invalid_value): the numeric value, None if it is missing
+            or could not be parsed, and whether it could not be parsed.
+
+        """
+        if raw_value is None or str(raw_value).strip() == '':
+            return None, False
+        try:
+            return float(raw_value), False
+        except (TypeError, ValueError):
+            return None, True
+
     def update_m2m_field(self, m2m_field, entries):
         from .constants import SITES
 
@@ -311,52 +405,60 @@ class Measurement(UpdateM2MModel):
     @classmethod
     def measurements_for_forecast(
             cls, measurements, aq_attributes, start_date, end_date):
+        """ Prepares the hourly time series of the given monitors to be used
+        in a prediction procedure. The hours without a measurement are filled
+        with the average of the monitor over the whole period.
+
+        :param measurements: the measurements of a monitoring site.
+        :type measurements: django.db.models.QuerySet
+        :param aq_attributes: the IDs of the monitors to use.
+        :type aq_attributes: string[]
+        :param start_date: date and time from where to start retrieving the
+            data.
+        :type start_date: datetime.datetime
+        :param end_date: date and time on which to stop retrieving the data.
+        :type end_date: datetime.datetime
+        :rtype: dict
+
+        Returns:
+            data (dict): a dict that has a date key which contains all the
+            ordered date strings and then one key for each monitor and the
+            corresponding values for each date.
+
+        """
+        from .constants import POLLUTANT_TO_MONITOR
+        from forecasting.utils import (
+            get_datetime_span_index, local_datetime_strings)
+
+        dates = get_datetime_span_index(start_date, end_date)
+        frame = pd.DataFrame.from_records(
+            measurements.filter(
+                date_time_start__gte=start_date,
+                date_time_start__lte=end_date).values_list(
+                    'date_time_start', 'monitor_id', 'value').iterator(),
+            columns=['date', 'monitor', 'value'])
+        frame['date'] = local_datetime_strings(frame['date'])
+        frame['value'] = frame['value'].astype(float)
+
+        # The average of each aq_attr mends the missing pieces
+        averages = frame.groupby('monitor')['value'].mean()
+        frame = frame.drop_duplicates(['date', 'monitor'], keep='last')
+        frame['measured'] = True
+        values = frame.pivot(index='date', columns='monitor', values='value')
+        values = values.reindex(index=dates, columns=aq_attributes)
+        measured = frame.pivot(
+            index='date', columns='monitor', values='measured').reindex(
+                index=dates, columns=aq_attributes).notnull()
 
-        from .constants import DATETIME_FORMAT, POLLUTANT_TO_MONITOR
-        from forecasting.utils import get_datetime_span_dict
-
-        print(start_date, end_date)
-        dates = get_datetime_span_dict(start_date, end_date)
         data = {
-            'date': []
+            'date': list(dates)
         }
-        averages = {}
-        measurements = measurements.filter(
-            date_time_start__gte=start_date,
-            date_time_start__lte=end_date)
-
-        # Get the average for each aq_attr to mend missing pieces
-        # and create the data columns
         for attr in aq_attributes:
-            avg = measurements.filter(monitor_id=attr).annotate(
-                value_float=Cast('value', models.FloatField())).aggregate(
-                    Avg('value_float'))
-            averages[attr] = round(avg['value_float__avg'], 2)
-            data[POLLUTANT_TO_MONITOR[attr]] = []
-
-        for m in measurements:
-            date_str = timezone.localtime(
-                m.date_time_start).strftime(DATETIME_FORMAT)
-            # print(date_str, m.monitor, m.value)
-            # if date_str not in dates.keys():
-            #     dates[date_str] = []
-            # print (date_str)
-            dates[date_str].append((
-                m.monitor.monitor_id, m.value
-            ))
-        for date, monitors in dates.items():
-            # print(date, len(monitors))
-            data['date'].append(date)
-            aq_attr_checklist = copy.copy(aq_attributes)
-            for monitor in monitors:
-                aq_attr_checklist.remove(monitor[0])
-                moni = POLLUTANT_TO_MONITOR[monitor[0]]
-                data[moni].append(monitor[1])
-            for attr in aq_attr_checklist:
-                moni = POLLUTANT_TO_MONITOR[attr]
-                data[moni].append(averages[attr])
-
-        print(averages)
+            column = values[attr].where(
+                measured[attr], round(float(averages.get(attr, np.nan)), 2))
+            data[POLLUTANT_TO_MONITOR[attr]] = [
+                None if np.isnan(v) else v for v in column.tolist()]
+
         return data
 
     class Meta:
@@ -365,3 +467,133 @@ class Measurement(UpdateM2MModel):
         verbose_name_plural = _('Measurements')
         unique_together = (
             ('date_time_start', 'site', 'monitor', 'time_basis'), )
+        indexes = [
+            models.Index(
+                fields=['site', 'monitor', 'time_basis', 'date_time_start'],
+                name='measurement_series_idx'),
+        ]
+
+
+class MeasurementWatermark(models.Model):
+    """
+    High-water mark of the measurements imported for a site, monitor and time
+    basis, from where the incremental au_epa_update runs start fetching.
+    """
+    site = models.ForeignKey(
+        Site, verbose_name=_("Site"), on_delete=models.DO_NOTHING,
+        related_name='watermarks')
+    monitor = models.ForeignKey(
+        Monitor, verbose_name=_("Monitor"), on_delete=models.DO_NOTHING,
+        related_name='watermarks')
+    time_basis = models.ForeignKey(
+        TimeBasis, verbose_name=_("Time Basis"), on_delete=models.DO_NOTHING,
+        related_name='watermarks')
+    date_time_start = models.DateTimeField(_("Last Date Time Start"))
+    modified = models.DateTimeField(_('Last Modified'), auto_now=True)
+
+    def __str__(self):
+        return "{0}-{1}-{2}".format(
+            self.site_id, self.monitor_id, self.time_basis_id)
+
+    @classmethod
+    def get_watermark(cls, site_id, monitor_id, time_basis_id):
+        """ Returns the last date_time_start imported for a site, monitor and
+        time basis. Falls back to the stored measurements when no watermark
+        has been recorded yet.
+
+        :rtype: datetime.datetime
+        """
+        watermark = cls.objects.filter(
+            site_id=site_id, monitor_id=monitor_id,
+            time_basis_id=time_basis_id).values_list(
+                'date_time_start', flat=True).first()
+        if watermark is None:
+            watermark = Measurement.objects.filter(
+                site_id=site_id, monitor_id=monitor_id,
+                time_basis_id=time_basis_id).aggregate(
+                    Max('date_time_start'))['date_time_start__max']
+        return watermark
+
+    @classmethod
+    def advance(cls, watermarks):
+        """ Moves the watermarks forward, never backwards.
+
+        :param watermarks: the newest date_time_start imported, keyed by
+            (site_id, monitor_id, time_basis_id).
+        :type watermarks: dict
+        """
+        for (site_id, monitor_id, time_basis_id), date in watermarks.items():
+            lookup = {
+                'site_id': site_id,
+                'monitor_id': monitor_id,
+                'time_basis_id': time_basis_id
+            }
+            updated = cls.objects.filter(
+                date_time_start__lt=date, **lookup).update(
+                    date_time_start=date, modified=timezone.now())
+            if not updated:
+                cls.objects.get_or_create(
+                    **lookup, defaults={'date_time_start': date})
+
+    class Meta:
+        db_table = 'measurement_watermark'
+        verbose_name = _('Measurement Watermark')
+        verbose_name_plural = _('Measurement Watermarks')
+        unique_together = (('site', 'monitor', 'time_basis'), )
+
+
+class BackfillCheckpoint(models.Model):
+    """
+    Progress of the au_epa_backfill command: one row per measurements request
+    (site, monitor, time basis and date window) to the AirWatch API.
+    """
+    PENDING = 'pending'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUSES = (
+        (PENDING, 'pending'),
+        (DONE, 'done'),
+        (FAILED, 'failed'),
+    )
+    site_id = models.IntegerField(_("Site ID"))
+    monitor_id = models.CharField(_("Monitor ID"), max_length=15)
+    time_basis_id = models.CharField(_("Time Basis ID"), max_length=15)
+    from_date = models.CharField(_("From Date"), max_length=10)
+    to_date = models.CharField(_("To Date"), max_length=10)
+    status = models.CharField(
+        _("Status"), max_length=7, choices=STATUSES, default=PENDING)
+    entries_count = models.PositiveIntegerField(_("Entries Count"), default=0)
+    error = models.TextField(_("Error"), blank=True, null=True)
+    modified = models.DateTimeField(_('Last Modified'), auto_now=True)
+
+    def __str__(self):
+        return "{0}-{1}-{2}-{3}".format(
+            self.site_id, self.monitor_id, self.time_basis_id,
+            self.from_date)
+
+    class Meta:
+        db_table = 'backfill_checkpoint'
+        verbose_name = _('Backfill Checkpoint')
+        verbose_name_plural = _('Backfill Checkpoints')
+        unique_together = (
+            ('site_id', 'monitor_id', 'time_basis_id', 'from_date',
+             'to_date'), )
+
+
+class LiveSnapshot(models.Model):
+    """
+    Last known good snapshot of a live upstream source (e.g. the AirWatch
+    sites and their hourly measurements), stored by the au_epa_poll command
+    already serialized in the representation of its proxy endpoint.
+    """
+    source = models.CharField(_("Source"), max_length=31, primary_key=True)
+    content = models.TextField(_("Content"))
+    fetched_at = models.DateTimeField(_("Fetched At"))
+
+    def __str__(self):
+        return "{0}-{1}".format(self.source, self.fetched_at)
+
+    class Meta:
+        db_table = 'live_snapshot'
+        verbose_name = _('Live Snapshot')
+        verbose_name_plural = _('Live Snapshots')
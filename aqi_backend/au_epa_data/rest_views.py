@@ -1,24 +1,27 @@
-import requests
-import io
 import json
+import datetime
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import viewsets
 from rest_framework.views import APIView
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from collections import OrderedDict
 
 from common.filters import ExtendedFilter
+from common.utils import parse_bbox
 
 from .constants import (
-    AU_VIC_URL_MAP,
-    VIC_ROADS_LIVE,
-    VIC_ROADS_MAPSJS_START,
-    FIRES,
+    LIVE_SNAPSHOT_MAX_AGE,
     MEASUREMENT,
-    SITE_WITH_MEASUREMENTS
+    SITE_WITH_MEASUREMENTS,
+    VIC_EMERGENCY_NEAR_RADIUS
 )
+from .emergency import fetch_feed_index, parse_timestamp
+from .live import absolute_urls, fetch_sites
 from .models import (
+    LiveSnapshot,
     Site,
     Monitor
 )
@@ -28,6 +31,9 @@ from .serializers import (
     MonitorSerializer,
     ExtendedMonitorSerializer
 )
+from .traffic import (
+    cached_incident_features, fetch_incidents, filter_features)
+from .upstream import UpstreamUnavailable, client
 
 
 class SiteViewSet(ExtendedFilter, viewsets.ModelViewSet):
@@ -54,53 +60,42 @@ class SitesProxy(APIView):
     def get(self, request, format=None):
         """
         Return a list of all sites.
-        """
 
-        now = timezone.localtime().strftime('%Y%m%d%H')
-        url = OrderedDict(AU_VIC_URL_MAP)[SITE_WITH_MEASUREMENTS].format(now)
-        headers = {'content-type': 'application/json'}
-        r = requests.get(url, params=request.query_params, headers=headers)
-        response = r.json()
-        # return Response(response)
-        response = response['IncidentSites'] + response['NonIncidentSites']
-        sites = []
-        for s in response:
-            live_measurements = [{
-                "aqi_value": m["AQIValue"],
-                "name": m["ShortName"],
-                "value": m["Value"],
-                "time_basis": m["TimeBasisID"],
-                "description": m["Description"].capitalize() if m[
-                    "Description"] else m["Abbreviation"]
-            } for m in s.get("Measurements", []) if m["ShortName"] is not None]
-            try:
-                local_site = Site.objects.get(pk=s['SiteId'])
-            except Site.DoesNotExist:
-                local_site = None
-            sites.append({
-                "site_id": s['SiteId'],
-                "name": s['Name'],
-                "latitude": s['Latitude'],
-                "longitude": s['Longitude'],
-                "fire_hazard_category": s.get('FireHazardCategory'),
-                "is_station_offline": s.get('IsStationOffline', False),
-                "has_incident": s.get('HasIncident', False),
-                "incident_type": s.get('SiteType', 'Non-incident'),
-                "incidents": [
-                    {}
-                ],
-                "site_list": [
-                    {
-                        "name": s["Region"]
-                    }
-                ],
-                "current_status": live_measurements,
-                "monitors": MonitorSerializer(
-                    local_site.monitors.all(), many=True,
-                    context={'request': request}
-                ).data if local_site is not None else []
-            })
-        return Response({'count': len(sites), 'results': sites})
+        Without query parameters the last snapshot stored by the au_epa_poll
+        command is returned as is, with its Last-Modified date, while it is
+        recent. Otherwise AirWatch is queried, falling back to the stored
+        snapshot when it is unavailable.
+        """
+        snapshot = None
+        if not request.query_params:
+            snapshot = LiveSnapshot.objects.filter(
+                source=SITE_WITH_MEASUREMENTS).first()
+            if snapshot is not None and timezone.now() - \
+                    snapshot.fetched_at < datetime.timedelta(
+                        seconds=LIVE_SNAPSHOT_MAX_AGE):
+                return self.snapshot_response(request, snapshot)
+
+        try:
+            return Response(fetch_sites(request.query_params, request))
+        except UpstreamUnavailable:
+            if snapshot is None:
+                raise
+            return self.snapshot_response(request, snapshot)
+
+    def snapshot_response(self, request, snapshot):
+        """
+        Return the stored snapshot, or a 304 if the client already has it.
+        Its monitor URLs are stored relative, and made absolute as the ones
+        fetched live.
+        """
+        last_modified = int(snapshot.fetched_at.timestamp())
+        response = get_conditional_response(
+            request, last_modified=last_modified)
+        if response is None:
+            response = Response(
+                absolute_urls(json.loads(snapshot.content), request))
+        response['Last-Modified'] = http_date(last_modified)
+        return response
 
 
 class MeasurementsProxy(APIView):
@@ -114,10 +109,9 @@ class MeasurementsProxy(APIView):
         Return a list of all measurements.
         """
 
-        url = OrderedDict(AU_VIC_URL_MAP)[MEASUREMENT]
         headers = {'content-type': 'application/json'}
-        r = requests.get(url, params=request.query_params, headers=headers)
-        return Response(r.json())
+        return Response(client.fetch(
+            MEASUREMENT, params=request.query_params, headers=headers))
 
 
 class VicEmergencyProxy(APIView):
@@ -126,15 +120,55 @@ class VicEmergencyProxy(APIView):
     """
     permission_classes = (AllowAny,)
 
+    filter_params = ('bbox', 'near', 'radius', 'category', 'since')
+
     def get(self, request, format=None):
         """
         Return a list of all incidents.
-        """
 
-        url = OrderedDict(AU_VIC_URL_MAP)[FIRES]
-        headers = {'content-type': 'application/json'}
-        r = requests.get(url, params=request.query_params, headers=headers)
-        return Response(r.json())
+        The incidents can be filtered with
+        `?bbox=min_lng,min_lat,max_lng,max_lat`, `?near=lat,lng&radius=<km>`,
+        `?category=<category>,<category>` and `?since=<ISO 8601 date>` (last
+        updated), returning only the matching features with simplified
+        geometries.
+        """
+        params = request.query_params.copy()
+        filters = {
+            k: params.pop(k)[-1] for k in self.filter_params if k in params}
+        index = fetch_feed_index(params)
+        if not filters:
+            return Response(index.collection)
+
+        try:
+            query = self.parse_filters(filters)
+        except ValueError as e:
+            raise ValidationError({'detail': str(e)})
+        return Response({
+            'type': 'FeatureCollection',
+            'features': index.query(**query)
+        })
+
+    def parse_filters(self, filters):
+        """
+        Return the FeatureIndex.query arguments of the filter parameters.
+        """
+        query = {}
+        if filters.get('bbox'):
+            query['bbox'] = parse_bbox(filters['bbox'])
+        if filters.get('near'):
+            lat, lng = (float(v) for v in filters['near'].split(','))
+            query['near'] = (lat, lng)
+            query['radius'] = float(
+                filters.get('radius') or VIC_EMERGENCY_NEAR_RADIUS)
+        if filters.get('category'):
+            query['categories'] = set(
+                c for c in filters['category'].split(',') if c)
+        if filters.get('since'):
+            query['since'] = parse_timestamp(filters['since'])
+            if query['since'] != query['since']:
+                raise ValueError(
+                    'Invalid since date: {0}'.format(filters['since']))
+        return query
 
 
 class VicRoadsLiveProxy(APIView):
@@ -148,14 +182,29 @@ class VicRoadsLiveProxy(APIView):
         Return a list of all incidents.
         """
 
-        url = OrderedDict(AU_VIC_URL_MAP)[VIC_ROADS_LIVE]
-        headers = {'content-type': 'application/javascript'}
-        r = requests.get(url, params=request.query_params, headers=headers)
-        incidents = "{}"
-        with io.StringIO(r.text) as f:
-            line = f.readline()
-            while not line.startswith(VIC_ROADS_MAPSJS_START):
-                line = f.readline()
-            incidents = line.split(VIC_ROADS_MAPSJS_START)[1][:-2]
-
-        return Response(json.loads(incidents))
+        return Response(fetch_incidents(request.query_params))
+
+
+class VicRoadsGeoJSONProxy(APIView):
+    """
+    View to return the traffic incidents on victorian roads as GeoJSON.
+    """
+    permission_classes = (AllowAny,)
+
+    def get(self, request, format=None):
+        """
+        Return a GeoJSON feature collection of the incidents with
+        coordinates, filtered with `?bbox=min_lng,min_lat,max_lng,max_lat`
+        and `?type=<type>,<type>`.
+        """
+        bbox = request.query_params.get('bbox')
+        try:
+            bbox = parse_bbox(bbox) if bbox else None
+        except ValueError as e:
+            raise ValidationError({'bbox': str(e)})
+        types = set(
+            t for t in request.query_params.get('type', '').split(',') if t)
+
+        features = filter_features(
+            cached_incident_features(fetch_incidents()), bbox, types)
+        return Response({'type': 'FeatureCollection', 'features': features})
@@ -1,3 +1,494 @@
-from django.test import TestCase
+import os
+import sys
+import copy
+import datetime
+import threading
+import urllib.parse
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.conf import settings
+from django.core.management import call_command
+from django.db import OperationalError
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from au_epa_data.constants import (
+    DEFAULT_TIME_BASIS, LIVE_SNAPSHOT_MAX_AGE, MEASUREMENT,
+    SITE_WITH_MEASUREMENTS)
+from au_epa_data.management.commands import au_epa_backfill, au_epa_poll
+from au_epa_data.management.commands.au_epa_update import (
+    Command as UpdateCommand)
+from au_epa_data.models import (
+    BackfillCheckpoint, EquipmentType, LiveSnapshot, Measurement, Monitor,
+    MonitorTimeBasis, Site, TimeBasis)
+from au_epa_data.live import fetch_sites, site_monitors, store_snapshot
+from au_epa_data.upstream import UpstreamClient, UpstreamUnavailable
+from common.models import AQICategoryThreshold, AQIOrganization
+
+sys.path.append(os.path.join(settings.BASE_DIR, '..', 'scripts'))
+from airwatch_stub import AirWatchStub  # noqa: E402
+
+SITE_ID = 10001
+MONITOR_ID = 'BPM2.5'
+
+# One of the entries of the AirWatch /Measurements response
+MEASUREMENT_ENTRY = {
+    'DateTimeStart': '2018-07-01T00:00:00',
+    'DateTimeRecorded': '2018-07-01T01:05:00',
+    'Value': '5.1',
+    'QualityStatus': 1,
+    'AQIIndex': 20,
+    'AQICategoryAbbreviation': None,
+    'HealthCategoryLevel': None,
+    'SiteId': SITE_ID,
+    'TimeBaseId': DEFAULT_TIME_BASIS,
+    'MonitorId': MONITOR_ID,
+    'EquipmentType': {
+        'IdNumber': 8,
+        'Code': 'BAM',
+        'Description': 'Beta Attenuation Monitor'
+    },
+    'MonitorTimeBasis': {
+        'AQIPollutantStandard': 25.0,
+        'IncidentType': 'Fire',
+        'PresentationOrder': 2,
+        'CalcAQI': True,
+        'CalcHealthCategory': False,
+        'MonitorId': MONITOR_ID
+    }
+}
+
+
+def sites_response(site_ids):
+    """Returns an AirWatch /SitesHourlyAirQuality response of the sites."""
+    return {
+        'IncidentSites': [],
+        'NonIncidentSites': [{
+            'SiteId': site_id,
+            'Name': 'Site {0}'.format(site_id),
+            'Latitude': -37.77,
+            'Longitude': 145.03,
+            'Region': 'Port Phillip',
+            'Measurements': [{
+                'AQIValue': 20,
+                'ShortName': MONITOR_ID,
+                'Value': 5.1,
+                'TimeBasisID': DEFAULT_TIME_BASIS,
+                'Description': 'Very good',
+                'Abbreviation': 'VG'
+            }]
+        } for site_id in site_ids]
+    }
+
+
+def measurements_response(*entries):
+    """Returns an AirWatch /Measurements response with an entry per hour,
+    each entry being the MEASUREMENT_ENTRY fields to override."""
+    measurements = []
+    for hour, fields in enumerate(entries):
+        entry = copy.deepcopy(MEASUREMENT_ENTRY)
+        entry['DateTimeStart'] = '2018-07-01T{0:02d}:00:00'.format(hour)
+        entry['DateTimeRecorded'] = '2018-07-01T{0:02d}:05:00'.format(hour)
+        entry.update(fields)
+        measurements.append(entry)
+    return {
+        'NumberOfMeasurements': len(measurements),
+        'Measurements': measurements
+    }
+
+
+class AirWatchDataTestCase(TestCase):
+    """Creates the site, monitor, equipment type and time basis of
+    MEASUREMENT_ENTRY, as the sites, monitors and time basis imports do."""
+    multi_db = True
+
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.create(site_id=SITE_ID, name='Alphington')
+        equipment_type = EquipmentType.objects.create(
+            id_number=8, code='BAM', description='Beta Attenuation Monitor')
+        monitor = Monitor.objects.create(
+            monitor_id=MONITOR_ID, equipment_type=equipment_type)
+        monitor.sites.add(site)
+        time_basis = TimeBasis.objects.create(time_base_id=DEFAULT_TIME_BASIS)
+        MonitorTimeBasis.objects.create(
+            time_basis=time_basis, monitor=monitor,
+            aqi_pollutant_standard=25.0, incident_type='Fire',
+            presentation_order=2, calc_aqi=True, calc_health_category=False)
+
+
+class MeasurementValueTest(AirWatchDataTestCase):
+
+    def test_parse_value(self):
+        self.assertEqual(Measurement.parse_value('12.5'), (12.5, False))
+        self.assertEqual(Measurement.parse_value(' 3 '), (3.0, False))
+        self.assertEqual(Measurement.parse_value(None), (None, False))
+        self.assertEqual(Measurement.parse_value(''), (None, False))
+        self.assertEqual(Measurement.parse_value('n/a'), (None, True))
+
+    def test_import_values(self):
+        root = measurements_response(
+            {'Value': '12.5'}, {'Value': ''}, {'Value': None},
+            {'Value': 'n/a'})
+        for bulk in (True, False):
+            with self.subTest(bulk=bulk):
+                Measurement.objects.all().delete()
+                UpdateCommand().import_entries(
+                    MEASUREMENT, copy.deepcopy(root), bulk=bulk)
+                self.assertEqual(
+                    list(Measurement.objects.order_by(
+                        'date_time_start').values_list(
+                            'raw_value', 'value', 'invalid_value')),
+                    [('12.5', 12.5, False), ('', None, False),
+                     (None, None, False), ('n/a', None, True)])
+
+
+class BulkUpdateEntriesTest(AirWatchDataTestCase):
+    fields = (
+        'date_time_start', 'date_time_recorded', 'raw_value', 'value',
+        'invalid_value', 'quality_status', 'aqi_index', 'site_id',
+        'monitor_id', 'time_basis_id', 'equipment_type__code',
+        'monitor_time_basis__presentation_order')
+
+    def import_rows(self, responses, bulk):
+        Measurement.objects.all().delete()
+        for root in responses:
+            UpdateCommand().import_entries(
+                MEASUREMENT, copy.deepcopy(root), bulk=bulk, batch_size=2)
+        return list(Measurement.objects.order_by(
+            'date_time_start').values_list(*self.fields))
+
+    def test_bulk_and_row_by_row_rows(self):
+        responses = [
+            measurements_response(
+                {}, {'Value': '7.5'}, {'EquipmentType': None},
+                {'MonitorTimeBasis': None}),
+            # Revised values, and the relations missing from a whole chunk
+            measurements_response(
+                {'Value': '6.0', 'EquipmentType': None,
+                 'MonitorTimeBasis': None},
+                {'EquipmentType': None, 'MonitorTimeBasis': None},
+                {}, {'Value': 'n/a', 'EquipmentType': None}),
+        ]
+        rows = self.import_rows(responses, bulk=False)
+        self.assertEqual(self.import_rows(responses, bulk=True), rows)
+        # The missing relations did not clear the stored ones
+        self.assertEqual(
+            [(r[-2], r[-1]) for r in rows], [('BAM', 2)] * 4)
+
+
+class BackfillResumeTest(AirWatchDataTestCase):
+    # Daily windows of the airwatch_measurements_10001_BPM2.5.json fixture
+    windows = [
+        ['2018070{0}00'.format(day), '2018070{0}00'.format(day + 1)]
+        for day in range(1, 8)
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        super(BackfillResumeTest, cls).setUpTestData()
+        organization = AQIOrganization.objects.create(abbreviation='AUEPA')
+        for abbreviation in ('VG', 'G', 'F'):
+            AQICategoryThreshold.objects.create(
+                abbreviation=abbreviation, aqi_organization=organization)
+
+    def backfill(self, stub):
+        with mock.patch.multiple(
+                au_epa_backfill, SITES_MONITORS={str(SITE_ID): [MONITOR_ID]},
+                TIME_BASIS={MONITOR_ID: [DEFAULT_TIME_BASIS]},
+                DATES=self.windows):
+            call_command(
+                'au_epa_backfill', url=stub.measurements_url, workers=1)
+
+    def requested_windows(self, stub):
+        return sorted(
+            urllib.parse.parse_qs(
+                urllib.parse.urlparse(path).query)['fromDate'][0]
+            for path in stub.requested)
+
+    def test_resume(self):
+        write = au_epa_backfill.Command.write
+        written = []
+
+        def interrupted_write(command, checkpoint, root, error):
+            if len(written) == 3:
+                raise KeyboardInterrupt
+            written.append(checkpoint.from_date)
+            return write(command, checkpoint, root, error)
+
+        with AirWatchStub() as stub:
+            with mock.patch.object(
+                    au_epa_backfill.Command, 'write', interrupted_write):
+                with self.assertRaises(KeyboardInterrupt):
+                    self.backfill(stub)
+            self.assertEqual(
+                sorted(BackfillCheckpoint.objects.filter(
+                    status=BackfillCheckpoint.DONE).values_list(
+                        'from_date', flat=True)),
+                sorted(written))
+
+            del stub.requested[:]
+            with mock.patch(
+                    'au_epa_data.management.commands.au_epa_update.'
+                    'invalidate_experimental_data') as invalidate:
+                self.backfill(stub)
+            # Once for the whole run, not per window
+            invalidate.assert_called_once_with()
+
+        # Only the windows not finished by the first run were fetched again
+        self.assertEqual(
+            self.requested_windows(stub),
+            sorted(w[0] for w in self.windows if w[0] not in written))
+        self.assertFalse(BackfillCheckpoint.objects.exclude(
+            status=BackfillCheckpoint.DONE).exists())
+        self.assertEqual(Measurement.objects.count(), 24 * len(self.windows))
+
+
+class FakeResponse(object):
+
+    def __init__(self, data):
+        self.data = data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+@mock.patch.dict(
+    'au_epa_data.upstream.UPSTREAM_TTLS', {SITE_WITH_MEASUREMENTS: 60})
+class UpstreamClientTest(SimpleTestCase):
+    url = 'http://airwatch.test/SitesHourlyAirQuality'
+
+    def setUp(self):
+        self.client = UpstreamClient()
+        self.client.session = mock.Mock()
+        self.release = threading.Event()
+        self.release.set()
+        self.responses = iter(range(100))
+
+        def get(*args, **kwargs):
+            self.release.wait(5)
+            response = next(self.responses)
+            if isinstance(response, BaseException):
+                raise response
+            return FakeResponse({'response': response})
+        self.client.session.get.side_effect = get
+
+    def fetch(self, **kwargs):
+        return self.client.fetch(
+            SITE_WITH_MEASUREMENTS, url=self.url, **kwargs)
+
+    def fetch_concurrently(self, n):
+        """Fetches the same data from n threads while the upstream is held,
+        and returns their results or errors."""
+        self.release.clear()
+        results = [None] * n
+
+        def fetch(i):
+            try:
+                results[i] = self.fetch()
+            except BaseException as e:
+                results[i] = e
+        threads = [
+            threading.Thread(target=fetch, args=(i, )) for i in range(n)]
+        for t in threads:
+            t.start()
+        # Let them all reach the upstream or wait for it
+        while self.client.session.get.call_count < 1:
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.1)
+        self.release.set()
+        for t in threads:
+            t.join(5)
+        return results
+
+    def test_ttl(self):
+        with mock.patch('au_epa_data.upstream.time.monotonic') as monotonic:
+            monotonic.return_value = 1000
+            self.assertEqual(self.fetch(), {'response': 0})
+            monotonic.return_value = 1059
+            self.assertEqual(self.fetch(), {'response': 0})
+            self.assertEqual(self.client.session.get.call_count, 1)
+            # Expired
+            monotonic.return_value = 1061
+            self.assertEqual(self.fetch(), {'response': 1})
+            self.assertEqual(self.fetch(refresh=True), {'response': 2})
+        self.assertEqual(self.client.session.get.call_count, 3)
+
+    def test_coalescing(self):
+        results = self.fetch_concurrently(20)
+        self.assertEqual(self.client.session.get.call_count, 1)
+        self.assertEqual(results, [{'response': 0}] * 20)
+        self.assertEqual(self.client._in_flight, {})
+
+    def test_failure(self):
+        self.responses = iter([requests.ConnectionError('refused'), 1])
+        results = self.fetch_concurrently(5)
+        self.assertEqual(self.client.session.get.call_count, 1)
+        for result in results:
+            self.assertIsInstance(result, UpstreamUnavailable)
+        # The failures are not cached
+        self.assertEqual(self.client._in_flight, {})
+        self.assertEqual(self.fetch(), {'response': 1})
+
+    def test_interrupted(self):
+        self.responses = iter([SystemExit(), 1])
+        results = self.fetch_concurrently(5)
+        # The fetching thread exits, the waiting ones fail
+        self.assertEqual(
+            sorted(type(r).__name__ for r in results),
+            ['SystemExit'] + ['UpstreamUnavailable'] * 4)
+        self.assertEqual(self.client._in_flight, {})
+        self.assertEqual(self.fetch(), {'response': 1})
+
+    @mock.patch('au_epa_data.upstream.UPSTREAM_WAIT_TIMEOUT', 0.05)
+    def test_wait_timeout(self):
+        self.release.clear()
+        leader = threading.Thread(target=self.fetch)
+        leader.start()
+        while self.client.session.get.call_count < 1:
+            threading.Event().wait(0.01)
+        with self.assertRaises(UpstreamUnavailable):
+            self.fetch()
+        self.release.set()
+        leader.join(5)
+        self.assertEqual(self.fetch(), {'response': 0})
+
+
+class SiteMonitorsQueryCountTest(TestCase):
+    multi_db = True
+    site_ids = (10001, 10239)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sites = [
+            Site.objects.create(site_id=site_id, name='Site')
+            for site_id in cls.site_ids]
+        cls.time_basis = TimeBasis.objects.create(
+            time_base_id=DEFAULT_TIME_BASIS)
+
+    def add_monitors(self, n):
+        """Adds n monitors, with their own equipment type and time basis, to
+        every site."""
+        start = Monitor.objects.count()
+        for i in range(start, start + n):
+            monitor = Monitor.objects.create(
+                monitor_id='M{0}'.format(i),
+                equipment_type=EquipmentType.objects.create(
+                    code='E{0}'.format(i)))
+            monitor.sites.add(*self.sites)
+            MonitorTimeBasis.objects.create(
+                monitor=monitor, time_basis=self.time_basis)
+        return start + n
+
+    def test_site_monitors(self):
+        for n in (1, 10):
+            count = self.add_monitors(n)
+            with self.assertNumQueries(5, using='au_epa_aqi'):
+                monitors = site_monitors(self.site_ids)
+            self.assertEqual(
+                {site_id: len(m) for site_id, m in monitors.items()},
+                {site_id: count for site_id in self.site_ids})
+
+    @mock.patch('au_epa_data.live.client')
+    def test_sites_proxy(self, upstream):
+        upstream.fetch.return_value = sites_response(self.site_ids)
+        for n in (1, 10):
+            count = self.add_monitors(n)
+            # With query parameters the sites are fetched live
+            with self.assertNumQueries(5, using='au_epa_aqi'):
+                response = self.client.get(
+                    reverse('api:au-epa-data:sites-proxy'), {'format': 'json'})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [len(s['monitors']) for s in response.json()['results']],
+                [count] * len(self.site_ids))
+
+
+@mock.patch('au_epa_data.live.client')
+class SitesProxySnapshotTest(AirWatchDataTestCase):
+    url = reverse('api:au-epa-data:sites-proxy')
+
+    def store_snapshot(self, upstream, age=0):
+        """Stores the snapshot as au_epa_poll does, fetched *age* seconds
+        ago."""
+        upstream.fetch.return_value = sites_response([SITE_ID])
+        snapshot = store_snapshot(SITE_WITH_MEASUREMENTS, fetch_sites())
+        LiveSnapshot.objects.filter(pk=snapshot.pk).update(
+            fetched_at=snapshot.fetched_at - datetime.timedelta(seconds=age))
+        upstream.reset_mock()
+
+    def test_fresh_snapshot(self, upstream):
+        self.store_snapshot(upstream)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+        upstream.fetch.assert_not_called()
+
+        # Same representation as the sites fetched live once it is stale
+        upstream.fetch.return_value = sites_response([SITE_ID])
+        LiveSnapshot.objects.update(fetched_at=timezone.now() - (
+            datetime.timedelta(seconds=LIVE_SNAPSHOT_MAX_AGE + 1)))
+        live = self.client.get(self.url)
+        upstream.fetch.assert_called_once()
+        self.assertEqual(response.json(), live.json())
+        self.assertEqual(
+            response.json()['results'][0]['monitors'][0]['url'],
+            'http://testserver' + reverse(
+                'api:au-epa-data:monitor-detail', args=('bpm25', )))
+
+    def test_not_modified(self, upstream):
+        self.store_snapshot(upstream)
+        last_modified = self.client.get(self.url)['Last-Modified']
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['Last-Modified'], last_modified)
+        self.assertEqual(response.content, b'')
+
+    def test_stale_snapshot(self, upstream):
+        self.store_snapshot(upstream, age=LIVE_SNAPSHOT_MAX_AGE + 1)
+        upstream.fetch.return_value = sites_response([SITE_ID, 10239])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Last-Modified', response)
+        self.assertEqual(response.json()['count'], 2)
+        upstream.fetch.assert_called_once()
+
+    def test_upstream_failure(self, upstream):
+        self.store_snapshot(upstream, age=LIVE_SNAPSHOT_MAX_AGE + 1)
+        upstream.fetch.side_effect = UpstreamUnavailable('AirWatch is down')
+        response = self.client.get(self.url)
+        # The last known good snapshot
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(response.json()['count'], 1)
+
+        LiveSnapshot.objects.all().delete()
+        self.assertEqual(self.client.get(self.url).status_code, 503)
+
+
+class PollTest(SimpleTestCase):
+
+    def test_failed_polls(self):
+        with mock.patch.object(
+                au_epa_poll.Command, 'poll', side_effect=[
+                    TypeError('Malformed sites'), OperationalError('Gone'),
+                    True, KeyboardInterrupt]) as poll, \
+                mock.patch.object(au_epa_poll.time, 'sleep'), \
+                self.assertLogs('myaqi.commands', 'ERROR') as logs:
+            with self.assertRaises(KeyboardInterrupt):
+                call_command('au_epa_poll')
+        # Polling went on after the failures
+        self.assertEqual(poll.call_count, 4)
+        self.assertEqual(len(logs.records), 2)
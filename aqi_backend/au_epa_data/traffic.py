@@ -0,0 +1,138 @@
+import json
+import threading
+
+from .constants import (
+    GEOJSON_COORDINATE_DECIMALS, VIC_ROADS_GEOJSON_PROPERTIES,
+    VIC_ROADS_LATITUDE_KEYS, VIC_ROADS_LIVE, VIC_ROADS_LONGITUDE_KEYS,
+    VIC_ROADS_MAPSJS_CHUNK_SIZE, VIC_ROADS_MAPSJS_START, VIC_ROADS_TYPE_KEYS)
+from .upstream import client
+
+
+def maps_js_incidents(r):
+    """Extracts the incidents of the VicRoads maps.js response, reading it
+    line by line only up to the preload_data line.
+
+    :param r: the (streamed) maps.js response.
+    :type r: requests.Response
+    :rtype: dict
+
+    Raises:
+        ValueError: if maps.js has no preload_data line.
+
+    """
+    start = VIC_ROADS_MAPSJS_START.encode('utf-8')
+    for line in r.iter_lines(chunk_size=VIC_ROADS_MAPSJS_CHUNK_SIZE):
+        if line.startswith(start):
+            return json.loads(
+                line[len(start):].rstrip().rstrip(b';').decode('utf-8'))
+    raise ValueError('No {0!r} line in maps.js.'.format(
+        VIC_ROADS_MAPSJS_START))
+
+
+def fetch_incidents(params=None):
+    """Returns the live VicRoads incidents, cached for the TTL of VicRoads.
+
+    Raises:
+        au_epa_data.upstream.UpstreamUnavailable: if VicRoads failed.
+
+    """
+    headers = {'content-type': 'application/javascript'}
+    return client.fetch(
+        VIC_ROADS_LIVE, params=params, headers=headers,
+        parse=maps_js_incidents, stream=True)
+
+
+def _first(incident, keys):
+    for key in keys:
+        if incident.get(key) is not None:
+            return incident[key]
+    return None
+
+
+def _incident_groups(incidents):
+    """Yields the group (the key of preload_data) and the incidents of each
+    list of incidents of preload_data."""
+    if isinstance(incidents, list):
+        yield None, incidents
+    elif isinstance(incidents, dict):
+        for group, items in incidents.items():
+            if isinstance(items, list):
+                yield group, items
+
+
+def incident_features(incidents):
+    """Converts the VicRoads incidents with coordinates into compact GeoJSON
+    point features, keeping only the VIC_ROADS_GEOJSON_PROPERTIES.
+
+    :param incidents: the preload_data of maps.js.
+    :type incidents: dict
+    :rtype: dict[]
+
+    """
+    features = []
+    for group, items in _incident_groups(incidents):
+        for incident in items:
+            if not isinstance(incident, dict):
+                continue
+            try:
+                lng = round(float(_first(
+                    incident, VIC_ROADS_LONGITUDE_KEYS)),
+                    GEOJSON_COORDINATE_DECIMALS)
+                lat = round(float(_first(
+                    incident, VIC_ROADS_LATITUDE_KEYS)),
+                    GEOJSON_COORDINATE_DECIMALS)
+            except (TypeError, ValueError):
+                continue
+            properties = {
+                k: incident[k] for k in VIC_ROADS_GEOJSON_PROPERTIES
+                if incident.get(k) is not None
+            }
+            properties['type'] = _first(incident, VIC_ROADS_TYPE_KEYS) or \
+                group
+            features.append({
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [lng, lat]},
+                'properties': properties
+            })
+    return features
+
+
+_features = (None, [])
+_features_lock = threading.Lock()
+
+
+def cached_incident_features(incidents):
+    """Same as incident_features, converting the incidents only once while
+    the upstream client returns the same cached ones."""
+    global _features
+    with _features_lock:
+        if _features[0] is incidents:
+            return _features[1]
+    features = incident_features(incidents)
+    with _features_lock:
+        _features = (incidents, features)
+    return features
+
+
+def filter_features(features, bbox=None, types=None):
+    """Returns the features within a bounding box and of some types.
+
+    :param features: GeoJSON point features.
+    :type features: dict[]
+    :param bbox: min_lng, min_lat, max_lng, max_lat.
+    :type bbox: tuple(float, float, float, float)
+    :param types: the incident types to keep.
+    :type types: set
+    :rtype: dict[]
+
+    """
+    if bbox is not None:
+        min_lng, min_lat, max_lng, max_lat = bbox
+        features = [
+            f for f in features
+            if min_lng <= f['geometry']['coordinates'][0] <= max_lng and
+            min_lat <= f['geometry']['coordinates'][1] <= max_lat
+        ]
+    if types:
+        features = [f for f in features if f['properties']['type'] in types]
+    return features
@@ -0,0 +1,216 @@
+import operator
+from functools import reduce
+from django.db import connections, router
+from django.db.models import AutoField, Q
+
+
+def chunked(iterable, size):
+    """Yields lists of at most *size* items from *iterable*.
+
+    :param iterable: the items to split.
+    :type iterable: iterable
+    :param size: maximum number of items per chunk.
+    :type size: int
+    :rtype: generator
+
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _lookup_key(model, lookup):
+    opts = model._meta
+    return tuple(sorted(
+        (name, opts.get_field(name).to_python(value))
+        for name, value in lookup.items()
+    ))
+
+
+def bulk_upsert(
+        model, objs, unique_fields, update_fields, coalesce_fields=(),
+        using=None):
+    """Inserts or updates a list of unsaved model instances with a single
+    ``INSERT ... ON CONFLICT (unique_fields) DO UPDATE`` statement.
+
+    The primary key returned by the database is set back on each instance.
+    Models may define a ``pre_bulk_save`` method to fill in the fields that
+    their ``save`` method would normally derive.
+
+    .. note:: the *unique_fields* values must be unique within *objs* and not
+        null, otherwise PostgreSQL cannot match the conflicting rows.
+
+    :param model: the model class of the instances.
+    :type model: django.db.models.Model
+    :param objs: the instances to write.
+    :type objs: django.db.models.Model[]
+    :param unique_fields: field names (or attnames) of the conflict target.
+    :type unique_fields: string[]
+    :param update_fields: field names (or attnames) to overwrite on conflict.
+    :type update_fields: string[]
+    :param coalesce_fields: field names (or attnames) to overwrite on conflict
+        only with the non null values, keeping the stored ones otherwise.
+    :type coalesce_fields: string[]
+    :param using: database alias, defaults to the model's write database.
+    :type using: string
+    :rtype: django.db.models.Model[]
+
+    """
+    if not objs:
+        return objs
+
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    opts = model._meta
+    fields = [
+        f for f in opts.concrete_fields if not isinstance(f, AutoField)]
+    conflict_columns = [opts.get_field(f).column for f in unique_fields]
+    update_columns = [opts.get_field(f).column for f in update_fields]
+    coalesce_columns = [opts.get_field(f).column for f in coalesce_fields]
+    if not update_columns and not coalesce_columns:
+        # A no-op update, so that RETURNING also yields the existing rows
+        update_columns = conflict_columns[:1]
+
+    sql = (
+        'INSERT INTO {table} ({columns}) VALUES {values} '
+        'ON CONFLICT ({conflict}) DO UPDATE SET {update} '
+        'RETURNING {pk}'.format(
+            table=qn(opts.db_table),
+            columns=', '.join(qn(f.column) for f in fields),
+            values=', '.join(
+                ['({})'.format(', '.join(['%s'] * len(fields)))] * len(objs)),
+            conflict=', '.join(qn(c) for c in conflict_columns),
+            update=', '.join(
+                ['{0} = EXCLUDED.{0}'.format(qn(c)) for c in update_columns] +
+                ['{0} = COALESCE(EXCLUDED.{0}, {1}.{0})'.format(
+                    qn(c), qn(opts.db_table)) for c in coalesce_columns]),
+            pk=qn(opts.pk.column)
+        )
+    )
+    params = []
+    for obj in objs:
+        if hasattr(obj, 'pre_bulk_save'):
+            obj.pre_bulk_save()
+        params.extend(
+            f.get_db_prep_save(f.pre_save(obj, True), connection)
+            for f in fields
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        pks = [row[0] for row in cursor.fetchall()]
+
+    for obj, pk in zip(objs, pks):
+        obj.pk = pk
+        obj._state.adding = False
+        obj._state.db = using
+    return objs
+
+
+def bulk_get_or_create(model, lookups, using=None):
+    """Bulk version of ``get_or_create``: fetches the rows matching every
+    lookup with one query and creates the missing ones with one
+    ``bulk_create``.
+
+    :param model: the model class to query.
+    :type model: django.db.models.Model
+    :param lookups: exact field (or attname) values, one dict per object.
+    :type lookups: dict[]
+    :param using: database alias, defaults to the model's write database.
+    :type using: string
+    :rtype: django.db.models.Model[]
+
+    Returns:
+        objs (django.db.models.Model[]): one instance per lookup, in the same
+        order as *lookups*.
+
+    """
+    if not lookups:
+        return []
+
+    using = using or router.db_for_write(model)
+    distinct = {}
+    for lookup in lookups:
+        distinct.setdefault(_lookup_key(model, lookup), lookup)
+
+    query = reduce(operator.or_, [Q(**l) for l in distinct.values()])
+    name_sets = {tuple(sorted(l)) for l in distinct.values()}
+    found = {}
+    for obj in model.objects.using(using).filter(query):
+        for names in name_sets:
+            key = _lookup_key(model, {n: getattr(obj, n) for n in names})
+            if key in distinct:
+                found.setdefault(key, obj)
+
+    missing = [(k, l) for k, l in distinct.items() if k not in found]
+    if missing:
+        created = model.objects.using(using).bulk_create(
+            [model(**l) for k, l in missing])
+        for (key, lookup), obj in zip(missing, created):
+            found[key] = obj
+
+    return [found[_lookup_key(model, lookup)] for lookup in lookups]
+
+
+def bulk_add_m2m(m2m_descriptor, links, using=None):
+    """Bulk version of the related manager ``add`` method for many source
+    objects at once. Only the missing links are inserted, and targets that
+    do not exist in the database are skipped instead of raising an
+    ``IntegrityError``.
+
+    :param m2m_descriptor: the many-to-many class attribute (e.g.
+        ``Monitor.sites``).
+    :type m2m_descriptor: ManyToManyDescriptor
+    :param links: (source, targets) tuples, targets being instances or
+        primary keys.
+    :type links: tuple[]
+    :param using: database alias, defaults to the through model's write
+        database.
+    :type using: string
+    :rtype: tuple
+
+    Returns:
+        (created, skipped) (tuple): the number of links inserted and the
+        target primary keys that do not exist.
+
+    """
+    field = m2m_descriptor.field
+    through = m2m_descriptor.through
+    target_model = field.remote_field.model
+    using = using or router.db_for_write(through)
+    source_attname = through._meta.get_field(field.m2m_field_name()).attname
+    target_attname = through._meta.get_field(
+        field.m2m_reverse_field_name()).attname
+    target_pk = target_model._meta.pk
+
+    pairs = set()
+    for source, targets in links:
+        for target in targets:
+            pairs.add((
+                source.pk, target_pk.to_python(getattr(target, 'pk', target))
+            ))
+    if not pairs:
+        return 0, []
+
+    target_ids = {t for s, t in pairs}
+    existing_targets = set(target_model.objects.using(using).filter(
+        pk__in=target_ids).values_list('pk', flat=True))
+    existing_pairs = set(through.objects.using(using).filter(**{
+        source_attname + '__in': {s for s, t in pairs}
+    }).values_list(source_attname, target_attname))
+
+    new_pairs = [
+        (s, t) for s, t in pairs
+        if t in existing_targets and (s, t) not in existing_pairs
+    ]
+    through.objects.using(using).bulk_create([
+        through(**{source_attname: s, target_attname: t})
+        for s, t in new_pairs
+    ])
+    return len(new_pairs), sorted(target_ids - existing_targets)
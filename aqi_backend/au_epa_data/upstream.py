@@ -0,0 +1,144 @@
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError
+
+import requests
+from requests.adapters import HTTPAdapter
+from rest_framework.exceptions import APIException
+
+from .constants import (
+    AU_VIC_URL_MAP, UPSTREAM_CACHE_SIZE, UPSTREAM_POOL_SIZE, UPSTREAM_TIMEOUT,
+    UPSTREAM_TIMEOUTS, UPSTREAM_TTLS, UPSTREAM_WAIT_TIMEOUT)
+
+
+class UpstreamUnavailable(APIException):
+    status_code = 503
+    default_detail = 'The upstream service is unavailable, try again later.'
+    default_code = 'upstream_unavailable'
+
+
+def json_response(r):
+    """Decodes a JSON response."""
+    return r.json()
+
+
+class UpstreamClient(object):
+    """
+    Fetches the data of the upstreams of the live proxies (AirWatch,
+    VicEmergency, VicRoads, Weatherbit) through a pooled keep-alive session,
+    with the timeout of each upstream. The parsed responses are cached for
+    the TTL of their upstream, and the concurrent requests of the same data
+    wait for a single upstream fetch instead of making their own.
+
+        >>> sites = client.fetch(SITE_WITH_MEASUREMENTS, url=url)
+
+    """
+
+    def __init__(
+            self, pool_size=UPSTREAM_POOL_SIZE,
+            cache_size=UPSTREAM_CACHE_SIZE):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(AU_VIC_URL_MAP), pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def fetch(
+            self, source, url=None, params=None, headers=None,
+            parse=json_response, stream=False, refresh=False):
+        """Returns the parsed response of an upstream, from the cache if it
+        was fetched less than its TTL ago.
+
+        :param source: the upstream, a key of AU_VIC_URL_MAP.
+        :type source: string
+        :param url: the URL to fetch, by default the one of the upstream.
+        :type url: string
+        :param params: the query parameters.
+        :type params: dict
+        :param headers: the request headers.
+        :type headers: dict
+        :param parse: turns the response into the data to cache, the JSON
+            document by default.
+        :type parse: function
+        :param stream: if to stream the response body, for parse to read.
+        :type stream: boolean
+        :param refresh: if to fetch it again even if it is cached.
+        :type refresh: boolean
+
+        Raises:
+            UpstreamUnavailable: if the request or the parsing failed, or the
+                request fetching the same data took longer than
+                UPSTREAM_WAIT_TIMEOUT.
+
+        """
+        if url is None:
+            url = OrderedDict(AU_VIC_URL_MAP)[source]
+        params = sorted((params or {}).items())
+        key = (source, url, tuple(params), parse)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if not refresh and cached is not None and \
+                    cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                return cached[1]
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            # Another request is already fetching the same data
+            try:
+                return future.result(UPSTREAM_WAIT_TIMEOUT)
+            except TimeoutError:
+                raise UpstreamUnavailable(
+                    '{0} is unavailable: timed out waiting for it.'.format(
+                        source))
+
+        try:
+            value = self._get(source, url, params, headers, parse, stream)
+        except BaseException as e:
+            # The waiting requests get the errors, but not the exits or
+            # interrupts of this thread
+            future.set_exception(
+                e if isinstance(e, Exception) else UpstreamUnavailable(
+                    '{0} is unavailable: the request was interrupted.'.format(
+                        source)))
+            raise
+        else:
+            with self._lock:
+                self._cache[key] = (
+                    time.monotonic() + UPSTREAM_TTLS.get(source, 0), value)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _get(self, source, url, params, headers, parse, stream):
+        try:
+            with self.session.get(
+                    url, params=params, headers=headers, stream=stream,
+                    timeout=UPSTREAM_TIMEOUTS.get(
+                        source, UPSTREAM_TIMEOUT)) as r:
+                r.raise_for_status()
+                return parse(r)
+        except (requests.RequestException, ValueError) as e:
+            raise UpstreamUnavailable(
+                '{0} is unavailable: {1}'.format(source, e))
+
+    def clear(self):
+        """Drops the cached responses."""
+        with self._lock:
+            self._cache.clear()
+
+
+client = UpstreamClient()
@@ -7,6 +7,7 @@ from .rest_views import (
     SitesProxy,
     SiteViewSet,
     VicEmergencyProxy,
+    VicRoadsGeoJSONProxy,
     VicRoadsLiveProxy
 )
 
@@ -25,6 +26,10 @@ urlpatterns = [
     re_path(
         r'^traffic$', VicRoadsLiveProxy.as_view(), name='traffic-proxy'
     ),
+    re_path(
+        r'^traffic/geojson$', VicRoadsGeoJSONProxy.as_view(),
+        name='traffic-geojson-proxy'
+    ),
     re_path(
         'sites-live', SitesProxy.as_view(), name='sites-proxy'
     ),
@@ -41,15 +41,18 @@ class AuthRouter:
 
 
 class EPADataRouter:
+    # The forecasts refer to the AirWatch sites, so they live with them
+    epa_apps = ['au_epa_data', 'forecasting']
+
     def db_for_read(self, model, **hints):
-        if model._meta.app_label == 'au_epa_data':
+        if model._meta.app_label in self.epa_apps:
             return 'au_epa_aqi'
         if model._meta.app_label == 'epa_data':
             return 'default'
         return None
 
     def db_for_write(self, model, **hints):
-        if model._meta.app_label == 'au_epa_data':
+        if model._meta.app_label in self.epa_apps:
             return 'au_epa_aqi'
         if model._meta.app_label == 'epa_data':
             return 'default'
@@ -67,7 +70,7 @@ class EPADataRouter:
         return None
 
     def allow_migrate(self, db, app_label, model_name=None, **hints):
-        if app_label == 'au_epa_data':
+        if app_label in self.epa_apps:
             return db == 'au_epa_aqi'
         if app_label == 'epa_data':
             return db == 'default'
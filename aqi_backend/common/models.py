@@ -1,8 +1,17 @@
+import threading
+import numpy as np
 from django.utils.translation import ugettext_lazy as _
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from ckeditor.fields import RichTextField
 from django.utils.safestring import mark_safe
 
+# Category thresholds of each (organization, pollutant), loaded once per
+# process and dropped when a threshold is saved or deleted
+_category_thresholds = {}
+_category_thresholds_lock = threading.Lock()
+
 
 class AQIOrganization(models.Model):
     abbreviation = models.CharField(
@@ -19,19 +28,60 @@ class AQIOrganization(models.Model):
     def __str__(self):
         return self.abbreviation
 
-    def get_categories(self, values, pollutant):
-        if self.abbreviation == 'AUEPA':
-            aqi_cats = self.aqi_category_thresholds.filter(
-                pollutant=pollutant,
+    @staticmethod
+    def category_thresholds(abbreviation, pollutant):
+        """ Returns the upper thresholds of the categories of a pollutant,
+        ordered by their lower threshold, as a non-decreasing array: each
+        value is the running maximum, so the first category whose upper
+        threshold is above a value is found by a binary search.
+
+        :rtype: tuple(numpy.array, numpy.array)
+
+        Returns:
+            (uppers, abbreviations): the thresholds and the abbreviation of
+            each category.
+        """
+        key = (abbreviation, pollutant)
+        with _category_thresholds_lock:
+            thresholds = _category_thresholds.get(key)
+        if thresholds is None:
+            categories = list(AQICategoryThreshold.objects.filter(
+                aqi_organization_id=abbreviation, pollutant=pollutant,
                 lower_threshold_value__isnull=False).order_by(
-                    'lower_threshold_value')
-
-            def get_cat(val):
-                for cat in aqi_cats:
-                    if val < cat.upper_threshold_value:
-                        return cat.abbreviation
+                    'lower_threshold_value').values_list(
+                        'upper_threshold_value', 'abbreviation'))
+            uppers = np.array(
+                [np.inf if u is None else u for u, a in categories],
+                dtype=float)
+            thresholds = (
+                np.maximum.accumulate(uppers) if len(uppers) else uppers,
+                np.array([a for u, a in categories] + [None], dtype=object))
+            with _category_thresholds_lock:
+                _category_thresholds[key] = thresholds
+        return thresholds
+
+    @classmethod
+    def categorize(cls, abbreviation, values, pollutant):
+        """ Labels each value with the abbreviation of the first category of
+        the pollutant, by lower threshold, whose upper threshold is above it,
+        None if there is none.
+
+        :param abbreviation: abbreviation of the AQI organization.
+        :type abbreviation: string
+        :param values: concentration levels of the pollutant.
+        :type values: numpy.array
+        :param pollutant: the pollutant (e.g., pm2.5).
+        :type pollutant: string
+        :rtype: numpy.array
+        """
+        uppers, abbreviations = cls.category_thresholds(
+            abbreviation, pollutant)
+        values = np.asarray(values, dtype=float)
+        return abbreviations[np.searchsorted(uppers, values, side='right')]
 
-            return map(get_cat, values)
+    def get_categories(self, values, pollutant):
+        if self.abbreviation == 'AUEPA':
+            return self.categorize(self.abbreviation, values, pollutant)
         return None
 
     class Meta:
@@ -111,6 +161,13 @@ class AQICategoryThreshold(models.Model):
         verbose_name_plural = _('AQI Category Thresholds')
 
 
+@receiver(post_save, sender=AQICategoryThreshold)
+@receiver(post_delete, sender=AQICategoryThreshold)
+def clear_category_thresholds(sender, **kwargs):
+    with _category_thresholds_lock:
+        _category_thresholds.clear()
+
+
 class Pollutant(models.Model):
     abbreviation = models.CharField(
         _("Abbrevation"), primary_key=True, max_length=5)
@@ -0,0 +1,23 @@
+import json
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Renders a list as newline delimited JSON, one item per line. Views that
+    stream their response check for `request.accepted_renderer.format ==
+    'ndjson'` and write the lines themselves.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, (list, tuple)):
+            data = [data]
+        return ''.join(
+            json.dumps(item, cls=JSONEncoder) + '\n' for item in data
+        ).encode(self.charset)
@@ -0,0 +1,29 @@
+def parse_bbox(value):
+    """Parses a min_lng,min_lat,max_lng,max_lat bounding box.
+
+    :rtype: tuple(float, float, float, float)
+
+    Raises:
+        ValueError: if it is not four numbers with the minimums first.
+
+    """
+    bbox = tuple(float(v) for v in value.split(','))
+    if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+        raise ValueError(
+            'Expected min_lng,min_lat,max_lng,max_lat: {0}'.format(value))
+    return bbox
+
+
+def round_coordinates(coordinates, decimals):
+    """Rounds the (nested) coordinates of a GeoJSON geometry.
+
+    :param coordinates: a position or a list of positions, at any depth.
+    :type coordinates: list
+    :param decimals: number of decimals to keep.
+    :type decimals: int
+    :rtype: list
+
+    """
+    if coordinates and isinstance(coordinates[0], (list, tuple)):
+        return [round_coordinates(c, decimals) for c in coordinates]
+    return [round(c, decimals) for c in coordinates]
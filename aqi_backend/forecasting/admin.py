@@ -1,3 +1,13 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import Forecast
+
+
+class ForecastAdmin(admin.ModelAdmin):
+    list_display = (
+        'site', 'pollutant', 'issued_at', 'horizon', 'date_time', 'value',
+        'aqi_category', 'model_version', )
+    list_filter = ('site', 'pollutant', 'model_version', )
+
+
+admin.site.register(Forecast, ForecastAdmin)
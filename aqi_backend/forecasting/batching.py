@@ -0,0 +1,106 @@
+import time
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError
+
+import numpy as np
+
+from .constants import FORECAST_BATCH_MAX_SIZE, FORECAST_BATCH_MAX_WAIT
+
+
+class PredictionBatcher(object):
+    """
+    Gathers the predictions requested at the same time, e.g. by concurrent
+    requests, into a single predict call per model: a background thread waits
+    up to *max_wait* seconds after the first request for others, up to
+    *max_batch_size* requests, then runs each model once on all their inputs.
+
+        >>> future = batcher.submit(model, X)
+        >>> yhat = future.result(timeout=0.5)
+
+    """
+
+    def __init__(
+            self, max_batch_size=FORECAST_BATCH_MAX_SIZE,
+            max_wait=FORECAST_BATCH_MAX_WAIT):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, model, X):
+        """Queues the [samples, timesteps, features] input *X* for *model*,
+        anything with a predict method (see registry.RegisteredModel).
+
+        :rtype: concurrent.futures.Future
+
+        Returns:
+            future: resolves to the predictions for the samples of X.
+
+        """
+        future = Future()
+        self._queue.put((model, X, future))
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='prediction-batcher')
+                self._thread.daemon = True
+                self._thread.start()
+        return future
+
+    def predict(self, model, X, timeout=None):
+        """Same as submit, waiting up to *timeout* seconds for the result.
+        On timeout the request is cancelled, so it is dropped from its batch
+        if the model did not start running it.
+
+        Raises:
+            concurrent.futures.TimeoutError: if the predictions are not ready
+                in time.
+
+        """
+        future = self.submit(model, X)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            requests = OrderedDict()
+            for model, X, future in self._next_batch():
+                # Skip the requests given up by their callers
+                if future.set_running_or_notify_cancel():
+                    requests.setdefault(id(model), (model, []))[1].append(
+                        (X, future))
+
+            for model, inputs in requests.values():
+                try:
+                    yhat = model.predict(
+                        np.concatenate([X for X, future in inputs]))
+                except Exception as e:
+                    for X, future in inputs:
+                        future.set_exception(e)
+                    continue
+                start = 0
+                for X, future in inputs:
+                    future.set_result(yhat[start:start + len(X)])
+                    start += len(X)
+
+
+batcher = PredictionBatcher()
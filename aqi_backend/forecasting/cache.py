@@ -0,0 +1,36 @@
+import hashlib
+from django.core.cache import caches
+from rest_framework.renderers import JSONRenderer
+
+from .constants import EXPERIMENTS_CACHE
+
+
+def get_cached_json(key, build_data):
+    """Returns the JSON serialization of some data from the experiments cache,
+    building and storing it on a miss.
+
+    :param key: the cache key of the data.
+    :type key: string
+    :param build_data: returns the data to serialize.
+    :type build_data: function
+    :rtype: tuple(bytes, string)
+
+    Returns:
+        (content, etag): the serialized data and its entity tag.
+
+    """
+    cache = caches[EXPERIMENTS_CACHE]
+    cached = cache.get(key)
+    if cached is None:
+        content = JSONRenderer().render(build_data())
+        cached = (content, '"{0}"'.format(hashlib.md5(content).hexdigest()))
+        cache.set(key, cached)
+    return cached
+
+
+def invalidate_experimental_data():
+    """Drops the cached experiments data, to be called after importing
+    measurements, traffic flows or fires.
+
+    """
+    caches[EXPERIMENTS_CACHE].clear()
@@ -0,0 +1,121 @@
+import os
+import json
+from keras.callbacks import Callback, EarlyStopping
+from keras.models import load_model
+
+from .constants import CHECKPOINT_PERIOD
+
+CHECKPOINT_MODEL_FILE = 'checkpoint.h5'
+CHECKPOINT_STATE_FILE = 'checkpoint.json'
+
+
+class TrainingCheckpoint(Callback):
+    """
+    Saves the model, with its optimizer state, every *period* epochs and at
+    the end of the training, together with the number of epochs run and the
+    loss history, so an interrupted training can be resumed (see
+    resume_checkpoint).
+    """
+
+    def __init__(self, checkpoint_dir, period=CHECKPOINT_PERIOD):
+        super(TrainingCheckpoint, self).__init__()
+        self.checkpoint_dir = checkpoint_dir
+        self.period = period
+        self.history = {}
+        self.epoch = 0
+
+    def on_train_begin(self, logs=None):
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        state = read_checkpoint_state(self.checkpoint_dir)
+        if state is not None:
+            self.history = state['history']
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.epoch = epoch + 1
+        for k, v in (logs or {}).items():
+            self.history.setdefault(k, []).append(float(v))
+        if self.epoch % self.period == 0:
+            self.save()
+
+    def on_train_end(self, logs=None):
+        if self.epoch:
+            self.save()
+
+    def save(self):
+        model_file = os.path.join(self.checkpoint_dir, CHECKPOINT_MODEL_FILE)
+        state_file = os.path.join(self.checkpoint_dir, CHECKPOINT_STATE_FILE)
+        # The state is written last, a checkpoint without it is incomplete
+        self.model.save(model_file + '.tmp')
+        os.replace(model_file + '.tmp', model_file)
+        with open(state_file + '.tmp', 'w') as f:
+            json.dump({'epoch': self.epoch, 'history': self.history}, f)
+        os.replace(state_file + '.tmp', state_file)
+
+
+class EpochCounter(Callback):
+    """Counts the epochs actually run, which early stopping may cut."""
+
+    def on_train_begin(self, logs=None):
+        self.epochs = 0
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.epochs = epoch + 1
+
+
+def read_checkpoint_state(checkpoint_dir):
+    """Returns the state of the last checkpoint saved to a directory, None
+    if there is none.
+
+    :rtype: dict
+
+    """
+    try:
+        with open(os.path.join(checkpoint_dir, CHECKPOINT_STATE_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def resume_checkpoint(checkpoint_dir):
+    """Loads the model of the last checkpoint saved to a directory.
+
+    :param checkpoint_dir: the directory of the checkpoints.
+    :type checkpoint_dir: string
+    :rtype: tuple(keras.models.Model, int)
+
+    Returns:
+        (model, initial_epoch): the model and the number of epochs it was
+        trained for, (None, 0) if there is no checkpoint.
+
+    """
+    state = read_checkpoint_state(checkpoint_dir)
+    if state is None:
+        return None, 0
+    model = load_model(os.path.join(checkpoint_dir, CHECKPOINT_MODEL_FILE))
+    return model, state['epoch']
+
+
+def training_callbacks(
+        patience=None, checkpoint_dir=None, period=CHECKPOINT_PERIOD):
+    """Builds the callbacks of a training: early stopping on the validation
+    loss, restoring the best weights, if *patience* is given, and
+    checkpoints to *checkpoint_dir* if given.
+
+    :param patience: number of epochs without improvement of the validation
+        loss to stop after.
+    :type patience: int
+    :param checkpoint_dir: the directory to save the checkpoints to.
+    :type checkpoint_dir: string
+    :param period: number of epochs between checkpoints.
+    :type period: int
+    :rtype: keras.callbacks.Callback[]
+
+    """
+    callbacks = []
+    if patience is not None:
+        callbacks.append(EarlyStopping(
+            monitor='val_loss', patience=patience,
+            restore_best_weights=True, verbose=1))
+    if checkpoint_dir is not None:
+        callbacks.append(TrainingCheckpoint(checkpoint_dir, period))
+    return callbacks
@@ -26,11 +26,23 @@ MODELS_DATA_DIR = os.path.abspath(
         os.path.dirname(__file__), 'data', 'models'),
 )
 
+MODELS_REGISTRY_DIR = os.path.join(MODELS_DATA_DIR, 'registry')
+
 FORECASTS_DATA_DIR = os.path.abspath(
     os.path.join(
         os.path.dirname(__file__), 'data', 'forecasts'),
 )
 
+SWEEPS_DATA_DIR = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), 'data', 'sweeps'),
+)
+
+ARRAYS_DATA_DIR = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), 'data', 'arrays'),
+)
+
 HISTORICAL_DATA_FILE = os.path.abspath(
     os.path.join(
         os.path.dirname(__file__), 'data', 'json',
@@ -165,6 +177,9 @@ FIRE_SITUATIONS_RADIUS = {
 
 FIRES_TITLE_PREFIX = 'FIRES'
 
+# Number of buffered site locations kept in memory by Site.get_fire_areas
+FIRE_AREAS_CACHE_SIZE = 512
+
 # Fire incidents distance to station for it to be relevant (in metres)
 FIRE_SITUATION_STATION_RADIUS = {
     # ALPHINGTON (in city)
@@ -176,3 +191,45 @@ FIRE_SITUATION_STATION_RADIUS = {
     # TRARALGON (countryside)
     '10011': 100 * 1000
 }
+
+# Cache of the serialized experiments data (see settings.CACHES), cleared on
+# every measurements, traffic flows and fires import
+EXPERIMENTS_CACHE = 'experiments'
+EXPERIMENTS_MAP_DATA_KEY = 'map-data:{0:%Y%m%d%H}:{1:%Y%m%d%H}'
+
+# Number of registered models kept loaded by each process
+MODELS_CACHE_SIZE = 8
+
+# Epochs between the checkpoints of a training (see forecasting.callbacks)
+CHECKPOINT_PERIOD = 5
+
+# Registry target of the models predicting several pollutants at once
+MULTI_OUTPUT_TARGET = 'multi'
+
+# Online forecasts: the predictions requested within FORECAST_BATCH_MAX_WAIT
+# seconds are run together, and a request waits FORECAST_LATENCY_BUDGET
+# seconds at most
+FORECAST_BATCH_MAX_SIZE = 32
+FORECAST_BATCH_MAX_WAIT = 0.005
+FORECAST_LATENCY_BUDGET = 1.0
+
+# Rows read at once when writing and scanning the memory-mapped series of
+# forecasting.pipeline
+PIPELINE_CHUNK_SIZE = 8760
+
+# Hours that a precompute_forecasts run catches up at most
+FORECAST_PRECOMPUTE_HOURS = 24
+# Seconds after which the last precomputed forecasts are not served anymore.
+# They are issued at the last measured hour, up to two hours old between the
+# hourly runs
+FORECAST_MAX_AGE = 3 * 60 * 60
+
+# Hyperparameters of the forecasting.sweep trials, and their default value
+SWEEP_PARAMS = (
+    ('epochs', 100),
+    ('neurons', 50),
+    ('batch_size', 24),
+    ('n_input', 24),
+    ('columns', None),
+)
+SWEEP_METRICS = ('mae', 'rmse', 'precision', 'recall', 'correlation')
@@ -23,73 +23,67 @@ from keras.layers import LSTM
 from au_epa_data.constants import DATETIME_FORMAT
 from common.models import AQIOrganization
 from .constants import (
-    FIGS_DATA_DIR, FORECASTABLE_POLLUTANTS, MODELS_DATA_DIR,
-    FORECASTS_DATA_DIR)
+    AQ_DATA_DIR, FIGS_DATA_DIR, FORECASTABLE_POLLUTANTS, MODELS_DATA_DIR,
+    FORECASTS_DATA_DIR, MULTI_OUTPUT_TARGET, SITES_MONITORS, SWEEPS_DATA_DIR)
+from . import callbacks, pipeline, registry, sweep
 from .utils import get_time_series, get_file_name
+from .windowing import (
+    multi_output_windows, split_windows, supervised_windows, target_position)
 
 
-def _series_to_supervised(data, n_in=1, n_out=1, dropnan=True):
-    """ Convert a series to a supervised learning format for algorithm input.
-
-    Parameters:
-        data (list or numpy.array): pollutants time series values.
-        n_in (int): number of previous time lags to consider for prediction.
-        n_out (int): number of next time lags to output for prediction.
-
-    Returns:
-        agg (str1):The string which gets reversed. 
-    
-    """
-    n_vars = 1 if type(data) is list else data.shape[1]
-    df = pd.DataFrame(data)
-    cols, names = list(), list()
-    # input sequence (t-n, ... t-1)
-    for i in range(n_in, 0, -1):
-        cols.append(df.shift(i))
-        names += [('var%d(t-%d)' % (j + 1, i)) for j in range(n_vars)]
-    # forecast sequence (t, t+1, ... t+n)
-    for i in range(0, n_out):
-        cols.append(df.shift(-i))
-        if i == 0:
-            names += [('var%d(t)' % (j + 1)) for j in range(n_vars)]
-        else:
-            names += [('var%d(t+%d)' % (j + 1, i)) for j in range(n_vars)]
-    # put it all together
-    agg = pd.concat(cols, axis=1)
-    agg.columns = names
-    # drop rows with NaN values
-    if dropnan:
-        agg.dropna(inplace=True)
-    return agg
-
-
-def _normalize(values):
+def _normalize(values, scaler=None):
     """ Normalise a set of values to a range between 0 and 1.
 
     Parameters:
         values (numpy.array): pollutants time series values.
+        scaler (MinMaxScaler): an already fitted scaler to use, e.g. the one
+            of a registered model.
 
     Returns:
         scaler (MinMaxScaler): the sklearn scaler with the loaded values.
         scaled (numpy.array): the scaled (normalised) values.
     
     """
+    if scaler is not None:
+        return scaler, scaler.transform(values)
     scaler = MinMaxScaler(feature_range=(0, 1))
     scaled = scaler.fit_transform(values)
     return scaler, scaled
 
 
-def _prepare_time_series(dataset, predict_col, n_input, n_output):
-    """ Split dataset into training and test set.
+def _ask_predict_col(col_num):
+    """ Prompts the user for the index of the column to be predicted.
 
     Parameters:
-        reframed (pd.DataFrame): normalised pollutants time series values.
-        n_train_hours (int): number of hours to consider as training data.
-        n_features (int): number of variables.
+        col_num (int): number of columns of the dataset.
+
+    Returns:
+        predict_col (int): index of the column, 1 if the input is invalid.
+
+    """
+    try:
+        return int(input(
+            'Enter the variable to predict, a value between 1'
+            ' and {}: '.format(col_num)))
+    except ValueError:
+        return 1
+
+
+def _prepare_time_series(
+        dataset, predict_col, n_input, n_output, scaler=None):
+    """ Normalise the dataset and frame it for supervised learning.
+
+    Parameters:
+        dataset (pd.DataFrame): pollutants time series values.
+        predict_col (int): index of the column to be predicted.
         n_input (int): number of previous time lags to consider.
+        n_output (int): number of next time lags to output.
+        scaler (sklearn.MinMaxScaler): an already fitted scaler, by default
+            one is fitted on the dataset.
 
     Returns:
-        reframed (pd.DataFrame): the normalized and prepared dataset.
+        X (np.array): the [samples, timesteps, features] input data.
+        y (np.array): the value to predict for each sample.
         scaler (sklearn.MinMaxScaler): the scaler with loaded values.
         predict_col_name (string): the name of the column to be predicted. 
     
@@ -104,72 +98,42 @@ def _prepare_time_series(dataset, predict_col, n_input, n_output):
     # # ensure all data is float
     values = values.astype('float32')
     # # normalize features
-    scaler, scaled = _normalize(values)
-    # frame as supervised learning
-    reframed = _series_to_supervised(scaled, n_input, n_output)
+    scaler, scaled = _normalize(values, scaler)
     # if we want the user to be prompted for the colum to be predicted
     if predict_col == 'manual':
-        try:
-            predict_col = int(input(
-                'Enter the variable to predict, a value between 1'
-                ' and {}: '.format(col_num)))
-        except ValueError:
-            predict_col = 1
-
-    # drop columns we don't want to predict
-    predict_col_name = dataset.columns[predict_col - 1]
-    reframed_col_num = len(reframed.columns)
-    output_start = n_input * col_num
-    if predict_col is None or predict_col <= 1:
-        drop_cols = list(range(output_start + 1, reframed_col_num))
-    elif predict_col >= col_num:
-        drop_cols = list(range(output_start, reframed_col_num - 1))
-    else:
-        drop_cols = list(
-            range(output_start, output_start + (predict_col - 1))) + list(
-            range(output_start + predict_col, reframed_col_num))
+        predict_col = _ask_predict_col(col_num)
 
-    reframed.drop(reframed.columns[drop_cols], axis=1, inplace=True)
-    print(reframed.head())
-    print(reframed.shape)
+    # frame as supervised learning, keeping only the column to predict
+    predict_col_name = dataset.columns[predict_col - 1]
+    X, y = supervised_windows(
+        scaled, n_input, n_output,
+        *target_position(predict_col, col_num, n_output))
+    print(X.shape, y.shape)
 
-    return reframed, scaler, predict_col_name
+    return X, y, scaler, predict_col_name
 
 
-def _split_dataset(reframed, n_train_hours, n_features, n_input):
+def _split_dataset(X, y, n_train_hours):
     """ Split dataset into training and test set.
 
     Parameters:
-        reframed (pd.DataFrame): normalised pollutants time series values.
+        X (np.array): the [samples, timesteps, features] input data.
+        y (np.array): the value to predict for each sample.
         n_train_hours (int): number of hours to consider as training data.
-        n_features (int): number of variables.
-        n_input (int): number of previous time lags to consider.
 
     Returns:
         train_X (np.array): training X data.
         train_y (np.array): training y data.
         test_X (np.array): test X data.
         test_y (np.array): test y data.
-        raw_train (np.array): raw split training data.
-        raw_train (np.array): raw split test data.
     
     """
-    # split into train and test sets
-    values = reframed.values
-    raw_train = values[:n_train_hours, :]
-    raw_test = values[n_train_hours:, :]
-    print('# Training Rows', len(raw_train[:, 0]))
-    print('# Test Rows', len(raw_test[:, 0]))
-    # split into input and outputs
-    n_obs = n_input * n_features
-    train_X, train_y = raw_train[:, :n_obs], raw_train[:, -1]
-    test_X, test_y = raw_test[:, :n_obs], raw_test[:, -1]
-    # reshape input to be 3D [samples, timesteps, features]
-    train_X = train_X.reshape((train_X.shape[0], n_input, n_features))
-    test_X = test_X.reshape((test_X.shape[0], n_input, n_features))
+    train_X, train_y, test_X, test_y = split_windows(X, y, n_train_hours)
+    print('# Training Rows', len(train_y))
+    print('# Test Rows', len(test_y))
     print(train_X.shape, train_y.shape, test_X.shape, test_y.shape)
 
-    return train_X, train_y, test_X, test_y, raw_train, raw_test
+    return train_X, train_y, test_X, test_y
 
 
 def _print_validation_data(train_stats, val_stats):
@@ -189,18 +153,25 @@ def _print_validation_data(train_stats, val_stats):
 
 
 def _fit_model(
-        train_X, train_y, test_X, test_y, epochs, n_neurons, batch_size):
+        train_X, train_y, test_X, test_y, epochs, n_neurons, batch_size,
+        patience=None, checkpoint_dir=None, resume=False):
     """ Fit the Keras LSTM model with the training and test data and
     meta-parameters. Also prints the validation performance
 
     Parameters:
         train_X (np.array): training X data.
-        train_y (np.array): training y data.
+        train_y (np.array): training y data, with a column per output for
+            the multi-output models.
         test_X (np.array): test X data.
         test_y (np.array): test y data.
         epochs (int): number of times to run the model.
         n_neurons (int): number of neurons for the LSTM hidden layer.
         batch_size (int): size of values pero run batch.
+        patience (int): epochs without improvement of the validation loss
+            to stop after, None to run all the epochs.
+        checkpoint_dir (string): directory to save checkpoints to.
+        resume (boolean): if to continue from the last checkpoint of
+            checkpoint_dir.
 
     Returns:
         model (Keras-model): the model on the finished training state.
@@ -218,19 +189,27 @@ def _fit_model(
         'accuracy': pd.DataFrame()
     }
 
-    model = Sequential()
-    model.add(LSTM(
-        n_neurons, input_shape=(train_X.shape[1], train_X.shape[2])))
-    model.add(Dense(1))
-    model.compile(loss='mae', optimizer='adam')
+    model, initial_epoch = None, 0
+    if resume and checkpoint_dir is not None:
+        model, initial_epoch = callbacks.resume_checkpoint(checkpoint_dir)
+        print('Resuming training from epoch {}.'.format(initial_epoch))
+    if model is None:
+        model = Sequential()
+        model.add(LSTM(
+            n_neurons, input_shape=(train_X.shape[1], train_X.shape[2])))
+        # one output per target and horizon for the multi-output models
+        model.add(Dense(1 if train_y.ndim == 1 else train_y.shape[1]))
+        model.compile(loss='mae', optimizer='adam')
     # fit network
     history = model.fit(
         train_X, train_y, epochs=epochs, batch_size=batch_size,
         # validation_data=(test_X, test_y), verbose=2, shuffle=False)
-        validation_split=0.33, verbose=2, shuffle=False)
+        validation_split=0.33, verbose=2, shuffle=False,
+        initial_epoch=initial_epoch,
+        callbacks=callbacks.training_callbacks(patience, checkpoint_dir))
     # loss history
-    train_stats['loss'] = history.history['loss']
-    val_stats['loss'] = history.history['val_loss']
+    train_stats['loss'] = history.history.get('loss', [])
+    val_stats['loss'] = history.history.get('val_loss', [])
 
     _print_validation_data(train_stats, val_stats)
     return model
@@ -238,7 +217,7 @@ def _fit_model(
 
 def _fit_model_experiments(
         train_X, train_y, test_X, test_y, epochs, n_neurons, batch_size,
-        scaler, n_input, n_features, predict_col_name):
+        scaler, n_input, n_features, predict_col_name, patience=None):
     """ A more controlable version of the _fit_model function, to gain more
     insights on the correct selection of hyperparameters. Evaluates the model
     after each epoch.
@@ -255,9 +234,12 @@ def _fit_model_experiments(
         n_input (int): number of previous time_lags considered.
         n_features (int): number of variables considered.
         predict_col_name (string): name of the column to be predicted.
+        patience (int): epochs without improvement of the validation loss
+            to stop after, None to run all the epochs.
 
     Returns:
-        train_stats, test_stats: the statistics for the training and test runs.
+        train_stats, test_stats: the statistics for the training and test runs,
+            with the loss history and the number of epochs run.
     
     """    
 
@@ -266,6 +248,8 @@ def _fit_model_experiments(
     # design network
     train_stats = {
         'forecasts': [],
+        'loss': [],
+        'epochs': 0,
         'mae': 0,
         'rmse': 0,
         'precision': 0,
@@ -274,6 +258,7 @@ def _fit_model_experiments(
     }
     test_stats = {
         'forecasts': [],
+        'loss': [],
         'mae': 0,
         'rmse': 0,
         'precision': 0,
@@ -286,13 +271,16 @@ def _fit_model_experiments(
     model.add(Dense(1))
     model.compile(loss='mae', optimizer='adam', metrics=['accuracy'])
 
-    for i in range(epochs):
-        # fit network
-        model.fit(
-            train_X, train_y, epochs=1, batch_size=batch_size,
-            # validation_data=(test_X, test_y), verbose=2, shuffle=False)
-            validation_split=0.33, verbose=0, shuffle=False)
-        model.reset_states()
+    # fit network, the callbacks collect the loss of each epoch
+    epoch_counter = callbacks.EpochCounter()
+    history = model.fit(
+        train_X, train_y, epochs=epochs, batch_size=batch_size,
+        # validation_data=(test_X, test_y), verbose=2, shuffle=False)
+        validation_split=0.33, verbose=0, shuffle=False,
+        callbacks=[epoch_counter] + callbacks.training_callbacks(patience))
+    train_stats['loss'] = history.history['loss']
+    train_stats['epochs'] = epoch_counter.epochs
+    test_stats['loss'] = history.history['val_loss']
 
     y_actual, y_forecast, stats = _evaluate_model(
         model, n_features, n_input, train_X, train_y, scaler, batch_size,
@@ -397,6 +385,24 @@ def _evaluate_model(
     y_actual = scaler.inverse_transform(y_actual)
     y_actual = y_actual[:, 0]
     print(y_actual)
+
+    return y_actual, y_forecast, _prediction_stats(
+        y_actual, y_forecast, predict_col_name)
+
+
+def _prediction_stats(y_actual, y_forecast, predict_col_name):
+    """ Computes the statistics of the forecasted values of a column.
+
+    Parameters:
+        y_actual (numpy.array): original ground truth values.
+        y_forecast (numpy.array): forecasted values.
+        predict_col_name (string): name of the predicted column.
+
+    Returns:
+        stats (dict): rmse, mae and, for the forecastable pollutants,
+            correlation, precision and recall satistics for the prediction.
+
+    """
     # calculate RMSE
     stats = {}
     stats['rmse'] = sqrt(skmet.mean_squared_error(y_actual, y_forecast))
@@ -422,7 +428,52 @@ def _evaluate_model(
         stats['precision'] = precision
         stats['recall'] = recall
 
-    return y_actual, y_forecast, stats
+    return stats
+
+
+def _evaluate_multi_output(
+        model, test_X, test_Y, scaler, target_cols, targets, n_output):
+    """ Evaluates a multi-output model for every target and horizon.
+
+    Parameters:
+        model (Keras model): the model with the trained state.
+        test_X (np.array): test X data.
+        test_Y (np.array): test Y data, as framed by multi_output_windows.
+        scaler (sklearn.MinMaxScaler): scaler fitted on the dataset.
+        target_cols (int[]): indexes of the predicted columns.
+        targets (string[]): names of the predicted columns.
+        n_output (int): number of next time lags predicted.
+
+    Returns:
+        stats (pd.DataFrame): the mae, rmse, precision, recall and
+            correlation of each target and horizon.
+
+    """
+    scale = scaler.scale_[target_cols][:, np.newaxis]
+    min_ = scaler.min_[target_cols][:, np.newaxis]
+    # invert the scaling of all the outputs at once
+    y_actual = (test_Y.reshape(-1, len(targets), n_output) - min_) / scale
+    y_forecast = (
+        model.predict(test_X).reshape(-1, len(targets), n_output) - min_) / \
+        scale
+
+    rows = []
+    for i, target in enumerate(targets):
+        for j in range(n_output):
+            stats = _prediction_stats(
+                y_actual[:, i, j], y_forecast[:, i, j], target)
+            rows.append({
+                'target': target,
+                'horizon': j + 1,
+                'mae': stats['mae'],
+                'rmse': stats['rmse'],
+                'precision': stats.get('precision', {}).get('micro'),
+                'recall': stats.get('recall', {}).get('micro'),
+                'correlation': stats.get('correlation')
+            })
+    return pd.DataFrame(rows, columns=[
+        'target', 'horizon', 'mae', 'rmse', 'precision', 'recall',
+        'correlation'])
 
 
 def _print_prediction(
@@ -517,7 +568,8 @@ def run(
         file_name='10001_aq_series.csv', columns=None, predict_col='manual',
         train_prop=0.7, n_input=24, n_output=1, epochs=100, neurons=50,
         batch_size=24, load_from_file=None, save_model=False, evaluate=True,
-        save_prediction=False):
+        save_prediction=False, load_version=None, patience=None,
+        checkpoint=False, resume=False):
     """ Main function. Runs a training and forecast experiment with the given
     parameters.
 
@@ -542,13 +594,26 @@ def run(
     :param load_from_file: file path from which to load an already run Keras
         model from.
     :type load_from_file: string
-    :param save_model: if to save the model in a temporary file.
+    :param save_model: if to register the model, with its scaler, as a new
+        version of the model of the site and predicted column.
     :type save_model: boolean
     :param evaluate: if to produce an evaluation of the model after training.
     :type evaluate: boolean
     :param save_prediction: if to save the predicted vs. ground truth values in
         a file.
     :type save_prediction: int
+    :param load_version: version of the registered model of the site and
+        predicted column to use instead of training one, 'latest' for the
+        last one.
+    :type load_version: int
+    :param patience: epochs without improvement of the validation loss to
+        stop the training after, restoring the best weights.
+    :type patience: int
+    :param checkpoint: if to save checkpoints of the training to the
+        registry directory of the site and predicted column.
+    :type checkpoint: boolean
+    :param resume: if to continue the training from the last checkpoint.
+    :type resume: boolean
 
     """
 
@@ -559,24 +624,49 @@ def run(
     # n_train_hours = int(365 * 48 * train_prop)
     # neurons = round(
     #     n_train_hours / (neurons * (n_features * n_input + n_output)))
+    if predict_col == 'manual':
+        predict_col = _ask_predict_col(n_features)
+
+    site_id = file_name.split('_')[0]
+    registered = None
+    if load_version is not None:
+        # Registered model, with the scaler fitted on its training data
+        registered = registry.get_model(
+            site_id, dataset.columns[predict_col - 1],
+            None if load_version == 'latest' else load_version)
+        if registered.columns != list(dataset.columns) or \
+                registered.n_input != n_input:
+            raise ValueError(
+                '{} was trained with the columns {} and n_input={}.'.format(
+                    registered, registered.columns, registered.n_input))
 
     # Prepare dataset for supervised learning
-    reframed, scaler, predict_col_name = _prepare_time_series(
-        dataset, predict_col, n_input, n_output)
+    X, y, scaler, predict_col_name = _prepare_time_series(
+        dataset, predict_col, n_input, n_output,
+        registered.scaler if registered is not None else None)
 
     # Split dataset into training and test sets
-    train_X, train_y, test_X, test_y, raw_train, raw_test = _split_dataset(
-        reframed, n_train_hours, n_features, n_input)
+    train_X, train_y, test_X, test_y = _split_dataset(X, y, n_train_hours)
 
-    if load_from_file is None:
+    if registered is not None:
+        model = registered
+    elif load_from_file is None:
         # Fit to LSTM model
+        checkpoint_dir = None
+        if checkpoint or resume:
+            checkpoint_dir = registry.checkpoint_dir(
+                site_id, predict_col_name)
         model = _fit_model(
-            train_X, train_y, test_X, test_y, epochs, neurons, batch_size
+            train_X, train_y, test_X, test_y, epochs, neurons, batch_size,
+            patience, checkpoint_dir, resume
         )
         if save_model:
-            model_title = get_file_name(
-                file_name.split('_')[0], dataset.columns, 'model')
-            model.save(os.path.join(MODELS_DATA_DIR, model_title + '.h5'))
+            version = registry.register_model(
+                model, scaler, site_id, predict_col_name, dataset.columns,
+                n_input, n_output, predict_col, epochs=epochs,
+                neurons=neurons, batch_size=batch_size, train_prop=train_prop)
+            print('Registered {}/{} model version {}.'.format(
+                site_id, predict_col_name, version))
     else:
         # Load model from file
         # Be sure that the same variables are passed as when the model was
@@ -586,7 +676,7 @@ def run(
     # Statistical Eval
     if evaluate:
         fig_title = get_file_name(
-            file_name.split('_')[0], dataset.columns, '_'.join([
+            site_id, dataset.columns, '_'.join([
                 predict_col_name, 'prediction']))
         test_index = dataset.index[n_train_hours + n_input:]
         y_actual, y_forecast, stats = _evaluate_model(
@@ -620,14 +710,208 @@ def run(
             _print_prediction(test_index, y_actual, y_forecast, fig_title)
 
 
+def run_multi(
+        file_name='10001_aq_series.csv', columns=None, targets=None,
+        train_prop=0.7, n_input=24, n_output=24, epochs=100, neurons=50,
+        batch_size=24, save_model=False, evaluate=True, save_prediction=False,
+        patience=None, checkpoint=False, resume=False):
+    """ Trains a single model predicting the next *n_output* hours of several
+    pollutants of a site at once, instead of a model per pollutant and
+    horizon. All the targets share the input windows and the LSTM layer,
+    with an output per target and horizon.
+
+    :param file_name: CSV file from which to load the experiment data.
+    :type file_name: string
+    :param columns: the columns from the CSV file to include in the execution.
+    :type columns: string[]
+    :param targets: the columns to be predicted, by default the
+        FORECASTABLE_POLLUTANTS of the dataset.
+    :type targets: string[]
+    :param train_prop: percentage of dataset values to use as training set.
+    :type train_prop: float
+    :param n_input: number of previous time lags to consider in prediction.
+    :type n_input: int
+    :param n_output: number of future time lags to predict for each target.
+    :type n_output: int
+    :param epochs: number of iterations to run training phase.
+    :type epochs: int
+    :param neurons: number of neurons in the LSTM hidden layer.
+    :type neurons: int
+    :param batch_size: size of values per run to use in training.
+    :type batch_size: int
+    :param save_model: if to register the model as the multi-output model of
+        the site, used to forecast any of its targets.
+    :type save_model: boolean
+    :param evaluate: if to evaluate every target and horizon after training.
+    :type evaluate: boolean
+    :param save_prediction: if to save the evaluation to a file instead of
+        printing it.
+    :type save_prediction: boolean
+    :param patience: epochs without improvement of the validation loss to
+        stop the training after, restoring the best weights.
+    :type patience: int
+    :param checkpoint: if to save checkpoints of the training to the
+        registry directory of the multi-output model of the site.
+    :type checkpoint: boolean
+    :param resume: if to continue the training from the last checkpoint.
+    :type resume: boolean
+    :rtype: keras.models.Model
+
+    """
+    # Load dataset
+    dataset = get_time_series(file_name, columns)
+    columns = list(dataset.columns)
+    if targets is None:
+        targets = [c for c in columns if c in FORECASTABLE_POLLUTANTS]
+    unknown = [t for t in targets if t not in columns]
+    if not targets or unknown:
+        raise ValueError('Invalid targets {} for the columns {}.'.format(
+            unknown or targets, columns))
+    target_cols = [columns.index(t) for t in targets]
+    n_train_hours = int(len(dataset.index) * train_prop)
+
+    # Prepare dataset for supervised learning, all the targets at once
+    scaler, scaled = _normalize(dataset.values.astype('float32'))
+    X, Y = multi_output_windows(scaled, n_input, n_output, target_cols)
+    print(X.shape, Y.shape)
+    train_X, train_Y, test_X, test_Y = _split_dataset(X, Y, n_train_hours)
+
+    site_id = file_name.split('_')[0]
+    checkpoint_dir = None
+    if checkpoint or resume:
+        checkpoint_dir = registry.checkpoint_dir(site_id, MULTI_OUTPUT_TARGET)
+    model = _fit_model(
+        train_X, train_Y, test_X, test_Y, epochs, neurons, batch_size,
+        patience, checkpoint_dir, resume)
+
+    if save_model:
+        version = registry.register_model(
+            model, scaler, site_id, MULTI_OUTPUT_TARGET, columns, n_input,
+            n_output, None, targets=targets, epochs=epochs, neurons=neurons,
+            batch_size=batch_size, train_prop=train_prop)
+        print('Registered {}/{} model version {}.'.format(
+            site_id, MULTI_OUTPUT_TARGET, version))
+
+    # Statistical Eval
+    if evaluate:
+        stats = _evaluate_multi_output(
+            model, test_X, test_Y, scaler, target_cols, targets, n_output)
+        if save_prediction:
+            stats.to_csv(os.path.join(
+                FORECASTS_DATA_DIR, get_file_name(
+                    site_id, columns, 'multi_output') + 'METRICS.csv'),
+                index=False)
+        else:
+            print(stats.to_string(index=False))
+            print(stats.groupby('target')[['mae', 'rmse']].mean())
+    return model
+
+
+def run_pooled(
+        file_names=None, columns=None, predict_col=2, train_prop=0.7,
+        n_input=24, n_output=1, epochs=100, neurons=50, batch_size=24,
+        workers=4, max_queue_size=10, save_model=False, patience=None):
+    """ Trains a single model on the time series of several sites at once.
+    The series are memory-mapped and the windows are read lazily, batch by
+    batch, by parallel workers (see the pipeline module), so the windowed
+    dataset of all the sites is never in memory.
+
+    :param file_names: CSV files of the sites, by default the
+        <site>_aq_series.csv files of the SITES_MONITORS sites.
+    :type file_names: string[]
+    :param columns: the columns to include, by default the ones all the files
+        have.
+    :type columns: string[]
+    :param predict_col: index of column to be predicted.
+    :type predict_col: int
+    :param train_prop: percentage of the values of each site to use as
+        training set.
+    :type train_prop: float
+    :param n_input: number of previous time lags to consider in prediction.
+    :type n_input: int
+    :param n_output: number of future time lags to predict for pollutant.
+    :type n_output: int
+    :param epochs: number of iterations to run training phase.
+    :type epochs: int
+    :param neurons: number of neurons in the LSTM hidden layer.
+    :type neurons: int
+    :param batch_size: size of values per run to use in training.
+    :type batch_size: int
+    :param workers: number of threads preparing the batches.
+    :type workers: int
+    :param max_queue_size: number of batches prepared in advance.
+    :type max_queue_size: int
+    :param save_model: if to register the model as the one of the 'pooled'
+        site.
+    :type save_model: boolean
+    :param patience: epochs without improvement of the validation loss to
+        stop the training after, restoring the best weights.
+    :type patience: int
+    :rtype: keras.models.Model
+
+    """
+    if file_names is None:
+        file_names = [
+            '{}_aq_series.csv'.format(s) for s in SITES_MONITORS
+            if os.path.isfile(
+                os.path.join(AQ_DATA_DIR, '{}_aq_series.csv'.format(s)))]
+    if columns is None:
+        headers = [
+            pd.read_csv(os.path.join(AQ_DATA_DIR, f), nrows=0).columns
+            for f in file_names]
+        columns = [
+            c for c in headers[0] if c not in ('No', 'date') and
+            all(c in h for h in headers[1:])]
+    print('Pooling {} with the columns {}.'.format(file_names, columns))
+
+    arrays = [pipeline.series_array(f, columns) for f in file_names]
+    scaler = pipeline.fit_scaler(arrays)
+    target_col, target_lag = target_position(
+        predict_col, len(columns), n_output)
+    train_starts, test_starts = pipeline.split_starts(
+        pipeline.WindowSequence.window_starts(arrays, n_input, n_output),
+        train_prop)
+    train = pipeline.WindowSequence(
+        arrays, scaler, n_input, n_output, target_col, target_lag,
+        batch_size, starts=train_starts, shuffle=True)
+    test = pipeline.WindowSequence(
+        arrays, scaler, n_input, n_output, target_col, target_lag,
+        batch_size, starts=test_starts)
+
+    model = Sequential()
+    model.add(LSTM(neurons, input_shape=(n_input, len(columns))))
+    model.add(Dense(1))
+    model.compile(loss='mae', optimizer='adam')
+    history = model.fit_generator(
+        train, epochs=epochs, validation_data=test, workers=workers,
+        max_queue_size=max_queue_size, use_multiprocessing=False, verbose=2,
+        callbacks=callbacks.training_callbacks(patience))
+    _print_validation_data(
+        {'loss': history.history['loss']},
+        {'loss': history.history['val_loss']})
+
+    if save_model:
+        predict_col_name = columns[predict_col - 1]
+        version = registry.register_model(
+            model, scaler, 'pooled', predict_col_name, columns, n_input,
+            n_output, predict_col, epochs=epochs, neurons=neurons,
+            batch_size=batch_size, train_prop=train_prop,
+            file_names=file_names)
+        print('Registered pooled/{} model version {}.'.format(
+            predict_col_name, version))
+    return model
+
+
 def run_experiments(
         file_name='10001_aq_series.csv', columns=None, predict_col='manual',
         train_prop=0.7, n_input=24, n_output=1, runs=1, epochs=[2, 3],
-        neurons=2, batch_sizes=24):
-    """ Runs the _fit_model_experiments function to tweak the hyper-parameters.
-    TO-DO: The default set is to test the efficiency depending the number of
-    epochs. To test batch_size or number of neurons, the code has to be
-    changed.
+        neurons=2, batch_sizes=24, workers=None, restart=False,
+        patience=None):
+    """ Runs the _fit_model_experiments function to tweak the hyper-parameters,
+    comparing the efficiency depending the number of epochs. The trials are
+    run in parallel and stored by the forecasting.sweep module, so an
+    interrupted run is resumed; to sweep batch_size, neurons, n_input or
+    columns use sweep.grid_trials or sweep.random_trials with sweep.run_sweep.
 
     :param file_name: CSV file from which to load the experiment data.
     :type file_name: string
@@ -649,9 +933,16 @@ def run_experiments(
     :type neurons: int
     :param batch_size: size of values per run to use in training.
     :type batch_size: int
+    :param workers: number of processes running trials, the number of CPUs by
+        default.
+    :type workers: int
+    :param restart: if to discard the results of a previous run.
+    :type restart: boolean
+    :param patience: epochs without improvement of the validation loss to
+        stop each trial after, None to run all its epochs.
+    :type patience: int
 
     """
-
     f = file_name.split('.csv')[0]
 
     # Load dataset
@@ -660,119 +951,25 @@ def run_experiments(
     n_train_hours = int(365 * 48 * train_prop)
     neurons = round(
         n_train_hours / (neurons * (n_features * n_input + n_output)))
-
-    # Prepare dataset for supervised learning
-    reframed, scaler, predict_col_name = _prepare_time_series(
-        dataset, predict_col, n_input, n_output)
-
-    # Split dataset into training and test sets
-    train_X, train_y, test_X, test_y, raw_train, raw_test = _split_dataset(
-        reframed, n_train_hours, n_features, n_input)
-
-    results = {
-        'mae_vals': [],
-        'mae': pd.DataFrame(),
-        'rmse_vals': [],
-        'rmse': pd.DataFrame(),
-        'precision_vals': [],
-        'precision': pd.DataFrame(),
-        'recall_vals': [],
-        'recall': pd.DataFrame(),
-        'correlation_vals': [],
-        'correlation': pd.DataFrame()
-    }
-
-    for e in epochs:
-        for r in range(1, runs + 1):
-            print('Experiments run: %d' % r)
-            train_stats, test_stats = _fit_model_experiments(
-                train_X, train_y, test_X, test_y, e, neurons, batch_sizes,
-                scaler, n_input, n_features, predict_col_name
-            )
-
-            # mae = pd.DataFrame()
-            # mae['train'] = train_stats['mae']
-            # mae['test'] = test_stats['mae']
-            # rmse = pd.DataFrame()
-            # rmse['train'] = train_stats['rmse']
-            # rmse['test'] = test_stats['rmse']
-            # precision = pd.DataFrame()
-            # precision['train'] = train_stats['precision']
-            # precision['test'] = test_stats['precision']
-            # recall = pd.DataFrame()
-            # recall['train'] = train_stats['recall']
-            # recall['test'] = test_stats['recall']
-            # correlation = pd.DataFrame()
-            # correlation['train'] = train_stats['correlation']
-            # correlation['test'] = test_stats['correlation']
-
-            # Plotting
-            # plt.clf()
-            # fig = plt.figure(figsize=(12, 6))
-            # plt.suptitle('Run #%d with %d epochs' % (r, e))
-            # ax = fig.add_subplot(221)
-            # ax.plot(mae['train'], color='blue')
-            # ax.plot(mae['test'], color='orange')
-            # ax.set_title('MAE')
-            # ax = fig.add_subplot(222)
-            # ax.plot(rmse['train'], color='blue')
-            # ax.plot(rmse['test'], color='orange')
-            # ax.set_title('RMSE')
-            # ax = fig.add_subplot(223)
-            # ax.set_title('PRECISION')
-            # ax.plot(precision['train'], color='blue')
-            # ax.plot(precision['test'], color='orange')
-            # ax = fig.add_subplot(224)
-            # ax.set_title('CORRELATION')
-            # ax.plot(correlation['train'], color='blue')
-            # ax.plot(correlation['test'], color='orange')
-            # plt.savefig(
-            #     os.path.join(
-            #         FIGS_DATA_DIR, 'epochs',
-            #         '%d_epochs_%d_run_%s.png' % (e, r, f)
-            #     ), quality=100, format='png', pad_inches=0.25)
-            print('%d, %d) TrainMAE=%f, TestMAE=%f' % (
-                r, e, train_stats['mae'], test_stats['mae']))
-            print('%d, %d) TrainRMSE=%f, TestRMSE=%f' % (
-                r, e, train_stats['rmse'], test_stats['rmse']))
-            print('%d, %d) TrainPRECSSN=%f, TrainPRECSSN=%f' % (
-                r, e, train_stats['precision'], test_stats['precision']))
-            print('%d, %d) TrainRECALL=%f, TestRECALL=%f' % (
-                r, e, train_stats['recall'], test_stats['recall']))
-            print('%d, %d) TrainCORRELATION=%f, TestCORRELATION=%f' % (
-                r, e, train_stats['correlation'], test_stats['correlation']))
-            # plt.close()
-
-            results['mae_vals'].append(test_stats['mae'])
-            results['rmse_vals'].append(test_stats['rmse'])
-            results['precision_vals'].append(test_stats['precision'])
-            results['recall_vals'].append(test_stats['recall'])
-            results['correlation_vals'].append(test_stats['correlation'])
-
-        results['mae'][str(e)] = results['mae_vals']
-        results['rmse'][str(e)] = results['rmse_vals']
-        results['precision'][str(e)] = results['precision_vals']
-        results['recall'][str(e)] = results['recall_vals']
-        results['correlation'][str(e)] = results['correlation_vals']
-        results['mae_vals'] = []
-        results['rmse_vals'] = []
-        results['precision_vals'] = []
-        results['recall_vals'] = []
-        results['correlation_vals'] = []
-
-    plt.figure(figsize=(12, 6))
-    for k, v in results.items():
-        if not k.endswith('_vals'):
-            plt.clf()
-            print(k.upper() + ':')
-            print(v.describe())
-            print()
-            v.boxplot()
-            plt.savefig(
-                os.path.join(
-                    FIGS_DATA_DIR, 'epochs', '%s_stats_%s.png' % (k, f)),
-                quality=100, format='png', pad_inches=0.25)
-            plt.close()
+    if predict_col == 'manual':
+        predict_col = _ask_predict_col(n_features)
+
+    trials = sweep.grid_trials({
+        'epochs': epochs,
+        'neurons': [neurons],
+        'batch_size': [batch_sizes],
+        'n_input': [n_input],
+        'columns': [columns]
+    }, runs=runs)
+
+    os.makedirs(SWEEPS_DATA_DIR, exist_ok=True)
+    results = sweep.run_sweep(
+        file_name, trials, os.path.join(SWEEPS_DATA_DIR, f + '_epochs.csv'),
+        predict_col=predict_col, train_prop=train_prop, n_output=n_output,
+        n_train_hours=n_train_hours, workers=workers, restart=restart,
+        patience=patience)
+
+    sweep.plot_sweep_results(results, by='epochs', file_tag=f)
 
 
 def run_print_features(
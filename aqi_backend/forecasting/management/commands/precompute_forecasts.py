@@ -0,0 +1,148 @@
+import time
+import logging
+import datetime
+from django.core.management.base import BaseCommand
+from django.db import router, transaction
+from django.utils import timezone
+
+from au_epa_data.models import Site
+from forecasting import registry
+from forecasting.constants import (
+    AU_SITES_FORECAST, FORECASTABLE_POLLUTANTS, FORECAST_PRECOMPUTE_HOURS)
+from forecasting.models import Forecast
+from forecasting.online import (
+    ForecastUnavailable, aqi_categories, input_frame, last_measurement_date,
+    local_date, predicted_values)
+from forecasting.windowing import input_windows
+
+logger = logging.getLogger('myaqi.commands')
+
+
+class Command(BaseCommand):
+    help = ('Precompute the forecasts of the registered models for the hours'
+            ' measured since the last run. Meant to run hourly, after'
+            ' au_epa_update.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--level', '-l',
+            help='Level of logging'
+        )
+        parser.add_argument(
+            '--sites', '-s',
+            nargs='+',
+            default=AU_SITES_FORECAST,
+            help='IDs of the sites to forecast.'
+        )
+        parser.add_argument(
+            '--pollutants', '-p',
+            nargs='+',
+            default=FORECASTABLE_POLLUTANTS,
+            help='Pollutants to forecast.'
+        )
+        parser.add_argument(
+            '--hours',
+            action='store',
+            type=int,
+            default=FORECAST_PRECOMPUTE_HOURS,
+            help='Number of hours to catch up at most.'
+        )
+
+    def handle(self, *args, **options):
+        # Setting logging
+        level = options.get('level')
+        if level:
+            try:
+                logger.setLevel(getattr(logging, level.upper()))
+            except AttributeError:
+                pass
+
+        start_time = time.time()
+        count = 0
+        for site in Site.objects.filter(site_id__in=options.get('sites')):
+            for pollutant in options.get('pollutants'):
+                try:
+                    model = registry.get_target_model(
+                        site.site_id, pollutant)
+                except LookupError:
+                    logger.debug('No model for {0} at site {1}.'.format(
+                        pollutant, site.site_id))
+                    continue
+                try:
+                    count += self.precompute(
+                        site, pollutant, model, options.get('hours'))
+                except ForecastUnavailable as e:
+                    logger.warning('Skipping {0} at site {1}: {2}'.format(
+                        pollutant, site.site_id, e))
+
+        logger.info(
+            "Done! %d forecasts were stored."
+            " It took %.4f minutes." % (
+                count, (time.time() - start_time) / 60.0))
+
+    def issue_dates(self, site, pollutant, model, hours):
+        """ Returns the first and last (local) hours to issue forecasts for:
+        the ones measured since the last stored forecast, *hours* at most.
+
+        :rtype: tuple(datetime.datetime, datetime.datetime)
+        """
+        end_date = last_measurement_date(site, model.columns)
+        start_date = end_date - datetime.timedelta(hours=hours - 1)
+        last_issued = Forecast.last_issued(site.site_id, pollutant)
+        if last_issued is not None:
+            start_date = max(start_date, timezone.localtime(
+                last_issued).replace(tzinfo=None) + datetime.timedelta(
+                    hours=1))
+        return start_date, end_date
+
+    def precompute(self, site, pollutant, model, hours):
+        """ Forecasts the pending hours of a pollutant at a site, running all
+        their input windows through the model in a single predict call.
+
+        :rtype: int
+
+        Returns:
+            count: the number of forecasts stored.
+        """
+        start_date, end_date = self.issue_dates(
+            site, pollutant, model, hours)
+        if start_date > end_date:
+            return 0
+
+        frame = input_frame(
+            site, model.columns,
+            start_date - datetime.timedelta(hours=model.n_input - 1),
+            end_date)
+        X, complete = input_windows(
+            model.scaler.transform(frame.values), model.n_input)
+        issued = frame.index[model.n_input - 1:][complete]
+        if not len(issued):
+            raise ForecastUnavailable('No complete input windows.')
+
+        values, horizons = predicted_values(
+            model, model.predict(X[complete]), pollutant)
+        categories = aqi_categories(values, pollutant)
+
+        forecasts = []
+        for i, date_str in enumerate(issued):
+            issued_at = local_date(date_str)
+            for j, horizon in enumerate(horizons):
+                forecasts.append(Forecast(
+                    site=site, pollutant=pollutant, issued_at=issued_at,
+                    horizon=horizon,
+                    date_time=issued_at + datetime.timedelta(hours=horizon),
+                    value=round(float(values[i, j]), 2),
+                    aqi_category=categories[i * len(horizons) + j],
+                    model_version=model.version))
+
+        db = router.db_for_write(Forecast)
+        with transaction.atomic(using=db):
+            Forecast.objects.filter(
+                site=site, pollutant=pollutant,
+                issued_at__in=set(f.issued_at for f in forecasts)).delete()
+            Forecast.objects.bulk_create(forecasts)
+
+        logger.info(
+            'Forecasted {0} at site {1} for {2} hours up to {3}.'.format(
+                pollutant, site.site_id, len(issued), issued[-1]))
+        return len(forecasts)
@@ -0,0 +1,40 @@
+# Generated by Django 2.1.5 on 2026-10-18 14:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('au_epa_data', '0009_measurement_numeric_value'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Forecast',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pollutant', models.CharField(max_length=15, verbose_name='Pollutant')),
+                ('issued_at', models.DateTimeField(verbose_name='Issued At')),
+                ('horizon', models.PositiveSmallIntegerField(verbose_name='Horizon (hours)')),
+                ('date_time', models.DateTimeField(verbose_name='Date Time')),
+                ('value', models.FloatField(verbose_name='Value')),
+                ('aqi_category', models.CharField(blank=True, max_length=15, null=True, verbose_name='AQI Category')),
+                ('model_version', models.PositiveIntegerField(verbose_name='Model Version')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Created')),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='forecasts', to='au_epa_data.Site', verbose_name='Site')),
+            ],
+            options={
+                'verbose_name': 'Forecast',
+                'verbose_name_plural': 'Forecasts',
+                'db_table': 'forecast',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='forecast',
+            unique_together={('site', 'pollutant', 'issued_at', 'horizon')},
+        ),
+    ]
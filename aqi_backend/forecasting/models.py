@@ -1,3 +1,58 @@
+from django.utils.translation import ugettext_lazy as _
 from django.db import models
+from django.db.models import Max, Subquery
 
-# Create your models here.
+from au_epa_data.models import Site
+
+
+class Forecast(models.Model):
+    """
+    A forecasted value of a pollutant at a site, precomputed by the
+    precompute_forecasts command: the value predicted *horizon* hours after
+    *issued_at*, the last hour of the input window of the model.
+    """
+    site = models.ForeignKey(
+        Site, verbose_name=_("Site"), on_delete=models.DO_NOTHING,
+        related_name='forecasts')
+    pollutant = models.CharField(_("Pollutant"), max_length=15)
+    issued_at = models.DateTimeField(_("Issued At"))
+    horizon = models.PositiveSmallIntegerField(_("Horizon (hours)"))
+    date_time = models.DateTimeField(_("Date Time"))
+    value = models.FloatField(_("Value"))
+    aqi_category = models.CharField(
+        _("AQI Category"), max_length=15, blank=True, null=True)
+    model_version = models.PositiveIntegerField(_("Model Version"))
+    created = models.DateTimeField(_('Created'), auto_now_add=True)
+
+    def __str__(self):
+        return "{0}-{1}-{2:%Y%m%d%H}+{3}".format(
+            self.site_id, self.pollutant, self.issued_at, self.horizon)
+
+    @classmethod
+    def last_issued(cls, site_id, pollutant):
+        """ Returns the issue date of the last forecasts of a pollutant at a
+        site, None if there are none.
+
+        :rtype: datetime.datetime
+        """
+        return cls.objects.filter(
+            site_id=site_id, pollutant=pollutant).aggregate(
+                Max('issued_at'))['issued_at__max']
+
+    @classmethod
+    def latest(cls, site_id, pollutant):
+        """ Returns the last forecasts of a pollutant at a site, one per
+        horizon, with a single query.
+
+        :rtype: django.db.models.QuerySet
+        """
+        forecasts = cls.objects.filter(site_id=site_id, pollutant=pollutant)
+        return forecasts.filter(issued_at=Subquery(
+            forecasts.order_by('-issued_at').values('issued_at')[:1]
+        )).order_by('horizon')
+
+    class Meta:
+        db_table = 'forecast'
+        verbose_name = _('Forecast')
+        verbose_name_plural = _('Forecasts')
+        unique_together = (('site', 'pollutant', 'issued_at', 'horizon'), )
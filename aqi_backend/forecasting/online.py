@@ -0,0 +1,301 @@
+import time
+import logging
+import datetime
+from concurrent.futures import TimeoutError
+
+import numpy as np
+import pandas as pd
+from django.db.models import Max
+from django.utils import timezone
+
+from au_epa_data.constants import POLLUTANT_TO_MONITOR, DATETIME_FORMAT
+from au_epa_data.models import Measurement
+from common.models import AQIOrganization
+from geo_data.models import Fire, TrafficFlow
+from . import registry
+from .batching import batcher as default_batcher
+from .constants import (
+    FIRES_TITLE_PREFIX, FORECAST_MAX_AGE, FORECASTABLE_POLLUTANTS,
+    SITES_MONITORS, TRAFFIC_FLOW_TITLE_PREFIX)
+from .windowing import output_position, target_position
+
+logger = logging.getLogger('myaqi')
+
+
+class ForecastUnavailable(Exception):
+    """The input window of a model cannot be built from the stored data."""
+    pass
+
+
+def _column_sources(site, columns):
+    """Splits the columns of a model into the monitors, traffic stations and
+    fires they were written from by write_time_series."""
+    site_monitors = SITES_MONITORS.get(str(site.site_id), [])
+    monitors, stations, fires = [], [], False
+    for column in columns:
+        if column == FIRES_TITLE_PREFIX:
+            fires = True
+        elif column.startswith(TRAFFIC_FLOW_TITLE_PREFIX + '_'):
+            stations.append(column[len(TRAFFIC_FLOW_TITLE_PREFIX) + 1:])
+        else:
+            candidates = [
+                m for m, pollutant in POLLUTANT_TO_MONITOR.items()
+                if pollutant == column]
+            candidates.sort(key=lambda m: m not in site_monitors)
+            if not candidates:
+                raise ForecastUnavailable(
+                    'Unknown column {0}.'.format(column))
+            monitors.append(candidates[0])
+    return monitors, stations, fires
+
+
+def _site_measurements(site, monitors):
+    return site.measurements.exclude(time_basis_id__in=[
+        '8HR_RAV', '24HR_RAV']).filter(monitor_id__in=monitors)
+
+
+def local_date(date_str):
+    """Returns the aware datetime of a local date string of the time series.
+
+    :rtype: datetime.datetime
+
+    """
+    return timezone.make_aware(
+        datetime.datetime.strptime(date_str, DATETIME_FORMAT), is_dst=False)
+
+
+def last_measurement_date(site, columns):
+    """Returns the (local) hour of the last measurement of the monitors of
+    the columns of a model at a site.
+
+    :rtype: datetime.datetime
+
+    Raises:
+        ForecastUnavailable: if the site has no measurements for them.
+
+    """
+    monitors = _column_sources(site, columns)[0]
+    last = _site_measurements(site, monitors).aggregate(
+        last=Max('date_time_start'))['last']
+    if last is None:
+        raise ForecastUnavailable(
+            'No measurements for site {0}.'.format(site.site_id))
+    return timezone.localtime(last).replace(tzinfo=None)
+
+
+def input_frame(site, columns, start_date, end_date):
+    """Builds the time series of the columns of a model from the stored data
+    between two (local) hours, the same way write_time_series writes the
+    training datasets. The columns without any value are left empty.
+
+    :param site: the air quality site.
+    :type site: au_epa_data.models.Site
+    :param columns: the columns of the model, in order.
+    :type columns: string[]
+    :param start_date: first hour of the time series.
+    :type start_date: datetime.datetime
+    :param end_date: last hour of the time series.
+    :type end_date: datetime.datetime
+    :rtype: pandas.DataFrame
+
+    """
+    monitors, stations, fires = _column_sources(site, columns)
+    data = Measurement.measurements_for_forecast(
+        _site_measurements(site, monitors), monitors, start_date, end_date)
+    if stations:
+        traffic_flows = TrafficFlow.traffic_flows_for_forecast(
+            stations, start_date, end_date)
+        data.update(
+            (k, v) for k, v in traffic_flows.items() if k != 'date')
+    if fires:
+        fire_areas = {
+            i + 1: area
+            for i, area in enumerate(site.get_fire_situations_areas())
+        }
+        data[FIRES_TITLE_PREFIX] = Fire.fires_for_forecast(
+            fire_areas, start_date, end_date)[FIRES_TITLE_PREFIX]
+
+    frame = pd.DataFrame(data=data).set_index('date')
+    return frame.reindex(columns=columns).astype('float32')
+
+
+def latest_window(site, columns, n_input, end_date=None):
+    """Builds the input of a model from the stored data: the *n_input* hours
+    of its columns up to the last measurement of the site.
+
+    :param site: the air quality site.
+    :type site: au_epa_data.models.Site
+    :param columns: the columns of the model, in order.
+    :type columns: string[]
+    :param n_input: number of previous time lags of the input.
+    :type n_input: int
+    :param end_date: last (local) hour of the window, by default the one of
+        the last measurement.
+    :type end_date: datetime.datetime
+    :rtype: pandas.DataFrame
+
+    Raises:
+        ForecastUnavailable: if the site has no recent values for a column.
+
+    """
+    if end_date is None:
+        end_date = last_measurement_date(site, columns)
+    start_date = end_date - datetime.timedelta(hours=n_input - 1)
+
+    window = input_frame(site, columns, start_date, end_date).tail(n_input)
+    missing = window.columns[window.isnull().any()]
+    if len(window) < n_input or len(missing):
+        raise ForecastUnavailable(
+            'No values for {0} between {1} and {2}.'.format(
+                ', '.join(missing) or 'some hours', start_date, end_date))
+    return window
+
+
+def predicted_values(model, yhat, target=None):
+    """Inverts the scaling of the predictions of a registered model.
+
+    :param model: the registered model.
+    :type model: forecasting.registry.RegisteredModel
+    :param yhat: the output of the model, one row per sample.
+    :type yhat: numpy.array
+    :param target: the predicted column to return the values of, for the
+        multi-output models.
+    :type target: string
+    :rtype: tuple(numpy.array, int[])
+
+    Returns:
+        (values, horizons): the [samples, outputs] predicted values, and the
+        hours after the last input hour each output is for.
+
+    """
+    metadata = model.metadata
+    yhat = np.asarray(yhat).reshape(len(yhat), -1)
+    if metadata.get('targets'):
+        # The n_output hours of each target, see multi_output_windows
+        n_output = metadata['n_output']
+        target = target or model.targets[0]
+        first = output_position(model.targets.index(target), 1, n_output)
+        yhat = yhat[:, first:first + n_output]
+        target_col, target_lag = model.columns.index(target), 0
+    else:
+        target_col, target_lag = target_position(
+            metadata['predict_col'], len(model.columns),
+            metadata['n_output'])
+    values = (yhat - model.scaler.min_[target_col]) / \
+        model.scaler.scale_[target_col]
+    horizons = [target_lag + i + 1 for i in range(values.shape[1])]
+    return values, horizons
+
+
+def aqi_categories(values, pollutant):
+    """Returns the AUEPA category of each value of a pollutant, None for the
+    pollutants without categories.
+
+    :rtype: string[]
+
+    """
+    values = np.ravel(values)
+    if pollutant not in FORECASTABLE_POLLUTANTS:
+        return [None] * len(values)
+    return list(AQIOrganization.categorize(
+        'AUEPA', values, pollutant.lower()))
+
+
+def forecast(site, pollutant, version=None, deadline=None, batcher=None):
+    """Forecasts the next hours of a pollutant at a site with its registered
+    model. The prediction is run by the batcher together with the ones of
+    the concurrent requests, waiting for it what is left until the deadline
+    after loading the model and building its input.
+
+    :param site: the air quality site.
+    :type site: au_epa_data.models.Site
+    :param pollutant: the column predicted by the model (e.g., PM2.5).
+    :type pollutant: string
+    :param version: the version of the model, the latest by default.
+    :type version: int
+    :param deadline: time.monotonic() time the forecast must be ready by.
+    :type deadline: float
+    :param batcher: the batcher to run the prediction, the shared one by
+        default.
+    :type batcher: forecasting.batching.PredictionBatcher
+    :rtype: dict
+
+    Raises:
+        LookupError: if no model registered for the site predicts the
+            pollutant.
+        ForecastUnavailable: if the input window cannot be built.
+        concurrent.futures.TimeoutError: if the forecast is not ready by the
+            deadline.
+
+    """
+    model = registry.get_target_model(site.site_id, pollutant, version)
+    window = latest_window(site, model.columns, model.n_input)
+
+    timeout = None
+    if deadline is not None:
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            raise TimeoutError()
+    X = model.scaler.transform(window.values)
+    yhat = (batcher or default_batcher).predict(
+        model, X[np.newaxis], timeout)
+    values, horizons = predicted_values(model, yhat, pollutant)
+    values = values[0]
+
+    issued_at = local_date(window.index[-1])
+    return forecast_data(
+        site.site_id, pollutant, model.version, issued_at, horizons, values,
+        aqi_categories(values, pollutant))
+
+
+def forecast_data(
+        site_id, pollutant, model_version, issued_at, horizons, values,
+        categories):
+    """The representation of the forecasts of the /forecasts endpoint.
+
+    :rtype: dict
+
+    """
+    return {
+        'site_id': site_id,
+        'pollutant': pollutant,
+        'model_version': model_version,
+        'issued_at': timezone.localtime(issued_at).strftime(DATETIME_FORMAT),
+        'forecasts': [
+            {
+                'horizon': horizon,
+                'date': timezone.localtime(
+                    issued_at + datetime.timedelta(hours=horizon)).strftime(
+                        DATETIME_FORMAT),
+                'value': round(float(value), 2),
+                'aqi_category': category
+            }
+            for horizon, value, category in zip(horizons, values, categories)
+        ]
+    }
+
+
+def stored_forecast(site, pollutant, max_age=FORECAST_MAX_AGE):
+    """Returns the last forecasts of a pollutant at a site precomputed by the
+    precompute_forecasts command, with the same representation as forecast,
+    None if there are none or they were issued more than *max_age* seconds
+    ago (e.g., the command stopped running).
+
+    :rtype: dict
+
+    """
+    from .models import Forecast
+
+    forecasts = list(Forecast.latest(site.site_id, pollutant))
+    if not forecasts:
+        return None
+    issued_at = forecasts[0].issued_at
+    if issued_at < timezone.now() - datetime.timedelta(seconds=max_age):
+        logger.warning(
+            'The last forecasts of {0} at {1} were issued at {2}.'.format(
+                pollutant, site.site_id, issued_at))
+        return None
+    return forecast_data(
+        site.site_id, pollutant, forecasts[0].model_version, issued_at,
+        [f.horizon for f in forecasts], [f.value for f in forecasts],
+        [f.aqi_category for f in forecasts])
@@ -0,0 +1,208 @@
+import os
+import json
+import math
+import numpy as np
+import pandas as pd
+from keras.utils import Sequence
+from sklearn.preprocessing import MinMaxScaler
+
+from .constants import AQ_DATA_DIR, ARRAYS_DATA_DIR, PIPELINE_CHUNK_SIZE
+
+
+def series_array(file_name, columns, file_dir=None):
+    """Returns the columns of a time series CSV file as a read-only
+    memory-mapped float32 array, one row per hour. The array is written to
+    ARRAYS_DATA_DIR chunk by chunk the first time, and again only if the CSV
+    file or the columns change, so the series is never fully loaded.
+
+    :param file_name: CSV file of the time series.
+    :type file_name: string
+    :param columns: the columns to include, in order.
+    :type columns: string[]
+    :param file_dir: if the file is not in ./data/air_quality
+    :type file_dir: string
+    :rtype: numpy.memmap
+
+    """
+    csv_file = os.path.join(
+        AQ_DATA_DIR if file_dir is None else file_dir, file_name)
+    name = file_name.split('.csv')[0]
+    array_file = os.path.join(ARRAYS_DATA_DIR, name + '.npy')
+    columns_file = os.path.join(ARRAYS_DATA_DIR, name + '.json')
+
+    try:
+        with open(columns_file) as f:
+            fresh = json.load(f) == list(columns) and \
+                os.path.getmtime(array_file) >= os.path.getmtime(csv_file)
+    except (OSError, ValueError):
+        fresh = False
+
+    if not fresh:
+        os.makedirs(ARRAYS_DATA_DIR, exist_ok=True)
+        # The sidecar is replaced last, it marks the array as complete
+        if os.path.exists(columns_file):
+            os.remove(columns_file)
+        with open(csv_file) as f:
+            n_rows = sum(1 for line in f) - 1
+        values = np.lib.format.open_memmap(
+            array_file + '.tmp', mode='w+', dtype='float32',
+            shape=(n_rows, len(columns)))
+        start = 0
+        for chunk in pd.read_csv(
+                csv_file, usecols=columns, chunksize=PIPELINE_CHUNK_SIZE):
+            values[start:start + len(chunk)] = chunk[columns].values
+            start += len(chunk)
+        values.flush()
+        del values
+        os.replace(array_file + '.tmp', array_file)
+        with open(columns_file + '.tmp', 'w') as f:
+            json.dump(list(columns), f)
+        os.replace(columns_file + '.tmp', columns_file)
+
+    return np.load(array_file, mmap_mode='r')
+
+
+def fit_scaler(arrays):
+    """Fits a MinMaxScaler on several series, chunk by chunk.
+
+    :param arrays: the series, e.g. as returned by series_array.
+    :type arrays: numpy.array[]
+    :rtype: sklearn.MinMaxScaler
+
+    """
+    scaler = MinMaxScaler(feature_range=(0, 1))
+    for values in arrays:
+        for start in range(0, len(values), PIPELINE_CHUNK_SIZE):
+            chunk = values[start:start + PIPELINE_CHUNK_SIZE]
+            chunk = chunk[~np.isnan(chunk).any(axis=1)]
+            if len(chunk):
+                scaler.partial_fit(chunk)
+    return scaler
+
+
+def _window_starts(values, window):
+    """Returns the first row of each window of *window* rows of a series
+    without missing values, reading the series chunk by chunk."""
+    missing = np.concatenate([
+        np.isnan(values[start:start + PIPELINE_CHUNK_SIZE]).any(axis=1)
+        for start in range(0, len(values), PIPELINE_CHUNK_SIZE)
+    ] or [np.zeros(0, dtype=bool)])
+    if len(missing) < window:
+        return np.zeros(0, dtype=np.int64)
+    incomplete = np.convolve(
+        missing, np.ones(window, dtype=int), mode='valid') > 0
+    return np.flatnonzero(~incomplete)
+
+
+class WindowSequence(Sequence):
+    """
+    Batches of supervised learning windows read lazily from one or more
+    (memory-mapped) series: only the rows of the windows of a batch are
+    read and scaled, so the windowed tensor is never in memory. Being a
+    keras.utils.Sequence, fit_generator prefetches the batches in parallel
+    workers.
+
+        >>> train = WindowSequence(arrays, scaler, 24, starts=train_starts)
+        >>> model.fit_generator(train, epochs=10, workers=4)
+
+    """
+
+    def __init__(
+            self, arrays, scaler, n_input, n_output=1, target_col=0,
+            target_lag=0, batch_size=24, starts=None, shuffle=False):
+        """
+        :param arrays: the series, with the same columns.
+        :type arrays: numpy.array[]
+        :param scaler: the scaler fitted on the series.
+        :type scaler: sklearn.MinMaxScaler
+        :param n_input: number of previous time lags of the input.
+        :type n_input: int
+        :param n_output: number of next time lags of the output sequence.
+        :type n_output: int
+        :param target_col: index of the column to be predicted.
+        :type target_col: int
+        :param target_lag: time lag of the output sequence to be predicted.
+        :type target_lag: int
+        :param batch_size: number of windows per batch.
+        :type batch_size: int
+        :param starts: (series, first row) of each window, by default all the
+            windows without missing values.
+        :type starts: tuple(numpy.array, numpy.array)
+        :param shuffle: if to shuffle the windows after each epoch.
+        :type shuffle: boolean
+        """
+        self.arrays = arrays
+        self.n_input = n_input
+        self.target_col = target_col
+        self.target_lag = target_lag
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.scale = scaler.scale_.astype('float32')
+        self.min = scaler.min_.astype('float32')
+        if starts is None:
+            starts = self.window_starts(arrays, n_input, n_output)
+        self.series, self.rows = starts
+
+    @staticmethod
+    def window_starts(arrays, n_input, n_output=1):
+        """Returns the series and first row of every complete window.
+
+        :rtype: tuple(numpy.array, numpy.array)
+
+        """
+        starts = [
+            _window_starts(values, n_input + n_output) for values in arrays]
+        return (
+            np.concatenate([
+                np.full(len(s), i, dtype=np.int64)
+                for i, s in enumerate(starts)]),
+            np.concatenate(starts))
+
+    def __len__(self):
+        return int(math.ceil(len(self.rows) / float(self.batch_size)))
+
+    def __getitem__(self, index):
+        batch = slice(index * self.batch_size, (index + 1) * self.batch_size)
+        series, rows = self.series[batch], self.rows[batch]
+        X = np.empty(
+            (len(rows), self.n_input, len(self.scale)), dtype='float32')
+        y = np.empty(len(rows), dtype='float32')
+        offsets = np.arange(self.n_input)
+        for i in np.unique(series):
+            in_series = series == i
+            first = rows[in_series]
+            values = self.arrays[i]
+            X[in_series] = values[first[:, np.newaxis] + offsets]
+            y[in_series] = values[
+                first + self.n_input + self.target_lag, self.target_col]
+        X = X * self.scale + self.min
+        y = y * self.scale[self.target_col] + self.min[self.target_col]
+        return X, y
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            order = np.random.permutation(len(self.rows))
+            self.series, self.rows = self.series[order], self.rows[order]
+
+
+def split_starts(starts, train_prop):
+    """Splits the windows of each series into training and test windows,
+    the first *train_prop* of each series for training.
+
+    :param starts: (series, first row) of each window.
+    :type starts: tuple(numpy.array, numpy.array)
+    :param train_prop: percentage of the windows of each series to use as
+        training set.
+    :type train_prop: float
+    :rtype: tuple(tuple, tuple)
+
+    Returns:
+        (train_starts, test_starts)
+
+    """
+    series, rows = starts
+    train = np.zeros(len(rows), dtype=bool)
+    for i in np.unique(series):
+        in_series = np.flatnonzero(series == i)
+        train[in_series[:int(len(in_series) * train_prop)]] = True
+    return (series[train], rows[train]), (series[~train], rows[~train])
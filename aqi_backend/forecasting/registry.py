@@ -0,0 +1,286 @@
+import os
+import json
+import pickle
+import shutil
+import datetime
+import tempfile
+import threading
+from collections import OrderedDict
+
+import keras
+import tensorflow as tf
+from keras.models import load_model
+
+from .constants import (
+    MODELS_CACHE_SIZE, MODELS_REGISTRY_DIR, MULTI_OUTPUT_TARGET)
+
+MODEL_FILE = 'model.h5'
+SCALER_FILE = 'scaler.pkl'
+METADATA_FILE = 'metadata.json'
+
+
+class RegisteredModel(object):
+    """
+    A version of a model of the registry, loaded in its own TensorFlow graph
+    and session with its predict function already built, together with the
+    scaler fitted on its training data and its metadata (columns, n_input,
+    n_output, predict_col, targets and training parameters).
+    """
+
+    def __init__(self, site_id, target, version, path):
+        self.site_id = site_id
+        self.target = target
+        self.version = version
+        with open(os.path.join(path, METADATA_FILE)) as f:
+            self.metadata = json.load(f)
+        with open(os.path.join(path, SCALER_FILE), 'rb') as f:
+            self.scaler = pickle.load(f)
+
+        self.graph = tf.Graph()
+        with self.graph.as_default():
+            self.session = tf.Session(graph=self.graph)
+            with self.session.as_default():
+                self.model = load_model(os.path.join(path, MODEL_FILE))
+                self.model._make_predict_function()
+        self._lock = threading.Lock()
+
+    @property
+    def columns(self):
+        return self.metadata['columns']
+
+    @property
+    def n_input(self):
+        return self.metadata['n_input']
+
+    @property
+    def targets(self):
+        """The predicted columns, several for the multi-output models."""
+        return self.metadata.get('targets') or [self.target]
+
+    def predict(self, X):
+        """Runs the model on the [samples, timesteps, features] input."""
+        with self._lock, self.graph.as_default(), self.session.as_default():
+            return self.model.predict(X)
+
+    def __repr__(self):
+        return '<RegisteredModel {0}/{1} v{2}>'.format(
+            self.site_id, self.target, self.version)
+
+
+def _model_dir(site_id, target):
+    return os.path.join(MODELS_REGISTRY_DIR, str(site_id), str(target))
+
+
+def _version_dir(site_id, target, version):
+    return os.path.join(_model_dir(site_id, target), 'v{0}'.format(version))
+
+
+def checkpoint_dir(site_id, target):
+    """Returns the directory of the training checkpoints of the model of a
+    site and target.
+
+    :rtype: string
+
+    """
+    return os.path.join(_model_dir(site_id, target), 'checkpoints')
+
+
+def list_versions(site_id, target):
+    """Lists the registered versions of the model of a site and target.
+
+    :param site_id: id of the air quality site.
+    :type site_id: string
+    :param target: name of the predicted column (e.g., PM2.5).
+    :type target: string
+    :rtype: int[]
+
+    """
+    model_dir = _model_dir(site_id, target)
+    if not os.path.isdir(model_dir):
+        return []
+    return sorted(
+        int(d[1:]) for d in os.listdir(model_dir)
+        if d.startswith('v') and d[1:].isdigit())
+
+
+def latest_version(site_id, target):
+    """Returns the last registered version of the model of a site and
+    target, None if there is none.
+
+    :rtype: int
+
+    """
+    versions = list_versions(site_id, target)
+    return versions[-1] if versions else None
+
+
+def register_model(
+        model, scaler, site_id, target, columns, n_input, n_output,
+        predict_col, targets=None, **params):
+    """Stores a trained model as a new version of the model of a site and
+    target, with the fitted scaler and the metadata needed to use it:
+    MODELS_REGISTRY_DIR/<site_id>/<target>/v<version>/.
+
+    :param model: the trained model.
+    :type model: keras.models.Model
+    :param scaler: the scaler fitted on the training data.
+    :type scaler: sklearn.MinMaxScaler
+    :param site_id: id of the air quality site.
+    :type site_id: string
+    :param target: name of the predicted column.
+    :type target: string
+    :param columns: the columns of the dataset, in order.
+    :type columns: string[]
+    :param n_input: number of previous time lags of the input.
+    :type n_input: int
+    :param n_output: number of future time lags of the output.
+    :type n_output: int
+    :param predict_col: index of the predicted column.
+    :type predict_col: int
+    :param targets: the predicted columns of a multi-output model, in the
+        order of its outputs.
+    :type targets: string[]
+    :param params: training parameters to keep in the metadata (epochs,
+        neurons, batch_size, ...).
+    :rtype: int
+
+    Returns:
+        version: the version of the registered model.
+
+    """
+    model_dir = _model_dir(site_id, target)
+    os.makedirs(model_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix='.tmp', dir=model_dir)
+    try:
+        model.save(os.path.join(tmp_dir, MODEL_FILE))
+        with open(os.path.join(tmp_dir, SCALER_FILE), 'wb') as f:
+            pickle.dump(scaler, f)
+
+        version = (latest_version(site_id, target) or 0) + 1
+        while True:
+            metadata = {
+                'site_id': str(site_id),
+                'target': target,
+                'version': version,
+                'columns': list(columns),
+                'n_input': n_input,
+                'n_output': n_output,
+                'predict_col': predict_col,
+                'targets': list(targets) if targets else None,
+                'params': params,
+                'keras_version': keras.__version__,
+                'created': datetime.datetime.now().isoformat()
+            }
+            with open(os.path.join(tmp_dir, METADATA_FILE), 'w') as f:
+                json.dump(metadata, f, indent=2)
+            # The rename fails if another process took the version
+            try:
+                os.rename(tmp_dir, _version_dir(site_id, target, version))
+                return version
+            except OSError:
+                version += 1
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+_models = OrderedDict()
+_models_lock = threading.Lock()
+
+
+def get_model(site_id, target, version=None):
+    """Returns a registered model, loading it from disk only the first time:
+    the last MODELS_CACHE_SIZE models used by the process are kept in memory.
+
+    :param site_id: id of the air quality site.
+    :type site_id: string
+    :param target: name of the predicted column.
+    :type target: string
+    :param version: the version of the model, the latest by default.
+    :type version: int
+    :rtype: RegisteredModel
+
+    Raises:
+        LookupError: if the model or the version is not registered.
+
+    """
+    if version is None:
+        version = latest_version(site_id, target)
+        if version is None:
+            raise LookupError('No model registered for {0}/{1}.'.format(
+                site_id, target))
+    key = (str(site_id), str(target), int(version))
+
+    with _models_lock:
+        if key in _models:
+            _models.move_to_end(key)
+            return _models[key]
+
+    path = _version_dir(*key)
+    if not os.path.isdir(path):
+        raise LookupError('No model registered for {0}/{1} v{2}.'.format(
+            *key))
+    registered = RegisteredModel(*key, path=path)
+
+    with _models_lock:
+        registered = _models.setdefault(key, registered)
+        _models.move_to_end(key)
+        while len(_models) > MODELS_CACHE_SIZE:
+            _models.popitem(last=False)
+    return registered
+
+
+def get_target_model(site_id, target, version=None):
+    """Returns the registered model of a site predicting a column: its own
+    model or, if it has none, the multi-output model of the site if that
+    one predicts it.
+
+    :param site_id: id of the air quality site.
+    :type site_id: string
+    :param target: name of the predicted column (e.g., PM2.5).
+    :type target: string
+    :param version: the version of the model, the latest by default.
+    :type version: int
+    :rtype: RegisteredModel
+
+    Raises:
+        LookupError: if no model of the site predicts the column.
+
+    """
+    try:
+        return get_model(site_id, target, version)
+    except LookupError:
+        try:
+            model = get_model(site_id, MULTI_OUTPUT_TARGET, version)
+        except LookupError:
+            model = None
+        if model is None or target not in model.targets:
+            raise
+        return model
+
+
+def clear_models():
+    """Drops the models kept in memory."""
+    with _models_lock:
+        _models.clear()
+
+
+def preload_models(site_ids, targets):
+    """Loads the latest version of the registered models of the sites and
+    targets, MODELS_CACHE_SIZE at most, so the first forecasts of the
+    process do not wait for them.
+
+    :param site_ids: ids of the air quality sites.
+    :type site_ids: string[]
+    :param targets: names of the predicted columns.
+    :type targets: string[]
+    :rtype: RegisteredModel[]
+
+    """
+    models = []
+    for site_id in site_ids:
+        for target in targets:
+            if len(models) == MODELS_CACHE_SIZE:
+                return models
+            if latest_version(site_id, target) is not None:
+                models.append(get_model(site_id, target))
+    return models
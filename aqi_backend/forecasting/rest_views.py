@@ -1,15 +1,37 @@
+import time
+import logging
 import datetime
-import requests
 import copy
+from concurrent.futures import TimeoutError
 from django.conf import settings
+from django.http import (
+    HttpResponse, HttpResponseNotModified, StreamingHttpResponse)
+from django.utils.http import parse_etags
 from rest_framework.views import APIView
+from rest_framework.exceptions import (
+    APIException, NotFound, ValidationError)
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from collections import OrderedDict
+from rest_framework.settings import api_settings
 
-from au_epa_data.constants import AU_VIC_URL_MAP, WEATHERBIT_FORECAST
+from au_epa_data.constants import WEATHERBIT_FORECAST
+from au_epa_data.models import Site
+from au_epa_data.upstream import client
+from common.renderers import NDJSONRenderer
 
-from .utils import get_experimental_data, get_sites_fires
+from .cache import get_cached_json
+from .constants import EXPERIMENTS_MAP_DATA_KEY, FORECAST_LATENCY_BUDGET
+from .online import ForecastUnavailable, forecast, stored_forecast
+from .utils import (
+    get_experimental_data, get_sites_fires, stream_experimental_data)
+
+logger = logging.getLogger('myaqi')
+
+
+class ServiceUnavailable(APIException):
+    status_code = 503
+    default_detail = 'Service temporarily unavailable, try again later.'
+    default_code = 'service_unavailable'
 
 
 class ExperimentsMapDataView(APIView):
@@ -18,19 +40,43 @@ class ExperimentsMapDataView(APIView):
     at the MyAQI frontend map.
     """
     permission_classes = (AllowAny,)
+    renderer_classes = tuple(api_settings.DEFAULT_RENDERER_CLASSES) + (
+        NDJSONRenderer, )
 
     def get(self, request, format=None):
         """
-        Return experiments in chronological order.
+        Return experiments in chronological order. The serialized data is
+        cached until new data is imported, and not sent again if the client
+        already has it.
+
+        With `?stream=true` the timeline is written hour by hour as it is read
+        from the database, and with `?format=ndjson` as one JSON document per
+        line (the sites and traffic stations first, then one per hour).
         """
         start_date_str = request.GET.get('start_date', '2017010100')
         end_date_str = request.GET.get('end_date', '2019010100')
         start_date = datetime.datetime.strptime(start_date_str, '%Y%m%d%H')
         end_date = datetime.datetime.strptime(end_date_str, '%Y%m%d%H')
 
-        experimental_data = get_experimental_data(start_date, end_date)
+        if request.accepted_renderer.format == NDJSONRenderer.format:
+            return StreamingHttpResponse(
+                stream_experimental_data(start_date, end_date, ndjson=True),
+                content_type=NDJSONRenderer.media_type)
+        if request.GET.get('stream', '').lower() in ('1', 'true'):
+            return StreamingHttpResponse(
+                stream_experimental_data(start_date, end_date),
+                content_type='application/json')
 
-        return Response(experimental_data)
+        content, etag = get_cached_json(
+            EXPERIMENTS_MAP_DATA_KEY.format(start_date, end_date),
+            lambda: get_experimental_data(start_date, end_date))
+
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type='application/json')
+        response['ETag'] = etag
+        return response
 
 
 class FiresExperimentsDataView(APIView):
@@ -53,6 +99,63 @@ class FiresExperimentsDataView(APIView):
         return Response(fires)
 
 
+class SiteForecastView(APIView):
+    """
+    View to return the next hours forecast of a pollutant at an air quality
+    site, precomputed by the precompute_forecasts command or predicted on
+    request by its registered LSTM model from the stored data.
+    """
+    permission_classes = (AllowAny,)
+
+    def get(self, request, site_id, pollutant, format=None):
+        """
+        Return the forecasted values and their AQI categories, the last
+        precomputed ones if they are recent. With `?live=true` or
+        `?version=<n>` they are predicted on request. The request fails with
+        a 503 if the forecast is not ready within the latency budget, counted
+        from its arrival.
+        """
+        start_time = time.monotonic()
+        deadline = start_time + FORECAST_LATENCY_BUDGET
+        version = request.GET.get('version')
+        try:
+            version = int(version) if version else None
+        except ValueError:
+            raise ValidationError({'version': 'Not a number: {0}.'.format(
+                version)})
+        live = request.GET.get('live', '').lower() in ('1', 'true')
+        try:
+            site = Site.objects.get(site_id=site_id)
+        except Site.DoesNotExist:
+            raise NotFound('Unknown site {0}.'.format(site_id))
+
+        data = None
+        if not live and version is None:
+            data = stored_forecast(site, pollutant)
+        try:
+            if data is None:
+                data = forecast(site, pollutant, version, deadline=deadline)
+        except LookupError as e:
+            raise NotFound(str(e))
+        except ForecastUnavailable as e:
+            raise ServiceUnavailable(str(e))
+        except TimeoutError:
+            data = None
+
+        elapsed = time.monotonic() - start_time
+        if data is None or elapsed > FORECAST_LATENCY_BUDGET:
+            logger.warning(
+                'Forecast of {0} at {1} over the latency budget: {2:.3f}s.'
+                .format(pollutant, site_id, elapsed))
+            raise ServiceUnavailable(
+                'The forecast took longer than {0}s.'.format(
+                    FORECAST_LATENCY_BUDGET))
+        response = Response(data)
+        response['Server-Timing'] = 'forecast;dur={0:.1f}'.format(
+            elapsed * 1000)
+        return response
+
+
 class WeatherbitForecastProxy(APIView):
     """
     View to return all measurements for an AirWatch sensor station.
@@ -64,10 +167,9 @@ class WeatherbitForecastProxy(APIView):
         Return a list of all measurements.
         """
 
-        url = OrderedDict(AU_VIC_URL_MAP)[WEATHERBIT_FORECAST]
         headers = {'content-type': 'application/json'}
 
         params = copy.copy(request.query_params)
         params['key'] = settings.WEATHER_BIT_API_KEY
-        r = requests.get(url, params=params, headers=headers)
-        return Response(r.json())
+        return Response(client.fetch(
+            WEATHERBIT_FORECAST, params=params, headers=headers))
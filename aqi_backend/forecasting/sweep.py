@@ -0,0 +1,335 @@
+import os
+import csv
+import json
+import time
+import random
+import logging
+import itertools
+import multiprocessing
+from functools import lru_cache
+
+import pandas as pd
+
+from django.db import connections
+
+from .constants import FIGS_DATA_DIR, SWEEP_METRICS, SWEEP_PARAMS
+
+logger = logging.getLogger('myaqi')
+
+# CPU threads of the TensorFlow session of a sweep worker
+_worker_threads = 1
+
+
+def _trials(combinations, runs):
+    names = [name for name, default in SWEEP_PARAMS]
+    for values in combinations:
+        params = dict(zip(names, values))
+        if params['columns'] is not None:
+            params['columns'] = list(params['columns'])
+        for r in range(1, runs + 1):
+            yield dict(params, run=r)
+
+
+def _spec_values(spec):
+    return [
+        list(spec.get(name, [default])) for name, default in SWEEP_PARAMS]
+
+
+def grid_trials(spec, runs=1):
+    """Lists the trials of a grid search: every combination of the values of
+    the hyperparameters in *spec*, *runs* times each. The hyperparameters not
+    in *spec* keep their default value (see constants.SWEEP_PARAMS).
+
+        >>> grid_trials({'epochs': [50, 100], 'neurons': [25, 50]}, runs=3)
+
+    :param spec: list of values to try for each hyperparameter (epochs,
+        neurons, batch_size, n_input and columns).
+    :type spec: dict
+    :param runs: number of times each combination is trained.
+    :type runs: int
+    :rtype: dict[]
+
+    Returns:
+        trials: the hyperparameters and run number of each trial.
+
+    """
+    return list(_trials(itertools.product(*_spec_values(spec)), runs))
+
+
+def random_trials(spec, n_trials, runs=1, seed=None):
+    """Lists the trials of a random search: *n_trials* combinations drawn
+    without replacement from the grid of *spec*, *runs* times each. With the
+    same *seed* the same trials are drawn, so the sweep can be resumed.
+
+    :param spec: list of values to try for each hyperparameter.
+    :type spec: dict
+    :param n_trials: number of combinations to draw.
+    :type n_trials: int
+    :param runs: number of times each combination is trained.
+    :type runs: int
+    :param seed: seed of the random generator.
+    :type seed: int
+    :rtype: dict[]
+
+    Returns:
+        trials: the hyperparameters and run number of each trial.
+
+    """
+    combinations = list(itertools.product(*_spec_values(spec)))
+    combinations = random.Random(seed).sample(
+        combinations, min(n_trials, len(combinations)))
+    return list(_trials(combinations, runs))
+
+
+def trial_key(trial, shared):
+    """Identifies a trial in the results store: its hyperparameters, run
+    number and the settings shared by all the trials of the sweep.
+
+    :rtype: string
+
+    """
+    return json.dumps(dict(trial, **shared), sort_keys=True)
+
+
+def _result_fields():
+    return ['trial', 'file_name'] + \
+        [name for name, default in SWEEP_PARAMS] + ['run', 'seconds'] + \
+        ['%s_%s' % (s, m) for s in ('train', 'test') for m in SWEEP_METRICS]
+
+
+def _completed_trials(store):
+    if not os.path.isfile(store):
+        return set()
+    with open(store, newline='') as f:
+        return set(row['trial'] for row in csv.DictReader(f))
+
+
+def _append_result(store, row):
+    new_store = not os.path.isfile(store)
+    with open(store, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=_result_fields())
+        if new_store:
+            writer.writeheader()
+        writer.writerow(row)
+
+
+def load_results(store, keys=None):
+    """Reads the results store of a sweep.
+
+    :param store: path of the CSV results file.
+    :type store: string
+    :param keys: keys of the trials to keep, all of them by default.
+    :type keys: set
+    :rtype: pandas.DataFrame
+
+    """
+    results = pd.read_csv(store)
+    if keys is not None:
+        results = results[results['trial'].isin(keys)]
+    return results
+
+
+def _set_session(threads):
+    import tensorflow as tf
+    from keras import backend as K
+
+    config = tf.ConfigProto(
+        intra_op_parallelism_threads=threads,
+        inter_op_parallelism_threads=1,
+        allow_soft_placement=True)
+    K.set_session(tf.Session(config=config))
+
+
+def _init_worker(threads):
+    """Pins the worker to *threads* CPU threads and gives it its own
+    TensorFlow session."""
+    global _worker_threads
+    _worker_threads = threads
+    _set_session(threads)
+
+
+@lru_cache(maxsize=4)
+def _prepared_dataset(file_name, columns, predict_col, n_input, n_output):
+    from .lstm_forecast import _prepare_time_series
+    from .utils import get_time_series
+
+    dataset = get_time_series(
+        file_name, list(columns) if columns is not None else None)
+    X, y, scaler, predict_col_name = _prepare_time_series(
+        dataset, predict_col, n_input, n_output)
+    return len(dataset.index), len(dataset.columns), X, y, scaler, \
+        predict_col_name
+
+
+def _run_trial(args):
+    """Trains and evaluates the model of a trial in a worker. Returns the row
+    of the results store, or the error if the trial failed."""
+    from keras import backend as K
+    from .lstm_forecast import _fit_model_experiments, _split_dataset
+
+    key, trial, shared = args
+    columns = tuple(trial['columns']) if trial['columns'] else None
+    started = time.time()
+    try:
+        n_rows, n_features, X, y, scaler, predict_col_name = \
+            _prepared_dataset(
+                shared['file_name'], columns, shared['predict_col'],
+                trial['n_input'], shared['n_output'])
+        n_train_hours = shared['n_train_hours'] or \
+            int(n_rows * shared['train_prop'])
+        train_X, train_y, test_X, test_y = _split_dataset(
+            X, y, n_train_hours)
+        train_stats, test_stats = _fit_model_experiments(
+            train_X, train_y, test_X, test_y, trial['epochs'],
+            trial['neurons'], trial['batch_size'], scaler, trial['n_input'],
+            n_features, predict_col_name, shared.get('patience'))
+    except Exception as e:
+        return key, None, repr(e)
+    finally:
+        # Free the graph of the trained model for the next trial
+        K.clear_session()
+        _set_session(_worker_threads)
+
+    row = dict(
+        trial, trial=key, file_name=shared['file_name'],
+        seconds=round(time.time() - started, 2),
+        columns=json.dumps(trial['columns']))
+    if train_stats['epochs'] < trial['epochs']:
+        print('Trial {} stopped early after {} epochs.'.format(
+            key, train_stats['epochs']))
+    for m in SWEEP_METRICS:
+        row['train_' + m] = train_stats[m]
+        row['test_' + m] = test_stats[m]
+    return key, row, None
+
+
+def run_sweep(
+        file_name, trials, store, predict_col=1, train_prop=0.7, n_output=1,
+        n_train_hours=None, workers=None, threads=None, restart=False,
+        patience=None):
+    """Trains the trials of a hyperparameter sweep in a pool of processes.
+    Each worker has its own TensorFlow session pinned to *threads* CPU
+    threads, and each result is appended to the *store* CSV file as soon as
+    its trial finishes: the trials already in the store are skipped, so an
+    interrupted sweep is resumed by running it again.
+
+        >>> trials = grid_trials({'epochs': [50, 100], 'batch_size': [24, 48]})
+        >>> run_sweep('10001_aq_series.csv', trials, '10001_sweep.csv')
+
+    :param file_name: CSV file from which to load the experiment data.
+    :type file_name: string
+    :param trials: the trials, see grid_trials and random_trials.
+    :type trials: dict[]
+    :param store: path of the CSV results file.
+    :type store: string
+    :param predict_col: index of column to be predicted.
+    :type predict_col: int
+    :param train_prop: percentage of dataset values to use as training set.
+    :type train_prop: float
+    :param n_output: number of future time lags to predict for pollutant.
+    :type n_output: int
+    :param n_train_hours: number of values of the training set, overrides
+        train_prop.
+    :type n_train_hours: int
+    :param workers: number of processes, the number of CPUs by default.
+    :type workers: int
+    :param threads: CPU threads of each process, by default the CPUs are
+        shared among the processes.
+    :type threads: int
+    :param restart: if to discard the results already in the store.
+    :type restart: boolean
+    :param patience: epochs without improvement of the validation loss to
+        stop each trial after, None to run all its epochs.
+    :type patience: int
+    :rtype: pandas.DataFrame
+
+    Returns:
+        results: the rows of the store for the given trials.
+
+    """
+    shared = {
+        'file_name': file_name,
+        'predict_col': predict_col,
+        'train_prop': train_prop,
+        'n_output': n_output,
+        'n_train_hours': n_train_hours
+    }
+    # Only in the keys of early stopped trials, so the stores are still valid
+    if patience is not None:
+        shared['patience'] = patience
+    keyed = [(trial_key(t, shared), t) for t in trials]
+    keys = set(k for k, t in keyed)
+
+    if restart and os.path.isfile(store):
+        os.remove(store)
+    completed = _completed_trials(store)
+    pending = [(k, t, shared) for k, t in keyed if k not in completed]
+    print('Sweep of {} trials, {} already completed.'.format(
+        len(keyed), len(keyed) - len(pending)))
+
+    if pending:
+        cpus = multiprocessing.cpu_count()
+        workers = min(workers or cpus, len(pending))
+        threads = threads or max(1, cpus // workers)
+
+        # The workers are forked: they must not share the database sockets
+        connections.close_all()
+        pool = multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(threads, ))
+        try:
+            done = 0
+            for key, row, error in pool.imap_unordered(_run_trial, pending):
+                done += 1
+                if error is not None:
+                    logger.error('Sweep trial {} failed: {}'.format(
+                        key, error))
+                    print('{}/{}) Failed: {}'.format(
+                        done, len(pending), error))
+                    continue
+                _append_result(store, row)
+                print('{}/{}) {} TestMAE={:f} TestRMSE={:f}'.format(
+                    done, len(pending), key, row['test_mae'],
+                    row['test_rmse']))
+        finally:
+            pool.terminate()
+            pool.join()
+
+    if not os.path.isfile(store):
+        return pd.DataFrame(columns=_result_fields())
+    return load_results(store, keys)
+
+
+def plot_sweep_results(results, by='epochs', file_tag='sweep'):
+    """Prints the statistics of the test metrics of a sweep for each value of
+    the *by* hyperparameter, and saves their boxplots to
+    FIGS_DATA_DIR/<by>/<metric>_stats_<file_tag>.png.
+
+    :param results: the results of the sweep, see run_sweep and load_results.
+    :type results: pandas.DataFrame
+    :param by: the hyperparameter to compare.
+    :type by: string
+    :param file_tag: suffix of the figure files.
+    :type file_tag: string
+
+    """
+    # lstm_forecast selects the matplotlib backend before pyplot is imported
+    from .lstm_forecast import plt
+
+    figs_dir = os.path.join(FIGS_DATA_DIR, by)
+    os.makedirs(figs_dir, exist_ok=True)
+
+    plt.figure(figsize=(12, 6))
+    for m in SWEEP_METRICS:
+        v = pd.DataFrame({
+            str(value): group.reset_index(drop=True)
+            for value, group in results.groupby(by)['test_' + m]
+        })
+        plt.clf()
+        print(m.upper() + ':')
+        print(v.describe())
+        print()
+        v.boxplot()
+        plt.savefig(
+            os.path.join(figs_dir, '%s_stats_%s.png' % (m, file_tag)),
+            quality=100, format='png', pad_inches=0.25)
+    plt.close()
@@ -1,3 +1,301 @@
-from django.test import TestCase
+import os
+import time
+import shutil
+import datetime
+import tempfile
+import threading
+from concurrent.futures import TimeoutError
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from au_epa_data.models import Site
+
+from . import online, pipeline
+from .batching import PredictionBatcher
+from .models import Forecast
+from .rest_views import SiteForecastView
+from .utils import _read_time_series_cache, write_time_series_cache
+from .windowing import (
+    multi_output_windows, supervised_windows, target_position)
+
+
+class RecordingModel(object):
+    """Returns the sum of each sample, recording the samples of each call and
+    blocking the calls until *release* is set."""
+
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def predict(self, X):
+        self.calls.append(len(X))
+        self.started.set()
+        self.release.wait()
+        return X.sum(axis=(1, 2))
+
+
+class PredictionBatcherTest(SimpleTestCase):
+
+    def setUp(self):
+        self.batcher = PredictionBatcher(max_batch_size=8, max_wait=0.05)
+        self.model = RecordingModel()
+
+    def test_batch(self):
+        futures = [
+            self.batcher.submit(self.model, np.full((1, 2, 1), i))
+            for i in range(3)]
+        self.assertEqual(
+            [f.result(timeout=5).tolist() for f in futures],
+            [[0], [2], [4]])
+        self.assertEqual(self.model.calls, [3])
+
+    def test_cancelled_request_dropped(self):
+        cancelled = self.batcher.submit(self.model, np.ones((2, 2, 1)))
+        self.assertTrue(cancelled.cancel())
+        future = self.batcher.submit(self.model, np.ones((1, 2, 1)))
+        self.assertEqual(future.result(timeout=5).tolist(), [2])
+        self.assertEqual(self.model.calls, [1])
+
+    def test_timed_out_prediction_dropped(self):
+        # The batcher is busy with a first prediction
+        self.model.release.clear()
+        first = self.batcher.submit(self.model, np.ones((1, 2, 1)))
+        self.assertTrue(self.model.started.wait(5))
+
+        with self.assertRaises(TimeoutError):
+            self.batcher.predict(self.model, np.ones((4, 2, 1)), timeout=0.01)
+        self.model.release.set()
+        first.result(timeout=5)
+
+        yhat = self.batcher.predict(
+            self.model, np.ones((1, 2, 1)), timeout=5)
+        self.assertEqual(yhat.tolist(), [2])
+        # The timed out request never reached the model
+        self.assertEqual(self.model.calls, [1, 1])
+
+
+def series_to_supervised(values, n_input, n_output):
+    """The frame of the former lstm_forecast._series_to_supervised: the
+    n_input previous and n_output next rows of each row side by side, without
+    the rows with a NaN."""
+    df = pd.DataFrame(values)
+    return pd.concat(
+        [df.shift(i) for i in range(n_input, 0, -1)] +
+        [df.shift(-i) for i in range(n_output)], axis=1).dropna().values
+
+
+class WindowingTest(SimpleTestCase):
+
+    def series(self, n_rows, n_features, nans):
+        values = np.random.RandomState(0).rand(
+            n_rows, n_features).astype('float32')
+        for row in nans:
+            values[row, row % n_features] = np.nan
+        return values
+
+    def test_supervised_frame(self):
+        for n_rows, nans in ((60, ()), (60, (0, 7, 30, 59)), (5, (2, ))):
+            for n_features in (1, 3):
+                values = self.series(n_rows, n_features, nans)
+                for n_input in (1, 3, 24):
+                    for n_output in (1, 3):
+                        with self.subTest(
+                                n_rows=n_rows, nans=nans,
+                                n_features=n_features, n_input=n_input,
+                                n_output=n_output):
+                            self.check_windows(
+                                values, n_input, n_output)
+
+    def check_windows(self, values, n_input, n_output):
+        n_features = values.shape[1]
+        frame = series_to_supervised(values, n_input, n_output)
+        frame_X = frame[:, :n_input * n_features].reshape(
+            -1, n_input, n_features)
+
+        for predict_col in range(1, n_features + 1):
+            target_col, target_lag = target_position(
+                predict_col, n_features, n_output)
+            X, y = supervised_windows(
+                values, n_input, n_output, target_col, target_lag)
+            np.testing.assert_array_equal(X, frame_X)
+            np.testing.assert_array_equal(
+                y, frame[:, (n_input + target_lag) * n_features + target_col])
+
+        target_cols = list(range(n_features))[::-1]
+        X, Y = multi_output_windows(values, n_input, n_output, target_cols)
+        np.testing.assert_array_equal(X, frame_X)
+        np.testing.assert_array_equal(Y, np.column_stack([
+            frame[:, (n_input + lag) * n_features + col]
+            for col in target_cols for lag in range(n_output)]))
+
+
+class ForecastDeadlineTest(SimpleTestCase):
+
+    def setUp(self):
+        self.site = mock.Mock(site_id=10001)
+        self.batcher = mock.Mock()
+        self.batcher.predict.side_effect = TimeoutError
+        model = mock.Mock(columns=['PM2.5'], n_input=2)
+        model.scaler.transform.side_effect = lambda values: values
+        window = pd.DataFrame({'PM2.5': [1.0, 2.0]})
+        for patcher in (
+                mock.patch.object(
+                    online.registry, 'get_target_model', return_value=model),
+                mock.patch.object(
+                    online, 'latest_window', return_value=window)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_remaining_time(self):
+        deadline = time.monotonic() + 1
+        with self.assertRaises(TimeoutError):
+            online.forecast(
+                self.site, 'PM2.5', deadline=deadline, batcher=self.batcher)
+        timeout = self.batcher.predict.call_args[0][2]
+        self.assertTrue(0 < timeout <= 1)
+
+    def test_spent_budget(self):
+        # Loading the model and reading its input took the whole budget
+        with self.assertRaises(TimeoutError):
+            online.forecast(
+                self.site, 'PM2.5', deadline=time.monotonic(),
+                batcher=self.batcher)
+        self.batcher.predict.assert_not_called()
+
+
+class StoredForecastTest(TestCase):
+    multi_db = True
+
+    def store(self, site, hours_ago):
+        issued_at = timezone.now().replace(
+            minute=0, second=0, microsecond=0) - datetime.timedelta(
+                hours=hours_ago)
+        for horizon in (1, 2):
+            Forecast.objects.create(
+                site=site, pollutant='PM2.5', issued_at=issued_at,
+                horizon=horizon,
+                date_time=issued_at + datetime.timedelta(hours=horizon),
+                value=5.0 + horizon, aqi_category='VG', model_version=1)
+
+    def test_max_age(self):
+        site = Site.objects.create(site_id=10001, name='Alphington')
+        self.assertIsNone(online.stored_forecast(site, 'PM2.5'))
+
+        self.store(site, 1)
+        data = online.stored_forecast(site, 'PM2.5')
+        self.assertEqual(
+            [f['value'] for f in data['forecasts']], [6.0, 7.0])
+
+        # The forecasts stopped being precomputed
+        Forecast.objects.all().delete()
+        self.store(site, 6)
+        with self.assertLogs('myaqi', 'WARNING'):
+            self.assertIsNone(online.stored_forecast(site, 'PM2.5'))
+
+
+class SiteForecastViewTest(TestCase):
+    multi_db = True
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.create(site_id=10001, name='Alphington')
+
+    def get(self, query):
+        request = APIRequestFactory().get('/forecasts/10001/PM2.5', query)
+        return SiteForecastView.as_view()(
+            request, site_id=10001, pollutant='PM2.5')
+
+    def test_invalid_version(self):
+        with mock.patch('forecasting.rest_views.forecast') as forecast:
+            self.assertEqual(self.get({'version': 'latest'}).status_code, 400)
+        forecast.assert_not_called()
+
+    def test_errors(self):
+        with mock.patch(
+                'forecasting.rest_views.forecast',
+                side_effect=LookupError('No model registered.')):
+            self.assertEqual(self.get({'version': '2'}).status_code, 404)
+        # Not hidden as an unknown model
+        with mock.patch(
+                'forecasting.rest_views.forecast',
+                side_effect=ValueError('Shape mismatch.')):
+            with self.assertRaises(ValueError):
+                self.get({'live': 'true'})
+
+
+class TimeSeriesCacheTest(SimpleTestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        self.file = os.path.join(self.data_dir, '10001_aq_series.csv')
+        with open(self.file, 'w') as f:
+            f.write('No,date,BPM2.5\n')
+        patcher = mock.patch(
+            'forecasting.utils.ARRAYS_DATA_DIR',
+            os.path.join(self.data_dir, 'arrays'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_round_trip(self):
+        values = {'BPM2.5': [1.5, 2.0], 'CO': [1, 2]}
+        dates = ['2018-01-01 00:00:00', '2018-01-01 01:00:00']
+        for index in (
+                pd.Index(dates), pd.DatetimeIndex(dates),
+                pd.DatetimeIndex(dates).tz_localize('Australia/Melbourne')):
+            with self.subTest(dtype=str(index.dtype)):
+                dataset = pd.DataFrame(values, index=index.rename('date'))
+                self.assertTrue(write_time_series_cache(dataset, self.file))
+                cached = _read_time_series_cache(self.file, None)
+                pd.testing.assert_frame_equal(cached, dataset)
+                pd.testing.assert_index_equal(cached.index, dataset.index)
+
+        # Written to the arrays directory, not next to the CSV file
+        self.assertEqual(
+            sorted(os.listdir(self.data_dir)),
+            ['10001_aq_series.csv', 'arrays'])
+
+
+class SeriesArrayTest(SimpleTestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        patcher = mock.patch.object(
+            pipeline, 'ARRAYS_DATA_DIR',
+            os.path.join(self.data_dir, 'arrays'))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_csv(self, values, mtime):
+        file = os.path.join(self.data_dir, '10001_aq_series.csv')
+        pd.DataFrame({'PM2.5': values}).to_csv(file)
+        os.utime(file, (mtime, mtime))
+
+    def series_array(self):
+        return pipeline.series_array(
+            '10001_aq_series.csv', ['PM2.5'], file_dir=self.data_dir)
+
+    def test_interrupted_rebuild(self):
+        now = time.time()
+        self.write_csv([1.0, 2.0], now - 300)
+        self.assertEqual(self.series_array()[:, 0].tolist(), [1.0, 2.0])
+        array_file = os.path.join(
+            self.data_dir, 'arrays', '10001_aq_series.npy')
+        os.utime(array_file, (now - 200, now - 200))
+
+        self.write_csv([3.0, 4.0, 5.0], now - 100)
+        with mock.patch.object(
+                pipeline.pd, 'read_csv', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.series_array()
+        # The partial array is not taken for the new series
+        self.assertEqual(
+            self.series_array()[:, 0].tolist(), [3.0, 4.0, 5.0])
@@ -3,6 +3,7 @@ from django.urls import re_path
 from .rest_views import (
     ExperimentsMapDataView,
     FiresExperimentsDataView,
+    SiteForecastView,
     WeatherbitForecastProxy
 )
 
@@ -15,6 +16,10 @@ urlpatterns = [
         r'^experiments/fires-data$', FiresExperimentsDataView.as_view(),
         name='experiments-fire-data'
     ),
+    re_path(
+        r'^forecasts/(?P<site_id>[0-9]+)/(?P<pollutant>[\w.]+)$',
+        SiteForecastView.as_view(), name='site-forecast'
+    ),
     re_path(
         r'^weatherbit-forecasts$', WeatherbitForecastProxy.as_view(),
         name='weatherbit-forecasts'
@@ -5,8 +5,9 @@ import datetime
 import numpy as np
 import pandas as pd
 from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
 
-from au_epa_data.models import Site
+from au_epa_data.models import Measurement, Site
 from au_epa_data.serializers import GeoSiteSerializer
 from au_epa_data.constants import POLLUTANT_TO_MONITOR, DATETIME_FORMAT
 from geo_data.models import (
@@ -18,11 +19,35 @@ from geo_data.serializers import (
     FireSerializer, TrafficStationSerializer
 )
 from .constants import (
-    AU_SITES_FORECAST, AQ_DATA_DIR, TRAFFIC_FORECAST_STATIONS,
+    AU_SITES_FORECAST, AQ_DATA_DIR, ARRAYS_DATA_DIR, TRAFFIC_FORECAST_STATIONS,
     TRAFFIC_STATIONS, HISTORICAL_DATA_FILE, FIRE_SEVERITIES
 )
 
 
+def get_datetime_span_index(start_date, end_date):
+    """Returns the date strings spanning hourly between start_date and
+    end_date, the same keys get_datetime_span_dict uses and in the same order.
+
+    :param start_date: date and time from where to start the range.
+    :type start_date: datetime.datetime
+    :param end_date: date and time on which to stop the range.
+    :type end_date: datetime.datetime
+    :rtype: pandas.Index
+
+    """
+    aware_start = timezone.make_aware(start_date, is_dst=False)
+    aware_end = timezone.make_aware(end_date, is_dst=False)
+    # Hours are added to the local start date with its fixed UTC offset
+    periods = (aware_end - aware_start) // datetime.timedelta(hours=1) + 1
+    dates = pd.date_range(
+        start_date, periods=max(periods, 0), freq='H').strftime(
+            DATETIME_FORMAT)
+    end_str = end_date.strftime(DATETIME_FORMAT)
+    if end_str not in dates:
+        dates = dates.append(pd.Index([end_str]))
+    return pd.Index(dates)
+
+
 def get_datetime_span_dict(start_date, end_date, empty_type=[]):
     """Returns a dictionary of dates spanning between start_date and end_date.
     The keys are the datestrings and the empty_type will be the value.
@@ -36,17 +61,23 @@ def get_datetime_span_dict(start_date, end_date, empty_type=[]):
     :rtype: dict
     
     """
-    span_dict = {}
-    print(start_date, end_date)
-    date = timezone.make_aware(start_date, is_dst=False)
-    end_date = timezone.make_aware(end_date, is_dst=False)
+    return {
+        date: copy.deepcopy(empty_type)
+        for date in get_datetime_span_index(start_date, end_date)
+    }
+
 
-    while date <= end_date:
-        span_dict[date.strftime(DATETIME_FORMAT)] = copy.deepcopy(empty_type)
-        date = date + datetime.timedelta(hours=1)
-    span_dict[end_date.strftime(DATETIME_FORMAT)] = copy.deepcopy(empty_type)
+def local_datetime_strings(dates):
+    """Formats UTC datetimes as local date strings, as
+    timezone.localtime(date).strftime(DATETIME_FORMAT) does for one date.
 
-    return span_dict
+    :param dates: aware datetimes.
+    :type dates: datetime.datetime[]
+    :rtype: pandas.Index
+
+    """
+    return pd.DatetimeIndex(pd.to_datetime(dates, utc=True)).tz_convert(
+        timezone.get_current_timezone_name()).strftime(DATETIME_FORMAT)
 
 
 def mean_absolute_percentage_error(y_true, y_pred):
@@ -64,8 +95,103 @@ def mean_absolute_percentage_error(y_true, y_pred):
     return np.mean(np.abs((y_true - y_pred) / y_true)) * 100
 
 
+def _time_series_cache_files(file):
+    # Named apart from the pipeline.series_array files of the same CSV
+    stem = os.path.join(
+        ARRAYS_DATA_DIR,
+        os.path.splitext(os.path.basename(file))[0] + '.series')
+    return stem + '.npy', stem + '.json'
+
+
+def _source_stamp(file):
+    stat = os.stat(file)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def write_time_series_cache(dataset, file):
+    """Stores a time series in ARRAYS_DATA_DIR, as a column-major .npy array
+    of its values and a JSON sidecar with its columns, their types and its
+    dates, so get_time_series can memory-map it instead of parsing the CSV
+    file. Datasets with non numeric columns are not cached.
+
+    :param dataset: the time series, indexed by date.
+    :type dataset: pandas.DataFrame
+    :param file: path of the CSV file of the time series.
+    :type file: string
+    :rtype: boolean
+
+    Returns:
+        cached: if the cache was written.
+
+    """
+    if not all(np.issubdtype(dt, np.number) for dt in dataset.dtypes):
+        return False
+    values_file, meta_file = _time_series_cache_files(file)
+    # The dates are stored as strings, with their type and time zone
+    tz = getattr(dataset.index, 'tz', None)
+    meta = {
+        'columns': list(dataset.columns),
+        'dtypes': [str(dt) for dt in dataset.dtypes],
+        'index_name': dataset.index.name,
+        'index_dtype': str(dataset.index.dtype),
+        'index_tz': None if tz is None else str(tz),
+        'index': dataset.index.astype(str).tolist(),
+        'source': _source_stamp(file) if os.path.isfile(file) else None
+    }
+    os.makedirs(ARRAYS_DATA_DIR, exist_ok=True)
+    # The sidecar is replaced last, it marks the cache as complete
+    with open(values_file + '.tmp', 'wb') as f:
+        np.save(f, np.asfortranarray(dataset.values.astype('float64')))
+    os.replace(values_file + '.tmp', values_file)
+    with open(meta_file + '.tmp', 'w') as f:
+        json.dump(meta, f)
+    os.replace(meta_file + '.tmp', meta_file)
+    return True
+
+
+def _read_time_series_cache(file, columns):
+    values_file, meta_file = _time_series_cache_files(file)
+    try:
+        with open(meta_file) as f:
+            meta = json.load(f)
+        if os.path.isfile(file) and meta['source'] != _source_stamp(file):
+            return None
+        values = np.load(values_file, mmap_mode='r')
+    except (OSError, ValueError, KeyError):
+        return None
+
+    all_columns = meta['columns']
+    if columns is not None:
+        unknown = set(columns) - set(all_columns)
+        if unknown:
+            raise ValueError(
+                'Usecols do not match columns, columns expected but not'
+                ' found: {}'.format(sorted(unknown)))
+    # Same column order as pd.read_csv(usecols=columns)
+    idx = [
+        i for i, c in enumerate(all_columns)
+        if columns is None or c in columns]
+    index = pd.Index(meta['index'], name=meta['index_name'])
+    if meta['index_dtype'].startswith('datetime64'):
+        index = pd.to_datetime(index, utc=meta['index_tz'] is not None)
+        if meta['index_tz'] is not None:
+            index = index.tz_convert(meta['index_tz'])
+    elif meta['index_dtype'] != 'object':
+        index = index.astype(meta['index_dtype'])
+    dataset = pd.DataFrame(
+        np.array(values[:, idx]), index=index,
+        columns=[all_columns[i] for i in idx])
+    dtypes = {
+        all_columns[i]: meta['dtypes'][i] for i in idx
+        if meta['dtypes'][i] != 'float64'}
+    return dataset.astype(dtypes) if dtypes else dataset
+
+
 def get_time_series(file_name, columns=None, file_dir=None):
-    """Load a pollutant levels timeseries dataset from a .csv file.
+    """Load a pollutant levels timeseries dataset. It is read from the .npy
+    cache of the .csv file (see write_time_series_cache), projecting only
+    the requested columns, and the cache is written on the first read of the
+    file and whenever the file changes.
 
     :param file_name: CSV file from which to load the dataset values.
     :type file_name: string
@@ -78,13 +204,18 @@ def get_time_series(file_name, columns=None, file_dir=None):
     """
     file = os.path.join(
         AQ_DATA_DIR if file_dir is None else file_dir, file_name)
-    index_col = 1
-    if columns is not None:
-        columns = ['date'] + columns
-        index_col = 0
-    dataset = pd.read_csv(file, index_col=index_col, usecols=columns)
-    if columns is None:
+    dataset = _read_time_series_cache(file, columns)
+    if dataset is None:
+        dataset = pd.read_csv(file, index_col=1)
         dataset.drop('No', axis=1, inplace=True)
+        write_time_series_cache(dataset, file)
+        if columns is not None:
+            unknown = set(columns) - set(dataset.columns)
+            if unknown:
+                raise ValueError(
+                    'Usecols do not match columns, columns expected but not'
+                    ' found: {}'.format(sorted(unknown)))
+            dataset = dataset[[c for c in dataset.columns if c in columns]]
     # summarize first 5 rows
     print(dataset.head(5))
     return dataset
@@ -153,74 +284,204 @@ def get_experimental_data(
 
     """
 
-    timeline = get_datetime_span_dict(
-        start_date, end_date, empty_type={
-            'sites': {site: [] for site in AU_SITES_FORECAST},
-            'traffic_flows': {tf: 0 for tf in TRAFFIC_STATIONS},
-            'fires': []
-        }
-    )
-
-    sites = Site.objects.filter(
-        site_id__in=AU_SITES_FORECAST).prefetch_related('measurements')
+    sites = list(Site.objects.filter(site_id__in=AU_SITES_FORECAST))
     traffic_stations = TrafficStation.objects.all()
+    timeline = dict(iter_experimental_timeline(sites, start_date, end_date))
+
+    results = {
+        'sites': GeoSiteSerializer(sites, many=True).data,
+        'traffic_stations': TrafficStationSerializer(
+            traffic_stations, many=True).data,
+        'timeline': timeline,
+    }
+    if include_fires:
+        results['fires'] = get_sites_fires(start_date, end_date)
+
+    if save_file:
+        with open(HISTORICAL_DATA_FILE, 'w') as f:
+            f.write(json.dumps(results))
+    return results
+
+
+def _rows_by_date(rows):
+    """Groups a stream of rows ordered by their first element, an aware
+    datetime, by its local date string.
+
+    :param rows: rows ordered by date.
+    :type rows: iterator
+    :rtype: iterator(tuple(string, tuple[]))
+
+    """
+    current_date, group = None, []
+    for row in rows:
+        date_str = timezone.localtime(row[0]).strftime(DATETIME_FORMAT)
+        if date_str != current_date:
+            if group:
+                yield current_date, group
+            current_date, group = date_str, []
+        group.append(row)
+    if group:
+        yield current_date, group
+
+
+def _align_to_dates(dates, groups):
+    """Yields the rows of each date string of *dates* from a stream of
+    (date_str, rows) groups ordered by date, an empty list for the dates
+    without rows. Groups of dates out of *dates* are skipped.
+
+    :rtype: iterator(tuple[])
+
+    """
+    group = next(groups, None)
+    for date_str in dates:
+        rows = []
+        while group is not None and group[0] <= date_str:
+            if group[0] == date_str:
+                rows = group[1]
+            group = next(groups, None)
+        yield rows
+
+
+def _active_fires(fire_intervals, date_str):
+    """Returns the fires burning at a date, and the date from which that
+    list may change.
 
+    :param fire_intervals: (pk, first date_str, last date_str) of each fire.
+    :type fire_intervals: tuple[]
+    :rtype: tuple(int[], function)
+
+    """
+    active = [pk for pk, start, end in fire_intervals
+              if start <= date_str <= end]
+    next_start = min(
+        (start for pk, start, end in fire_intervals if start > date_str),
+        default=None)
+    last_end = min(
+        (end for pk, start, end in fire_intervals
+         if start <= date_str <= end),
+        default=None)
+
+    def changes_at(d):
+        return ((next_start is not None and d >= next_start) or
+                (last_end is not None and d > last_end))
+    return active, changes_at
+
+
+def iter_experimental_timeline(sites, start_date, end_date):
+    """Yields the timeline of get_experimental_data hour by hour, reading
+    the measurements and traffic flows of all the sites from two ordered
+    database cursors, so the memory used does not grow with the date range.
+
+    :param sites: the AQ monitoring sites to include.
+    :type sites: Site[]
+    :param start_date: date and time from where to start retrieving the data.
+    :type start_date: datetime.datetime
+    :param end_date: date and time on which to stop retrieving the data.
+    :type end_date: datetime.datetime
+    :rtype: iterator(tuple(string, dict))
+
+    """
+    sites = list(sites)
+    # Traffic flows are set in the order of their sites
+    stations_order = {}
     for s in sites:
-        site_measurements = s.measurements.filter(
-            date_time_start__gte=start_date,
-            date_time_start__lte=end_date).values(
-                'monitor_id', 'value', 'date_time_start').order_by(
-                    'date_time_start')
-        for m in site_measurements:
-            date_str = timezone.localtime(m['date_time_start']).strftime(
-                DATETIME_FORMAT)
-            timeline[date_str]['sites'][str(s.site_id)].append({
-                POLLUTANT_TO_MONITOR[m['monitor_id']]: m['value']})
-
-        traffic_flows = TrafficFlow.objects.filter(
-            nb_scats_site__in=TRAFFIC_FORECAST_STATIONS[str(s.site_id)],
-            qt_interval_count__gte=start_date,
-            qt_interval_count__lte=end_date).values(
-                'nb_scats_site', 'traffic_volume', 'qt_interval_count'
-        ).order_by('qt_interval_count')
-        for tf in traffic_flows:
-            date_str = timezone.localtime(tf['qt_interval_count']).strftime(
-                DATETIME_FORMAT)
-            timeline[date_str]['traffic_flows'][str(tf['nb_scats_site'])] = (
-                tf['traffic_volume'])
+        for station in TRAFFIC_FORECAST_STATIONS[str(s.site_id)]:
+            stations_order.setdefault(int(station), len(stations_order))
 
+    fire_intervals = []
+    for s in sites:
         s.set_fire_area_radius()
         fires = Fire.objects.filter(
             start_date__gte=start_date,
             start_date__lte=end_date,
             season__in=[2017, 2018],
             geom__intersects=s.fire_area
-        )
-        for f in fires:
+        ).values_list('pk', 'start_date', 'fire_svrty')
+        for pk, fire_start, fire_svrty in fires:
+            if pk in (f[0] for f in fire_intervals):
+                continue
             date_t = datetime.datetime(
-                f.start_date.year, f.start_date.month, f.start_date.day, 0, 0)
+                fire_start.year, fire_start.month, fire_start.day, 0, 0)
             stop_date = date_t + datetime.timedelta(
-                days=FIRE_SEVERITIES[f.fire_svrty])
-            while date_t <= stop_date:
-                date_str = timezone.make_aware(date_t, is_dst=False).strftime(
-                    DATETIME_FORMAT)
-                if f.pk not in timeline[date_str]['fires']:
-                    timeline[date_str]['fires'].append(f.pk)
-                date_t = date_t + datetime.timedelta(hours=1)
+                days=FIRE_SEVERITIES[fire_svrty])
+            fire_intervals.append((
+                pk, date_t.strftime(DATETIME_FORMAT),
+                stop_date.strftime(DATETIME_FORMAT)))
+
+    measurements = _rows_by_date(Measurement.objects.filter(
+        site_id__in=[s.site_id for s in sites],
+        date_time_start__gte=start_date,
+        date_time_start__lte=end_date).order_by(
+            'date_time_start').values_list(
+                'date_time_start', 'site_id', 'monitor_id', 'value'
+    ).iterator())
+    traffic_flows = _rows_by_date(TrafficFlow.objects.filter(
+        nb_scats_site__in=stations_order.keys(),
+        qt_interval_count__gte=start_date,
+        qt_interval_count__lte=end_date).order_by(
+            'qt_interval_count').values_list(
+                'qt_interval_count', 'nb_scats_site', 'traffic_volume'
+    ).iterator())
+
+    dates = get_datetime_span_index(start_date, end_date)
+    fires, fires_change_at = [], lambda d: True
+    for date_str, site_measurements, site_flows in zip(
+            dates, _align_to_dates(dates, measurements),
+            _align_to_dates(dates, traffic_flows)):
+        entry = {
+            'sites': {site: [] for site in AU_SITES_FORECAST},
+            'traffic_flows': {tf: 0 for tf in TRAFFIC_STATIONS},
+            'fires': []
+        }
+        for date, site_id, monitor_id, value in site_measurements:
+            entry['sites'][str(site_id)].append({
+                POLLUTANT_TO_MONITOR[monitor_id]: value})
+        for date, station, volume in sorted(
+                site_flows, key=lambda tf: stations_order[tf[1]]):
+            entry['traffic_flows'][str(station)] = volume
+        if fires_change_at(date_str):
+            fires, fires_change_at = _active_fires(fire_intervals, date_str)
+        entry['fires'] = list(fires)
+        yield date_str, entry
+
+
+def stream_experimental_data(start_date, end_date, ndjson=False):
+    """Serializes the data of get_experimental_data as it is read from the
+    database, one hour of the timeline at a time.
 
-    results = {
+    :param start_date: date and time from where to start retrieving the data.
+    :type start_date: datetime.datetime
+    :param end_date: date and time on which to stop retrieving the data.
+    :type end_date: datetime.datetime
+    :param ndjson: if to write one JSON document per line, the first one with
+        the sites and traffic stations and then one per hour with its `date`,
+        instead of a single JSON document.
+    :type ndjson: boolean
+    :rtype: iterator(string)
+
+    """
+    sites = list(Site.objects.filter(site_id__in=AU_SITES_FORECAST))
+    header = {
         'sites': GeoSiteSerializer(sites, many=True).data,
         'traffic_stations': TrafficStationSerializer(
-            traffic_stations, many=True).data,
-        'timeline': timeline,
+            TrafficStation.objects.all(), many=True).data,
     }
-    if include_fires:
-        results['fires'] = get_sites_fires(start_date, end_date)
-
-    if save_file:
-        with open(HISTORICAL_DATA_FILE, 'w') as f:
-            f.write(json.dumps(results))
-    return results
+    timeline = iter_experimental_timeline(sites, start_date, end_date)
+
+    if ndjson:
+        yield json.dumps(header, cls=JSONEncoder) + '\n'
+        for date_str, entry in timeline:
+            yield json.dumps(
+                dict(date=date_str, **entry), cls=JSONEncoder) + '\n'
+        return
+
+    yield json.dumps(header, cls=JSONEncoder)[:-1] + ', "timeline": {'
+    separator = ''
+    for date_str, entry in timeline:
+        yield '{0}{1}: {2}'.format(
+            separator, json.dumps(date_str), json.dumps(entry, cls=JSONEncoder))
+        separator = ', '
+    yield '}}'
 
 
 def get_sites_fires(
@@ -0,0 +1,185 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
+def target_position(predict_col, n_features, n_output=1):
+    """Returns the column and the time lag of the value to predict, the one
+    of the output columns kept by the supervised frame of the lstm_forecast
+    module.
+
+    :param predict_col: index (starting at 1) of the column to be predicted.
+    :type predict_col: int
+    :param n_features: number of variables.
+    :type n_features: int
+    :param n_output: number of next time lags of the output sequence.
+    :type n_output: int
+    :rtype: tuple(int, int)
+
+    Returns:
+        (target_col, target_lag): the index of the column (starting at 0) and
+        the lag after the input sequence (0 is the next hour).
+
+    """
+    if predict_col is None or predict_col <= 1:
+        return 0, 0
+    if predict_col >= n_features:
+        return n_features - 1, n_output - 1
+    return predict_col - 1, 0
+
+
+def supervised_windows(
+        values, n_input, n_output=1, target_col=0, target_lag=0):
+    """Frames a time series for supervised learning: each sample has the
+    *n_input* previous rows of all the variables as input and one value of
+    the next *n_output* rows as target. The input is a read-only strided view
+    of *values*, nothing is copied unless the series has missing values (the
+    samples whose input or output rows have a NaN are dropped).
+
+    :param values: the (normalised) time series, one row per hour.
+    :type values: numpy.array
+    :param n_input: number of previous time lags to consider for prediction.
+    :type n_input: int
+    :param n_output: number of next time lags of the output sequence.
+    :type n_output: int
+    :param target_col: index of the column to be predicted.
+    :type target_col: int
+    :param target_lag: time lag of the output sequence to be predicted.
+    :type target_lag: int
+    :rtype: tuple(numpy.array, numpy.array)
+
+    Returns:
+        (X, y): the [samples, timesteps, features] input and the target of
+        each sample.
+
+    """
+    values = np.ascontiguousarray(values)
+    n_rows, n_features = values.shape
+    n_samples = max(n_rows - n_input - n_output + 1, 0)
+    row_stride, col_stride = values.strides
+
+    X = as_strided(
+        values, shape=(n_samples, n_input, n_features),
+        strides=(row_stride, row_stride, col_stride), writeable=False)
+    start = n_input + target_lag
+    y = values[start:start + n_samples, target_col]
+
+    missing = np.isnan(values).any(axis=1)
+    if missing.any():
+        window = np.ones(n_input + n_output, dtype=int)
+        keep = np.convolve(missing, window, mode='valid') == 0
+        # convolve returns extra values when the series is shorter than the
+        # window, there are no samples then
+        X, y = X[keep[:n_samples]], y[keep[:n_samples]]
+    return X, y
+
+
+def multi_output_windows(values, n_input, n_output, target_cols):
+    """Frames a time series for supervised learning of several targets and
+    horizons at once: each sample has the *n_input* previous rows of all the
+    variables as input, shared by all the targets, and the next *n_output*
+    rows of each target column as output. The samples whose input or output
+    rows have a NaN are dropped.
+
+    :param values: the (normalised) time series, one row per hour.
+    :type values: numpy.array
+    :param n_input: number of previous time lags to consider for prediction.
+    :type n_input: int
+    :param n_output: number of next time lags to predict.
+    :type n_output: int
+    :param target_cols: indexes of the columns to be predicted.
+    :type target_cols: int[]
+    :rtype: tuple(numpy.array, numpy.array)
+
+    Returns:
+        (X, Y): the [samples, timesteps, features] input and the
+        [samples, targets * n_output] outputs, the n_output hours of the
+        first target, then the ones of the second, etc. (see
+        output_position).
+
+    """
+    values = np.ascontiguousarray(values)
+    n_rows, n_features = values.shape
+    n_samples = max(n_rows - n_input - n_output + 1, 0)
+    row_stride, col_stride = values.strides
+
+    X = as_strided(
+        values, shape=(n_samples, n_input, n_features),
+        strides=(row_stride, row_stride, col_stride), writeable=False)
+    targets = values[n_input:, list(target_cols)]
+    t_row_stride, t_col_stride = targets.strides
+    Y = as_strided(
+        targets, shape=(n_samples, len(target_cols), n_output),
+        strides=(t_row_stride, t_col_stride, t_row_stride),
+        writeable=False).reshape(n_samples, len(target_cols) * n_output)
+
+    missing = np.isnan(values).any(axis=1)
+    if missing.any():
+        window = np.ones(n_input + n_output, dtype=int)
+        keep = np.convolve(missing, window, mode='valid') == 0
+        X, Y = X[keep[:n_samples]], Y[keep[:n_samples]]
+    return X, Y
+
+
+def output_position(target, horizon, n_output):
+    """Returns the index of the output of a target and horizon of the
+    outputs framed by multi_output_windows.
+
+    :param target: index of the target among the predicted columns.
+    :type target: int
+    :param horizon: hours after the input sequence (1 is the next hour).
+    :type horizon: int
+    :param n_output: number of next time lags predicted.
+    :type n_output: int
+    :rtype: int
+
+    """
+    return target * n_output + horizon - 1
+
+
+def input_windows(values, n_input):
+    """Frames a time series as the inputs of a trained model: the window of
+    the *n_input* previous rows ending at each row, from the n_input-th one,
+    as a read-only strided view of *values*.
+
+    :param values: the (normalised) time series, one row per hour.
+    :type values: numpy.array
+    :param n_input: number of previous time lags of the input.
+    :type n_input: int
+    :rtype: tuple(numpy.array, numpy.array)
+
+    Returns:
+        (X, complete): the [samples, timesteps, features] input and whether
+        each window has no missing values.
+
+    """
+    values = np.ascontiguousarray(values)
+    n_rows, n_features = values.shape
+    n_samples = max(n_rows - n_input + 1, 0)
+    row_stride, col_stride = values.strides
+
+    X = as_strided(
+        values, shape=(n_samples, n_input, n_features),
+        strides=(row_stride, row_stride, col_stride), writeable=False)
+    missing = np.isnan(values).any(axis=1)
+    complete = np.convolve(
+        missing, np.ones(n_input, dtype=int), mode='valid') == 0
+    return X, complete[:n_samples]
+
+
+def split_windows(X, y, n_train_hours):
+    """Splits the samples into training and test sets, keeping their order.
+
+    :param X: the [samples, timesteps, features] input.
+    :type X: numpy.array
+    :param y: the target of each sample.
+    :type y: numpy.array
+    :param n_train_hours: number of samples to use as training data.
+    :type n_train_hours: int
+    :rtype: tuple(numpy.array, numpy.array, numpy.array, numpy.array)
+
+    Returns:
+        (train_X, train_y, test_X, test_y)
+
+    """
+    return X[:n_train_hours], y[:n_train_hours], X[n_train_hours:], \
+        y[n_train_hours:]
@@ -6,6 +6,7 @@ from geo_data.models import TrafficFlow, Fire
 from .constants import (
     AU_SITES_FORECAST, SITES_MONITORS, AQ_DATA_DIR, TRAFFIC_FORECAST_STATIONS,
     SITES_MONITORS_DATES, FIRES_TITLE_PREFIX)
+from .utils import write_time_series_cache
 
 
 def run(aq_sites=AU_SITES_FORECAST, pollutants=SITES_MONITORS,
@@ -78,5 +79,7 @@ def run(aq_sites=AU_SITES_FORECAST, pollutants=SITES_MONITORS,
         # # save to file
         file_name = file_name.format(s.site_id)
         dataset.to_csv(os.path.join(AQ_DATA_DIR, file_name))
+        write_time_series_cache(
+            dataset.set_index('date'), os.path.join(AQ_DATA_DIR, file_name))
 
         print('Time series saved to:', os.path.join(AQ_DATA_DIR, file_name))
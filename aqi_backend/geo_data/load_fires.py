@@ -1,6 +1,8 @@
 import os
 from django.contrib.gis.utils import LayerMapping
 
+from forecasting.cache import invalidate_experimental_data
+
 from .models import Fire
 from.constants import FIRE_MAPPING
 
@@ -14,3 +16,4 @@ fires_shp = os.path.abspath(
 def run(verbose=True):
     lm = LayerMapping(Fire, fires_shp, FIRE_MAPPING, transform=False)
     lm.save(strict=True, verbose=verbose)
+    invalidate_experimental_data()
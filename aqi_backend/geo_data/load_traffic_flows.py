@@ -5,6 +5,8 @@ import time
 from datetime import datetime, timedelta
 from django.utils import timezone
 
+from forecasting.cache import invalidate_experimental_data
+
 from .models import TrafficFlow
 from .constants import (
     TRAFFIC_FLOW_FIELD_MAPPING, TRAFFIC_FLOW_DATE, TRAFFIC_FLOW_DATE_FORMAT,
@@ -110,6 +112,7 @@ def run(verbose=True):
             else:
                 continue
         continue
+    invalidate_experimental_data()
     print(
         "Done! %d records. Import was executed successfully.\n"
         " It took %.4f minutes." % (
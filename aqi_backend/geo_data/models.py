@@ -1,10 +1,8 @@
-import copy
-import datetime
+import numpy as np
 import pandas as pd
 from django.utils.translation import ugettext_lazy as _
 from django.contrib.gis.db import models
-from django.utils import timezone
-from django.db.models import Avg, Q, Max
+from django.db.models import Avg, Case, Max, Q, Value, When
 
 from au_epa_data.constants import DATETIME_FORMAT
 from forecasting.constants import (
@@ -145,8 +143,9 @@ class Fire(models.Model):
         AQ monitoring station and to be used in a prediction procedure, within
         a given area surrounding the monitoring station.
 
-        :param areas: the size of the areas to consider, in meters.
-        :type areas: int[]
+        :param areas: the areas around the station of each fire situation, as
+            returned by Site.get_fire_situations_areas.
+        :type areas: dict
         :param start_date: date and time from where to start retrieving the
             data.
         :type start_date: datetime.datetime
@@ -160,50 +159,57 @@ class Fire(models.Model):
             value all the corresponding fires that happened at the given date.  
 
         """
-        from forecasting.utils import get_datetime_span_dict
-
-        fires = cls.objects.all()
-        dates = get_datetime_span_dict(
-            start_date, end_date, empty_type=0)
-        fires = fires.filter(
-            start_date__gte=start_date, start_date__lte=end_date)
-
-        # Getting all the fires enclosed in the biggest area
-        fires = fires.filter(geom__intersects=areas[FSITUATION_VERY_LOW])
-
-        for f in fires:
-            f_date = datetime.datetime(
-                f.start_date.year, f.start_date.month, f.start_date.day, 0,
-                0
-            )
-            f_end_date = (
-                f_date +
-                datetime.timedelta(days=FIRE_SEVERITIES[f.fire_svrty]))
-
-            # If fire is here, situation is at least very low
-            fire_situation = FSITUATION_VERY_LOW
-            if f.geom.intersects(areas[FSITUATION_EXTREMELY_HIGH]):
-                fire_situation = FSITUATION_EXTREMELY_HIGH
-            elif f.geom.intersects(areas[FSITUATION_HIGH]):
-                fire_situation = FSITUATION_HIGH
-            elif f.geom.intersects(areas[FSITUATION_MODERATE]):
-                fire_situation = FSITUATION_MODERATE
-            elif f.geom.intersects(areas[FSITUATION_LOW]):
-                fire_situation = FSITUATION_LOW
-
-            while f_date <= f_end_date and f_date <= end_date:
-                date_str = f_date.strftime(DATETIME_FORMAT)
-
-                # Higher situations take priority (when more than one fire at
-                # the same time)
-                if dates[date_str] < fire_situation:
-                    dates[date_str] = fire_situation
-
-                f_date += datetime.timedelta(hours=1)
-
+        from forecasting.utils import get_datetime_span_index
+
+        dates = get_datetime_span_index(start_date, end_date)
+
+        # The situation is the one of the smallest area that the fire reaches,
+        # only the fires in the biggest area are considered
+        situation = Case(
+            *[
+                When(geom__intersects=areas[s], then=Value(s))
+                for s in (
+                    FSITUATION_EXTREMELY_HIGH, FSITUATION_HIGH,
+                    FSITUATION_MODERATE, FSITUATION_LOW)
+            ],
+            default=Value(FSITUATION_VERY_LOW),
+            output_field=models.IntegerField())
+        fires = list(cls.objects.filter(
+            start_date__gte=start_date, start_date__lte=end_date,
+            geom__intersects=areas[FSITUATION_VERY_LOW]).annotate(
+                situation=situation).values_list(
+                    'start_date', 'fire_svrty', 'situation'))
+
+        hours = pd.date_range(start_date, end_date, freq='H')
+        timeline = np.zeros(len(hours), dtype=int)
+        if fires:
+            start_dates, severities, situations = zip(*fires)
+            # Each fire lasts from the midnight of its start date until its
+            # severity days later, both included
+            starts = (
+                np.array(start_dates, dtype='datetime64[h]') -
+                np.datetime64(start_date, 'h')).astype(int)
+            ends = starts + 24 * np.array(
+                [FIRE_SEVERITIES[s] for s in severities])
+            situations = np.array(situations)
+            in_range = (ends >= 0) & (starts < len(hours))
+            starts = np.clip(starts[in_range], 0, None)
+            ends = np.clip(ends[in_range], None, len(hours) - 1)
+            situations = situations[in_range]
+
+            # Higher situations take priority (when more than one fire at the
+            # same time), so they are swept last
+            for s in np.unique(situations):
+                coverage = np.zeros(len(hours) + 1, dtype=int)
+                np.add.at(coverage, starts[situations == s], 1)
+                np.add.at(coverage, ends[situations == s] + 1, -1)
+                timeline[np.cumsum(coverage[:-1]) > 0] = s
+
+        timeline = pd.Series(timeline, index=hours).reindex(
+            pd.to_datetime(dates, format=DATETIME_FORMAT), fill_value=0)
         return {
-            'date': list(dates.keys()),
-            FIRES_TITLE_PREFIX: list(dates.values())
+            'date': list(dates),
+            FIRES_TITLE_PREFIX: timeline.tolist()
         }
 
     class Meta:
@@ -292,53 +298,35 @@ class TrafficFlow(models.Model):
             corresponding traffic volumes for each date.  
 
         """
-        from forecasting.utils import get_datetime_span_dict
+        from forecasting.utils import (
+            get_datetime_span_index, local_datetime_strings)
+
+        dates = get_datetime_span_index(start_date, end_date)
+        frame = pd.DataFrame.from_records(
+            cls.objects.filter(
+                nb_scats_site__in=traffic_flow_ids,
+                qt_interval_count__gte=start_date,
+                qt_interval_count__lte=end_date).order_by(
+                    'qt_interval_count').values_list(
+                        'nb_scats_site', 'qt_interval_count',
+                        'traffic_volume').iterator(),
+            columns=['station', 'date', 'volume'])
+        frame['date'] = local_datetime_strings(frame['date'])
+
+        # The average of each station mends the missing pieces, and the
+        # stations columns are ordered by it
+        averages = frame.groupby('station')['volume'].mean().sort_values(
+            kind='mergesort')
+        volumes = frame.drop_duplicates(['date', 'station']).pivot(
+            index='date', columns='station', values='volume').reindex(
+                index=dates, columns=averages.index)
 
-        traffic_flows = cls.objects.filter(
-            nb_scats_site__in=traffic_flow_ids,
-            qt_interval_count__gte=start_date,
-            qt_interval_count__lte=end_date).order_by('qt_interval_count')
-        dates = get_datetime_span_dict(start_date, end_date)
         data = {
-            'date': []
+            'date': list(dates)
         }
-
-        def get_traffic_label(s):
-            return '{}_{}'.format(TRAFFIC_FLOW_TITLE_PREFIX, s)
-        # Get the average for each station to mend missing pieces
-        # and create the data columns
-        averages = {}
-        for avg in traffic_flows.values('nb_scats_site').annotate(
-                Avg('traffic_volume')).order_by('traffic_volume__avg'):
-            averages[str(avg['nb_scats_site'])] = round(
-                avg['traffic_volume__avg'])
-            data[get_traffic_label(avg['nb_scats_site'])] = []
-
-        for tf in traffic_flows:
-            date_str = timezone.localtime(tf.qt_interval_count).strftime(
-                DATETIME_FORMAT)
-            dates[date_str].append((
-                tf.nb_scats_site, tf.traffic_volume
-            ))
-
-        for date, site_flows in dates.items():
-            # if len(site_flows) != 4:
-            #     print(date, site_flows, len(site_flows))
-            data['date'].append(date)
-            sites_ids_checklist = copy.copy(traffic_flow_ids)
-            for site_flow in site_flows:
-                # if len(site_flows) != 4:
-                #     print(site_flow, sites_ids_checklist)
-                try:
-                    sites_ids_checklist.remove(str(site_flow[0]))
-                except ValueError:
-                    continue
-                else:
-                    data[get_traffic_label(site_flow[0])].append(site_flow[1])
-            for site in sites_ids_checklist:
-                data[get_traffic_label(site)].append(averages[site])
-
-        print(averages)
+        for station, average in averages.items():
+            data['{}_{}'.format(TRAFFIC_FLOW_TITLE_PREFIX, station)] = (
+                volumes[station].fillna(round(average)).astype(int).tolist())
 
         return data
 
@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+import datetime
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+FIXTURES_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), 'fixtures'),
+)
+
+URL_DATE_FORMAT = '%Y%m%d%H'
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+class AirWatchStubHandler(BaseHTTPRequestHandler):
+    """
+    Serves the recorded AirWatch responses of the fixtures directory. The
+    /aqapi/Measurements endpoint returns the entries of the
+    airwatch_measurements_<siteId>_<monitorId>.json fixture that fall in the
+    fromDate/toDate window, any other path returns
+    airwatch_<last path segment>.json. The paths requested are appended to
+    the requested list.
+    """
+    protocol_version = 'HTTP/1.1'
+    fixtures_dir = FIXTURES_DIR
+    delay = 0
+    requested = None
+
+    def _load(self, file_name, default):
+        try:
+            with open(os.path.join(self.fixtures_dir, file_name)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+
+    def _measurements(self, params):
+        root = self._load(
+            'airwatch_measurements_{0}_{1}.json'.format(
+                params.get('siteId'), params.get('monitorId')),
+            {'NumberOfMeasurements': 0, 'Measurements': []})
+        measurements = root['Measurements']
+        if 'timebasisid' in params:
+            measurements = [
+                m for m in measurements
+                if m['TimeBaseId'] == params['timebasisid']]
+        if 'fromDate' in params and 'toDate' in params:
+            from_date = datetime.datetime.strptime(
+                params['fromDate'], URL_DATE_FORMAT)
+            to_date = datetime.datetime.strptime(
+                params['toDate'], URL_DATE_FORMAT)
+            measurements = [
+                m for m in measurements
+                if from_date <= datetime.datetime.strptime(
+                    m['DateTimeStart'], DATETIME_FORMAT) < to_date]
+        return {
+            'NumberOfMeasurements': len(measurements),
+            'Measurements': measurements
+        }
+
+    def do_GET(self):
+        if self.requested is not None:
+            self.requested.append(self.path)
+        url = urllib.parse.urlparse(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        if url.path.endswith('/Measurements'):
+            body = self._measurements(params)
+        else:
+            endpoint = url.path.rstrip('/').split('/')[-1]
+            body = self._load('airwatch_{0}.json'.format(endpoint), None)
+
+        if self.delay:
+            time.sleep(self.delay)
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class AirWatchStub(object):
+    """
+    Local HTTP server replaying recorded AirWatch responses, to run the
+    au_epa_update and au_epa_backfill commands without the real API:
+
+        >>> with AirWatchStub(delay=0.2) as stub:
+        ...     call_command('au_epa_backfill', url=stub.measurements_url)
+        >>> stub.requested
+        ['/aqapi/Measurements?siteId=10001&monitorId=BPM2.5&...', ...]
+
+    """
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR, delay=0, port=0):
+        self.requested = []
+        handler = type('Handler', (AirWatchStubHandler, ), {
+            'fixtures_dir': fixtures_dir,
+            'delay': delay,
+            'requested': self.requested
+        })
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self.thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{0}/aqapi/'.format(self.server.server_port)
+
+    @property
+    def measurements_url(self):
+        return self.url + 'Measurements'
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    stub = AirWatchStub(port=port)
+    print('Serving {0} on {1}'.format(FIXTURES_DIR, stub.url))
+    stub.server.serve_forever()
@@ -0,0 +1,63 @@
+import os
+import json
+import time
+from django.db import router, transaction
+
+from au_epa_data.constants import MEASUREMENT
+from au_epa_data.management.commands.au_epa_update import Command
+from au_epa_data.models import Measurement
+
+FIXTURE = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), 'fixtures',
+        'airwatch_measurements_10001_BPM2.5.json'),
+)
+
+
+class Rollback(Exception):
+    pass
+
+
+def _time_import(root, bulk, batch_size):
+    """Imports the payload twice (insert, then update) inside a transaction
+    that is rolled back, and returns the elapsed seconds of each pass."""
+    db = router.db_for_write(Measurement)
+    timings = []
+    try:
+        with transaction.atomic(using=db):
+            for i in range(2):
+                start_time = time.time()
+                Command().import_entries(
+                    MEASUREMENT, root, bulk=bulk, batch_size=batch_size)
+                timings.append(time.time() - start_time)
+            raise Rollback()
+    except Rollback:
+        pass
+    return timings
+
+
+def run(fixture=FIXTURE, batch_size=500, repeat=3):
+    """Compares the rows per second of the per-row and bulk import paths of
+    the au_epa_update command on a recorded AirWatch measurements payload.
+    Nothing is persisted: every run is rolled back.
+
+    Run it from the ./manage.py shell:
+
+        >>> import sys; sys.path.append('../scripts')
+        >>> import benchmark_au_epa_update
+        >>> benchmark_au_epa_update.run()
+
+    """
+    with open(fixture) as f:
+        root = json.load(f)
+    n_rows = len(root['Measurements'])
+
+    print('%d measurements from %s' % (n_rows, os.path.basename(fixture)))
+    for label, bulk in (('row_by_row', False), ('bulk', True)):
+        inserts, updates = [], []
+        for r in range(repeat):
+            insert_time, update_time = _time_import(root, bulk, batch_size)
+            inserts.append(insert_time)
+            updates.append(update_time)
+        print('%s) insert: %.1f rows/s, update: %.1f rows/s' % (
+            label, n_rows / min(inserts), n_rows / min(updates)))
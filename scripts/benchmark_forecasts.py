@@ -0,0 +1,78 @@
+import time
+import threading
+import numpy as np
+from django.db import connections
+
+from au_epa_data.models import Site
+from forecasting import online, registry
+from forecasting.batching import PredictionBatcher
+from forecasting.constants import FORECAST_LATENCY_BUDGET
+
+
+def _time_clients(call, clients, requests):
+    """Runs *requests* calls from each of *clients* threads and returns the
+    latency of every call and the elapsed seconds."""
+    latencies = []
+    lock = threading.Lock()
+
+    def client():
+        for r in range(requests):
+            start_time = time.time()
+            call()
+            with lock:
+                latencies.append(time.time() - start_time)
+        # Each thread has its own database connections
+        connections.close_all()
+
+    threads = [threading.Thread(target=client) for c in range(clients)]
+    start_time = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return np.array(latencies), time.time() - start_time
+
+
+def _report(label, latencies, elapsed):
+    print('%s) %.1f req/s, p50: %.1f ms, p95: %.1f ms, max: %.1f ms, '
+          'over budget: %d' % (
+              label, len(latencies) / elapsed,
+              np.percentile(latencies, 50) * 1000,
+              np.percentile(latencies, 95) * 1000, latencies.max() * 1000,
+              (latencies > FORECAST_LATENCY_BUDGET).sum()))
+
+
+def run(site_id=10001, pollutant='PM2.5', clients=16, requests=20):
+    """Compares the latency of the online forecasts of a registered model
+    when each request runs its own prediction and when the concurrent
+    requests are micro-batched, first for the prediction alone and then for
+    the whole forecast (input window built from the database included).
+
+    Run it from the ./manage.py shell, with a model registered for the site
+    and pollutant:
+
+        >>> import sys; sys.path.append('../scripts')
+        >>> import benchmark_forecasts
+        >>> benchmark_forecasts.run(site_id=10001, pollutant='PM2.5')
+
+    """
+    site = Site.objects.get(site_id=site_id)
+    model = registry.get_target_model(site_id, pollutant)
+    window = online.latest_window(site, model.columns, model.n_input)
+    X = model.scaler.transform(window.values.astype('float32'))[np.newaxis]
+    print('%s, %d clients x %d requests, window %s - %s' % (
+        model, clients, requests, window.index[0], window.index[-1]))
+
+    unbatched = PredictionBatcher(max_batch_size=1, max_wait=0)
+    batched = PredictionBatcher()
+    for label, batcher in (('predict', unbatched), ('batched', batched)):
+        latencies, elapsed = _time_clients(
+            lambda: batcher.predict(model, X), clients, requests)
+        _report(label, latencies, elapsed)
+
+    for label, batcher in (
+            ('forecast', unbatched), ('batched_forecast', batched)):
+        latencies, elapsed = _time_clients(
+            lambda: online.forecast(site, pollutant, batcher=batcher),
+            clients, requests)
+        _report(label, latencies, elapsed)
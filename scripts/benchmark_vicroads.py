@@ -0,0 +1,100 @@
+import io
+import os
+import json
+import time
+import tracemalloc
+
+import requests
+
+from au_epa_data.constants import VIC_ROADS_MAPSJS_START
+from au_epa_data.traffic import (
+    filter_features, incident_features, maps_js_incidents)
+
+FIXTURE = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), 'fixtures', 'vicroads_maps.js'),
+)
+
+# Around the Melbourne CBD
+MELBOURNE_BBOX = (144.85, -37.9, 145.05, -37.75)
+
+
+class _CountingReader(io.BytesIO):
+    """The body of a response, counting the bytes read from it."""
+
+    def read(self, *args):
+        data = super(_CountingReader, self).read(*args)
+        self.bytes_read = getattr(self, 'bytes_read', 0) + len(data)
+        return data
+
+
+def _response(content):
+    r = requests.models.Response()
+    r.status_code = 200
+    r.raw = _CountingReader(content)
+    return r
+
+
+def _readline_incidents(r):
+    """The previous extraction: the whole maps.js copied into a StringIO and
+    scanned line by line."""
+    with io.StringIO(r.text) as f:
+        line = f.readline()
+        while not line.startswith(VIC_ROADS_MAPSJS_START):
+            line = f.readline()
+        incidents = line.split(VIC_ROADS_MAPSJS_START)[1][:-2]
+    return json.loads(incidents)
+
+
+def _time_extract(extract, content, repeat):
+    """Returns the best elapsed seconds, the peak of allocated memory and the
+    bytes read of the extraction."""
+    timings = []
+    for i in range(repeat):
+        r = _response(content)
+        start_time = time.time()
+        extract(r)
+        timings.append(time.time() - start_time)
+    tracemalloc.start()
+    r = _response(content)
+    incidents = extract(r)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return incidents, min(timings), peak, r.raw.bytes_read
+
+
+def run(fixture=FIXTURE, repeat=20):
+    """Compares the extraction of the incidents of a recorded VicRoads
+    maps.js with the previous StringIO scan and the streaming extractor, and
+    the size of the payloads of the /traffic and /traffic/geojson endpoints.
+
+    Run it from the ./manage.py shell:
+
+        >>> import sys; sys.path.append('../scripts')
+        >>> import benchmark_vicroads
+        >>> benchmark_vicroads.run()
+
+    """
+    with open(fixture, 'rb') as f:
+        content = f.read()
+    print('%s, %d bytes' % (os.path.basename(fixture), len(content)))
+
+    results = {}
+    for label, extract in (
+            ('readline', _readline_incidents),
+            ('streaming', maps_js_incidents)):
+        incidents, elapsed, peak, bytes_read = _time_extract(
+            extract, content, repeat)
+        results[label] = incidents
+        print('%s) %.2f ms, peak memory: %d KB, read: %d KB' % (
+            label, elapsed * 1000, peak / 1024, bytes_read / 1024))
+    assert results['readline'] == results['streaming']
+
+    incidents = results['streaming']
+    features = incident_features(incidents)
+    for label, data in (
+            ('traffic', incidents),
+            ('geojson', features),
+            ('geojson bbox', filter_features(features, MELBOURNE_BBOX)),
+            ('geojson type', filter_features(
+                features, types={'Road Closed'}))):
+        print('%s) %d KB' % (label, len(json.dumps(data)) / 1024))
@@ -0,0 +1,806 @@
+/* VicRoads traffic map */
+(function () {
+  'use strict';
+})();
+var map_config = {"zoom": 8, "center": [-37.81, 144.96]};
+var preload_data = {"incidents": [{"id": 100000, "incident_type": "Road Closed", "title": "Road Closed - Eastern Fwy", "description": "Road Closed on Eastern Fwy between exits 39 and 59. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.745802, "long": 145.415834, "start_date": "2019-05-14T19:00:00", "last_updated": "2019-05-29T07:55:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100001, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 31 and 77. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.938591, "long": 144.797909, "start_date": "2019-05-04T03:00:00", "last_updated": "2019-05-29T17:10:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100002, "incident_type": "Traffic Alert", "title": "Traffic Alert - Nepean Hwy", "description": "Traffic Alert on Nepean Hwy between exits 21 and 70. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.621502, "long": 144.55472, "start_date": "2019-05-20T13:00:00", "last_updated": "2019-05-29T09:39:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100003, "incident_type": "Flooding", "title": "Flooding - Monash Fwy", "description": "Flooding on Monash Fwy between exits 38 and 60. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.649043, "long": 147.771019, "start_date": "2019-05-17T06:00:00", "last_updated": "2019-05-29T10:01:00", "status": "Active", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100004, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 33 and 68. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.618765, "long": 144.580388, "start_date": "2019-05-13T20:00:00", "last_updated": "2019-05-29T05:45:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100005, "incident_type": "Road Closed", "title": "Road Closed - Geelong Rd", "description": "Road Closed on Geelong Rd between exits 17 and 57. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.899886, "long": 144.836063, "start_date": "2019-05-16T09:00:00", "last_updated": "2019-05-29T09:02:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100006, "incident_type": "Hazard", "title": "Hazard - Calder Fwy", "description": "Hazard on Calder Fwy between exits 35 and 73. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.84647, "long": 144.763292, "start_date": "2019-05-11T23:00:00", "last_updated": "2019-05-29T20:56:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100007, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 22 and 74. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.744403, "long": 145.276835, "start_date": "2019-05-05T06:00:00", "last_updated": "2019-05-29T07:33:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100008, "incident_type": "Road Closed", "title": "Road Closed - Calder Fwy", "description": "Road Closed on Calder Fwy between exits 28 and 69. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.889117, "long": 145.59782, "start_date": "2019-05-21T01:00:00", "last_updated": "2019-05-29T03:16:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100009, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 13 and 53. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.59587, "long": 144.749374, "start_date": "2019-05-16T02:00:00", "last_updated": "2019-05-29T23:57:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100010, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 35 and 56. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.751673, "long": 145.460192, "start_date": "2019-05-25T16:00:00", "last_updated": "2019-05-29T09:15:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100011, "incident_type": "Road Closed", "title": "Road Closed - Maroondah Hwy", "description": "Road Closed on Maroondah Hwy between exits 29 and 76. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.744545, "long": 144.742269, "start_date": "2019-05-08T10:00:00", "last_updated": "2019-05-29T08:13:00", "status": "Active", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100012, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 27 and 56. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.669717, "long": 144.9539, "start_date": "2019-05-20T23:00:00", "last_updated": "2019-05-29T09:18:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100013, "incident_type": "Hazard", "title": "Hazard - Monash Fwy", "description": "Hazard on Monash Fwy between exits 12 and 45. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -34.724423, "long": 141.571318, "start_date": "2019-05-05T19:00:00", "last_updated": "2019-05-29T21:48:00", "status": "Active", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100014, "incident_type": "Roadworks", "title": "Roadworks - Nepean Hwy", "description": "Roadworks on Nepean Hwy between exits 35 and 78. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -35.721463, "long": 148.721787, "start_date": "2019-05-10T17:00:00", "last_updated": "2019-05-29T01:39:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100015, "incident_type": "Traffic Alert", "title": "Traffic Alert - Calder Fwy", "description": "Traffic Alert on Calder Fwy between exits 24 and 62. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -36.120443, "long": 149.601765, "start_date": "2019-05-24T14:00:00", "last_updated": "2019-05-29T06:52:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100016, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 23 and 63. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -38.803245, "long": 142.594923, "start_date": "2019-05-04T23:00:00", "last_updated": "2019-05-29T23:27:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100017, "incident_type": "Flooding", "title": "Flooding - Calder Fwy", "description": "Flooding on Calder Fwy between exits 10 and 59. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.832318, "long": 145.285614, "start_date": "2019-05-13T12:00:00", "last_updated": "2019-05-29T11:24:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100018, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 16 and 72. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.842466, "long": 144.980378, "start_date": "2019-05-13T08:00:00", "last_updated": "2019-05-29T08:41:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100019, "incident_type": "Road Closed", "title": "Road Closed - Eastern Fwy", "description": "Road Closed on Eastern Fwy between exits 13 and 65. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -36.072193, "long": 143.650886, "start_date": "2019-05-17T02:00:00", "last_updated": "2019-05-29T23:02:00", "status": "Active", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100020, "incident_type": "Flooding", "title": "Flooding - Maroondah Hwy", "description": "Flooding on Maroondah Hwy between exits 36 and 79. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.802087, "long": 148.766524, "start_date": "2019-05-03T18:00:00", "last_updated": "2019-05-29T15:29:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100021, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 9 and 53. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.960381, "long": 144.937198, "start_date": "2019-05-08T02:00:00", "last_updated": "2019-05-29T14:16:00", "status": "Active", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100022, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 11 and 60. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.850425, "long": 144.960934, "start_date": "2019-05-25T19:00:00", "last_updated": "2019-05-29T20:14:00", "status": "Active", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100023, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 37 and 52. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -36.202147, "long": 146.795728, "start_date": "2019-05-11T14:00:00", "last_updated": "2019-05-29T06:41:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100024, "incident_type": "Traffic Alert", "title": "Traffic Alert - Hume Hwy", "description": "Traffic Alert on Hume Hwy between exits 25 and 43. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.812077, "long": 145.143085, "start_date": "2019-05-06T19:00:00", "last_updated": "2019-05-29T16:05:00", "status": "Active", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100025, "incident_type": "Traffic Alert", "title": "Traffic Alert - Princes Fwy", "description": "Traffic Alert on Princes Fwy between exits 28 and 45. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.6068, "long": 145.242334, "start_date": "2019-05-11T04:00:00", "last_updated": "2019-05-29T13:20:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100026, "incident_type": "Hazard", "title": "Hazard - Western Hwy", "description": "Hazard on Western Hwy between exits 27 and 53. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.586344, "long": 145.214424, "start_date": "2019-05-10T14:00:00", "last_updated": "2019-05-29T09:16:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100027, "incident_type": "Hazard", "title": "Hazard - Western Hwy", "description": "Hazard on Western Hwy between exits 11 and 61. Expect delays.", "closed_road_name": "Western Hwy", "lat": -36.623036, "long": 148.951541, "start_date": "2019-05-14T01:00:00", "last_updated": "2019-05-29T10:00:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100028, "incident_type": "Flooding", "title": "Flooding - Geelong Rd", "description": "Flooding on Geelong Rd between exits 29 and 42. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.041372, "long": 144.507184, "start_date": "2019-05-06T11:00:00", "last_updated": "2019-05-29T01:16:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100029, "incident_type": "Road Closed", "title": "Road Closed - Western Hwy", "description": "Road Closed on Western Hwy between exits 18 and 59. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.969092, "long": 144.097413, "start_date": "2019-05-20T13:00:00", "last_updated": "2019-05-29T01:26:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100030, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 38 and 79. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.957281, "long": 145.14757, "start_date": "2019-05-16T00:00:00", "last_updated": "2019-05-29T08:33:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100031, "incident_type": "Traffic Alert", "title": "Traffic Alert - Hume Hwy", "description": "Traffic Alert on Hume Hwy between exits 8 and 76. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.701765, "long": 145.366969, "start_date": "2019-05-18T19:00:00", "last_updated": "2019-05-29T22:23:00", "status": "Active", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100032, "incident_type": "Road Closed", "title": "Road Closed - Geelong Rd", "description": "Road Closed on Geelong Rd between exits 37 and 54. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.436346, "long": 143.75378, "start_date": "2019-05-19T16:00:00", "last_updated": "2019-05-29T14:04:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100033, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 5 and 59. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -35.048695, "long": 141.453187, "start_date": "2019-05-19T12:00:00", "last_updated": "2019-05-29T00:26:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100034, "incident_type": "Flooding", "title": "Flooding - Princes Fwy", "description": "Flooding on Princes Fwy between exits 4 and 72. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.719171, "long": 145.596233, "start_date": "2019-05-08T21:00:00", "last_updated": "2019-05-29T03:12:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100035, "incident_type": "Flooding", "title": "Flooding - Eastern Fwy", "description": "Flooding on Eastern Fwy between exits 28 and 53. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -38.517566, "long": 148.065743, "start_date": "2019-05-11T19:00:00", "last_updated": "2019-05-29T16:40:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100036, "incident_type": "Flooding", "title": "Flooding - Hume Hwy", "description": "Flooding on Hume Hwy between exits 16 and 49. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.524647, "long": 145.582151, "start_date": "2019-05-03T09:00:00", "last_updated": "2019-05-29T12:55:00", "status": "Active", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100037, "incident_type": "Traffic Alert", "title": "Traffic Alert - Western Hwy", "description": "Traffic Alert on Western Hwy between exits 16 and 46. Expect delays.", "closed_road_name": "Western Hwy", "lat": -38.018183, "long": 141.037301, "start_date": "2019-05-01T04:00:00", "last_updated": "2019-05-29T13:51:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100038, "incident_type": "Traffic Alert", "title": "Traffic Alert - Maroondah Hwy", "description": "Traffic Alert on Maroondah Hwy between exits 7 and 60. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -34.058229, "long": 146.257717, "start_date": "2019-05-11T09:00:00", "last_updated": "2019-05-29T06:26:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100039, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 35 and 47. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.664736, "long": 145.569748, "start_date": "2019-05-26T20:00:00", "last_updated": "2019-05-29T23:36:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100040, "incident_type": "Hazard", "title": "Hazard - Hume Hwy", "description": "Hazard on Hume Hwy between exits 10 and 72. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.535192, "long": 145.326221, "start_date": "2019-05-26T22:00:00", "last_updated": "2019-05-29T05:32:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100041, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 21 and 71. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.778863, "long": 145.373248, "start_date": "2019-05-16T18:00:00", "last_updated": "2019-05-29T04:10:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100042, "incident_type": "Traffic Alert", "title": "Traffic Alert - Eastern Fwy", "description": "Traffic Alert on Eastern Fwy between exits 8 and 76. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -38.195218, "long": 145.015368, "start_date": "2019-05-01T17:00:00", "last_updated": "2019-05-29T13:41:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100043, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 3 and 47. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -35.731939, "long": 145.152565, "start_date": "2019-05-25T15:00:00", "last_updated": "2019-05-29T23:26:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100044, "incident_type": "Traffic Alert", "title": "Traffic Alert - Burwood Hwy", "description": "Traffic Alert on Burwood Hwy between exits 28 and 44. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.645663, "long": 144.766869, "start_date": "2019-05-21T09:00:00", "last_updated": "2019-05-29T02:59:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100045, "incident_type": "Traffic Alert", "title": "Traffic Alert - Calder Fwy", "description": "Traffic Alert on Calder Fwy between exits 19 and 54. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.680877, "long": 145.077067, "start_date": "2019-05-06T22:00:00", "last_updated": "2019-05-29T16:25:00", "status": "Active", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100046, "incident_type": "Road Closed", "title": "Road Closed - Calder Fwy", "description": "Road Closed on Calder Fwy between exits 13 and 65. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.88563, "long": 145.291168, "start_date": "2019-05-05T10:00:00", "last_updated": "2019-05-29T11:12:00", "status": "Active", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100047, "incident_type": "Traffic Alert", "title": "Traffic Alert - Maroondah Hwy", "description": "Traffic Alert on Maroondah Hwy between exits 36 and 58. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -38.635271, "long": 144.305554, "start_date": "2019-05-24T21:00:00", "last_updated": "2019-05-29T07:28:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100048, "incident_type": "Flooding", "title": "Flooding - Geelong Rd", "description": "Flooding on Geelong Rd between exits 19 and 54. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.19317, "long": 145.056317, "start_date": "2019-05-14T20:00:00", "last_updated": "2019-05-29T16:57:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100049, "incident_type": "Traffic Alert", "title": "Traffic Alert - Hume Hwy", "description": "Traffic Alert on Hume Hwy between exits 11 and 66. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.715301, "long": 145.228024, "start_date": "2019-05-11T11:00:00", "last_updated": "2019-05-29T01:34:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100050, "incident_type": "Hazard", "title": "Hazard - Princes Fwy", "description": "Hazard on Princes Fwy between exits 34 and 49. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -35.779636, "long": 148.339504, "start_date": "2019-05-08T01:00:00", "last_updated": "2019-05-29T02:06:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100051, "incident_type": "Hazard", "title": "Hazard - Maroondah Hwy", "description": "Hazard on Maroondah Hwy between exits 5 and 56. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.512358, "long": 145.021409, "start_date": "2019-05-25T10:00:00", "last_updated": "2019-05-29T06:53:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100052, "incident_type": "Traffic Alert", "title": "Traffic Alert - Calder Fwy", "description": "Traffic Alert on Calder Fwy between exits 38 and 75. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.987787, "long": 145.067505, "start_date": "2019-05-28T05:00:00", "last_updated": "2019-05-29T09:39:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100053, "incident_type": "Road Closed", "title": "Road Closed - Hume Hwy", "description": "Road Closed on Hume Hwy between exits 23 and 70. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.035864, "long": 145.505645, "start_date": "2019-05-12T03:00:00", "last_updated": "2019-05-29T20:56:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100054, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 8 and 59. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.780772, "long": 144.865212, "start_date": "2019-05-20T00:00:00", "last_updated": "2019-05-29T04:08:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100055, "incident_type": "Road Closed", "title": "Road Closed - Eastern Fwy", "description": "Road Closed on Eastern Fwy between exits 14 and 73. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.788298, "long": 144.55552, "start_date": "2019-05-15T08:00:00", "last_updated": "2019-05-29T22:30:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100056, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 10 and 63. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.857566, "long": 145.399075, "start_date": "2019-05-28T03:00:00", "last_updated": "2019-05-29T01:17:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100057, "incident_type": "Flooding", "title": "Flooding - Hume Hwy", "description": "Flooding on Hume Hwy between exits 18 and 58. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.678365, "long": 145.077142, "start_date": "2019-05-21T10:00:00", "last_updated": "2019-05-29T03:32:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100058, "incident_type": "Road Closed", "title": "Road Closed - Nepean Hwy", "description": "Road Closed on Nepean Hwy between exits 29 and 52. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.560012, "long": 144.50678, "start_date": "2019-05-08T23:00:00", "last_updated": "2019-05-29T17:50:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100059, "incident_type": "Road Closed", "title": "Road Closed - Western Hwy", "description": "Road Closed on Western Hwy between exits 34 and 42. Expect delays.", "closed_road_name": "Western Hwy", "lat": -38.114895, "long": 144.965685, "start_date": "2019-05-08T17:00:00", "last_updated": "2019-05-29T05:07:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100060, "incident_type": "Traffic Alert", "title": "Traffic Alert - Maroondah Hwy", "description": "Traffic Alert on Maroondah Hwy between exits 14 and 47. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -36.996215, "long": 144.129229, "start_date": "2019-05-17T10:00:00", "last_updated": "2019-05-29T13:19:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100061, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 27 and 71. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.732982, "long": 144.049825, "start_date": "2019-05-23T06:00:00", "last_updated": "2019-05-29T01:29:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100062, "incident_type": "Road Closed", "title": "Road Closed - Eastern Fwy", "description": "Road Closed on Eastern Fwy between exits 6 and 64. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.908904, "long": 145.334418, "start_date": "2019-05-15T15:00:00", "last_updated": "2019-05-29T13:36:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100063, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 3 and 67. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.543138, "long": 143.444158, "start_date": "2019-05-10T14:00:00", "last_updated": "2019-05-29T20:55:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100064, "incident_type": "Hazard", "title": "Hazard - Princes Fwy", "description": "Hazard on Princes Fwy between exits 4 and 67. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.775543, "long": 145.387126, "start_date": "2019-05-23T22:00:00", "last_updated": "2019-05-29T00:56:00", "status": "Active", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100065, "incident_type": "Traffic Alert", "title": "Traffic Alert - Princes Fwy", "description": "Traffic Alert on Princes Fwy between exits 37 and 64. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -38.011997, "long": 144.709405, "start_date": "2019-05-28T12:00:00", "last_updated": "2019-05-29T14:09:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100066, "incident_type": "Hazard", "title": "Hazard - Western Hwy", "description": "Hazard on Western Hwy between exits 37 and 44. Expect delays.", "closed_road_name": "Western Hwy", "lat": -38.182102, "long": 145.557093, "start_date": "2019-05-07T05:00:00", "last_updated": "2019-05-29T18:06:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100067, "incident_type": "Traffic Alert", "title": "Traffic Alert - Maroondah Hwy", "description": "Traffic Alert on Maroondah Hwy between exits 9 and 68. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.618493, "long": 145.338575, "start_date": "2019-05-15T17:00:00", "last_updated": "2019-05-29T06:02:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100068, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 4 and 70. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -38.097454, "long": 145.330667, "start_date": "2019-05-27T18:00:00", "last_updated": "2019-05-29T06:45:00", "status": "Active", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100069, "incident_type": "Traffic Alert", "title": "Traffic Alert - Western Hwy", "description": "Traffic Alert on Western Hwy between exits 38 and 64. Expect delays.", "closed_road_name": "Western Hwy", "lat": -35.090899, "long": 148.217846, "start_date": "2019-05-05T23:00:00", "last_updated": "2019-05-29T11:14:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100070, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 6 and 44. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -38.57095, "long": 148.924445, "start_date": "2019-05-17T21:00:00", "last_updated": "2019-05-29T03:58:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100071, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 21 and 51. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.646535, "long": 142.07832, "start_date": "2019-05-07T17:00:00", "last_updated": "2019-05-29T11:55:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100072, "incident_type": "Hazard", "title": "Hazard - Princes Fwy", "description": "Hazard on Princes Fwy between exits 38 and 76. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.985214, "long": 145.025475, "start_date": "2019-05-20T22:00:00", "last_updated": "2019-05-29T00:09:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100073, "incident_type": "Traffic Alert", "title": "Traffic Alert - Nepean Hwy", "description": "Traffic Alert on Nepean Hwy between exits 22 and 78. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.508945, "long": 144.793206, "start_date": "2019-05-19T23:00:00", "last_updated": "2019-05-29T21:21:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100074, "incident_type": "Traffic Alert", "title": "Traffic Alert - Nepean Hwy", "description": "Traffic Alert on Nepean Hwy between exits 7 and 58. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -38.081143, "long": 144.561314, "start_date": "2019-05-16T01:00:00", "last_updated": "2019-05-29T13:52:00", "status": "Active", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100075, "incident_type": "Hazard", "title": "Hazard - Eastern Fwy", "description": "Hazard on Eastern Fwy between exits 34 and 64. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.581387, "long": 145.000707, "start_date": "2019-05-28T23:00:00", "last_updated": "2019-05-29T14:53:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100076, "incident_type": "Traffic Alert", "title": "Traffic Alert - Maroondah Hwy", "description": "Traffic Alert on Maroondah Hwy between exits 1 and 63. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.771123, "long": 145.355415, "start_date": "2019-05-23T19:00:00", "last_updated": "2019-05-29T09:50:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100077, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 38 and 49. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -34.989654, "long": 143.768278, "start_date": "2019-05-03T05:00:00", "last_updated": "2019-05-29T01:59:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100078, "incident_type": "Hazard", "title": "Hazard - Burwood Hwy", "description": "Hazard on Burwood Hwy between exits 9 and 79. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.712535, "long": 145.342112, "start_date": "2019-05-16T12:00:00", "last_updated": "2019-05-29T19:16:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100079, "incident_type": "Flooding", "title": "Flooding - Hume Hwy", "description": "Flooding on Hume Hwy between exits 17 and 47. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.107468, "long": 145.577346, "start_date": "2019-05-19T18:00:00", "last_updated": "2019-05-29T18:15:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100080, "incident_type": "Road Closed", "title": "Road Closed - Nepean Hwy", "description": "Road Closed on Nepean Hwy between exits 16 and 69. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.968503, "long": 143.801789, "start_date": "2019-05-26T11:00:00", "last_updated": "2019-05-29T17:28:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100081, "incident_type": "Road Closed", "title": "Road Closed - Nepean Hwy", "description": "Road Closed on Nepean Hwy between exits 7 and 66. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.625653, "long": 145.158271, "start_date": "2019-05-10T06:00:00", "last_updated": "2019-05-29T10:56:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100082, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 36 and 55. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.737627, "long": 144.975724, "start_date": "2019-05-17T03:00:00", "last_updated": "2019-05-29T15:40:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100083, "incident_type": "Flooding", "title": "Flooding - Monash Fwy", "description": "Flooding on Monash Fwy between exits 20 and 53. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.100227, "long": 145.450435, "start_date": "2019-05-24T13:00:00", "last_updated": "2019-05-29T23:08:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100084, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 26 and 54. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -38.068143, "long": 144.847043, "start_date": "2019-05-20T08:00:00", "last_updated": "2019-05-29T11:03:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100085, "incident_type": "Road Closed", "title": "Road Closed - Maroondah Hwy", "description": "Road Closed on Maroondah Hwy between exits 16 and 46. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -38.007961, "long": 144.91135, "start_date": "2019-05-24T18:00:00", "last_updated": "2019-05-29T20:36:00", "status": "Active", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100086, "incident_type": "Flooding", "title": "Flooding - Geelong Rd", "description": "Flooding on Geelong Rd between exits 15 and 56. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.796848, "long": 145.07203, "start_date": "2019-05-08T03:00:00", "last_updated": "2019-05-29T13:13:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100087, "incident_type": "Hazard", "title": "Hazard - Princes Fwy", "description": "Hazard on Princes Fwy between exits 14 and 49. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.687548, "long": 145.272962, "start_date": "2019-05-03T22:00:00", "last_updated": "2019-05-29T05:00:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100088, "incident_type": "Traffic Alert", "title": "Traffic Alert - Nepean Hwy", "description": "Traffic Alert on Nepean Hwy between exits 23 and 46. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.842625, "long": 145.084739, "start_date": "2019-05-04T20:00:00", "last_updated": "2019-05-29T10:45:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100089, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 17 and 42. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -35.269363, "long": 141.913373, "start_date": "2019-05-12T16:00:00", "last_updated": "2019-05-29T11:08:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100090, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 35 and 72. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.975081, "long": 145.294746, "start_date": "2019-05-04T01:00:00", "last_updated": "2019-05-29T12:32:00", "status": "Active", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100091, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 35 and 50. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.663315, "long": 145.344538, "start_date": "2019-05-10T10:00:00", "last_updated": "2019-05-29T18:01:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100092, "incident_type": "Flooding", "title": "Flooding - Geelong Rd", "description": "Flooding on Geelong Rd between exits 33 and 53. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.140496, "long": 145.176956, "start_date": "2019-05-11T05:00:00", "last_updated": "2019-05-29T10:27:00", "status": "Active", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100093, "incident_type": "Traffic Alert", "title": "Traffic Alert - Calder Fwy", "description": "Traffic Alert on Calder Fwy between exits 32 and 77. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.943512, "long": 145.424945, "start_date": "2019-05-26T22:00:00", "last_updated": "2019-05-29T19:26:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100094, "incident_type": "Flooding", "title": "Flooding - Princes Fwy", "description": "Flooding on Princes Fwy between exits 13 and 53. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -38.488815, "long": 147.713985, "start_date": "2019-05-13T11:00:00", "last_updated": "2019-05-29T10:46:00", "status": "Active", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100095, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 19 and 46. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.603136, "long": 145.07202, "start_date": "2019-05-07T03:00:00", "last_updated": "2019-05-29T23:56:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100096, "incident_type": "Flooding", "title": "Flooding - Geelong Rd", "description": "Flooding on Geelong Rd between exits 37 and 47. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.760627, "long": 144.933784, "start_date": "2019-05-28T17:00:00", "last_updated": "2019-05-29T06:44:00", "status": "Active", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100097, "incident_type": "Hazard", "title": "Hazard - Geelong Rd", "description": "Hazard on Geelong Rd between exits 16 and 61. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.814254, "long": 144.698989, "start_date": "2019-05-22T20:00:00", "last_updated": "2019-05-29T21:42:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100098, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 26 and 45. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -36.962902, "long": 146.752995, "start_date": "2019-05-06T12:00:00", "last_updated": "2019-05-29T13:13:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100099, "incident_type": "Flooding", "title": "Flooding - Monash Fwy", "description": "Flooding on Monash Fwy between exits 37 and 55. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.965473, "long": 145.324733, "start_date": "2019-05-25T07:00:00", "last_updated": "2019-05-29T13:40:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100100, "incident_type": "Hazard", "title": "Hazard - Maroondah Hwy", "description": "Hazard on Maroondah Hwy between exits 26 and 53. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.584215, "long": 145.027927, "start_date": "2019-05-28T11:00:00", "last_updated": "2019-05-29T19:13:00", "status": "Active", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100101, "incident_type": "Road Closed", "title": "Road Closed - Nepean Hwy", "description": "Road Closed on Nepean Hwy between exits 27 and 75. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -35.587325, "long": 148.399196, "start_date": "2019-05-23T07:00:00", "last_updated": "2019-05-29T01:49:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100102, "incident_type": "Flooding", "title": "Flooding - Nepean Hwy", "description": "Flooding on Nepean Hwy between exits 35 and 41. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.601655, "long": 141.870539, "start_date": "2019-05-23T05:00:00", "last_updated": "2019-05-29T17:36:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100103, "incident_type": "Traffic Alert", "title": "Traffic Alert - Maroondah Hwy", "description": "Traffic Alert on Maroondah Hwy between exits 19 and 73. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.742132, "long": 145.22497, "start_date": "2019-05-20T20:00:00", "last_updated": "2019-05-29T11:47:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100104, "incident_type": "Traffic Alert", "title": "Traffic Alert - Monash Fwy", "description": "Traffic Alert on Monash Fwy between exits 23 and 42. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -34.484589, "long": 142.633701, "start_date": "2019-05-21T01:00:00", "last_updated": "2019-05-29T22:42:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100105, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 21 and 62. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.859745, "long": 145.262893, "start_date": "2019-05-25T06:00:00", "last_updated": "2019-05-29T12:13:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100106, "incident_type": "Road Closed", "title": "Road Closed - Nepean Hwy", "description": "Road Closed on Nepean Hwy between exits 22 and 73. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.508898, "long": 144.739498, "start_date": "2019-05-02T07:00:00", "last_updated": "2019-05-29T13:39:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100107, "incident_type": "Traffic Alert", "title": "Traffic Alert - Monash Fwy", "description": "Traffic Alert on Monash Fwy between exits 21 and 73. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.055208, "long": 144.745176, "start_date": "2019-05-21T12:00:00", "last_updated": "2019-05-29T10:07:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100108, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 36 and 76. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.066841, "long": 142.316159, "start_date": "2019-05-26T07:00:00", "last_updated": "2019-05-29T12:34:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100109, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 19 and 45. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -38.154693, "long": 145.09711, "start_date": "2019-05-01T22:00:00", "last_updated": "2019-05-29T19:50:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100110, "incident_type": "Flooding", "title": "Flooding - Geelong Rd", "description": "Flooding on Geelong Rd between exits 25 and 65. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.910937, "long": 144.510422, "start_date": "2019-05-13T19:00:00", "last_updated": "2019-05-29T22:10:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100111, "incident_type": "Hazard", "title": "Hazard - Princes Fwy", "description": "Hazard on Princes Fwy between exits 34 and 41. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.868092, "long": 145.040374, "start_date": "2019-05-03T13:00:00", "last_updated": "2019-05-29T22:32:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100112, "incident_type": "Hazard", "title": "Hazard - Calder Fwy", "description": "Hazard on Calder Fwy between exits 38 and 74. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -36.593646, "long": 148.775862, "start_date": "2019-05-24T13:00:00", "last_updated": "2019-05-29T01:16:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100113, "incident_type": "Road Closed", "title": "Road Closed - Burwood Hwy", "description": "Road Closed on Burwood Hwy between exits 38 and 54. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.757906, "long": 144.937293, "start_date": "2019-05-13T11:00:00", "last_updated": "2019-05-29T04:24:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100114, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 11 and 72. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -34.163582, "long": 147.131114, "start_date": "2019-05-19T05:00:00", "last_updated": "2019-05-29T15:19:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100115, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 2 and 68. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -38.052987, "long": 145.545771, "start_date": "2019-05-07T01:00:00", "last_updated": "2019-05-29T18:22:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100116, "incident_type": "Road Closed", "title": "Road Closed - Hume Hwy", "description": "Road Closed on Hume Hwy between exits 19 and 68. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.814885, "long": 144.569324, "start_date": "2019-05-09T10:00:00", "last_updated": "2019-05-29T03:19:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100117, "incident_type": "Traffic Alert", "title": "Traffic Alert - Nepean Hwy", "description": "Traffic Alert on Nepean Hwy between exits 11 and 60. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -38.000938, "long": 144.7866, "start_date": "2019-05-28T02:00:00", "last_updated": "2019-05-29T19:34:00", "status": "Active", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100118, "incident_type": "Hazard", "title": "Hazard - Monash Fwy", "description": "Hazard on Monash Fwy between exits 11 and 62. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -36.17762, "long": 149.659052, "start_date": "2019-05-21T03:00:00", "last_updated": "2019-05-29T16:06:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100119, "incident_type": "Traffic Alert", "title": "Traffic Alert - Maroondah Hwy", "description": "Traffic Alert on Maroondah Hwy between exits 31 and 58. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.836815, "long": 144.61439, "start_date": "2019-05-25T21:00:00", "last_updated": "2019-05-29T23:32:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100120, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 33 and 65. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.851588, "long": 144.955753, "start_date": "2019-05-11T06:00:00", "last_updated": "2019-05-29T16:17:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100121, "incident_type": "Roadworks", "title": "Roadworks - Princes Fwy", "description": "Roadworks on Princes Fwy between exits 38 and 51. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.758721, "long": 143.397584, "start_date": "2019-05-07T22:00:00", "last_updated": "2019-05-29T13:19:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100122, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 17 and 53. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.116237, "long": 145.091408, "start_date": "2019-05-21T23:00:00", "last_updated": "2019-05-29T03:24:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100123, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 13 and 62. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.924852, "long": 144.959409, "start_date": "2019-05-13T07:00:00", "last_updated": "2019-05-29T12:12:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100124, "incident_type": "Flooding", "title": "Flooding - Monash Fwy", "description": "Flooding on Monash Fwy between exits 17 and 60. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.087332, "long": 145.146762, "start_date": "2019-05-22T12:00:00", "last_updated": "2019-05-29T01:31:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100125, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 18 and 75. Expect delays.", "closed_road_name": "Western Hwy", "lat": -38.677528, "long": 146.814255, "start_date": "2019-05-27T07:00:00", "last_updated": "2019-05-29T22:29:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100126, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 26 and 45. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.643379, "long": 147.069308, "start_date": "2019-05-14T03:00:00", "last_updated": "2019-05-29T17:38:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100127, "incident_type": "Road Closed", "title": "Road Closed - Geelong Rd", "description": "Road Closed on Geelong Rd between exits 26 and 72. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.864969, "long": 144.788649, "start_date": "2019-05-16T07:00:00", "last_updated": "2019-05-29T16:44:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100128, "incident_type": "Hazard", "title": "Hazard - Hume Hwy", "description": "Hazard on Hume Hwy between exits 33 and 68. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.101991, "long": 145.293205, "start_date": "2019-05-13T03:00:00", "last_updated": "2019-05-29T18:43:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100129, "incident_type": "Hazard", "title": "Hazard - Hume Hwy", "description": "Hazard on Hume Hwy between exits 38 and 61. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.770219, "long": 142.357187, "start_date": "2019-05-20T02:00:00", "last_updated": "2019-05-29T02:04:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100130, "incident_type": "Road Closed", "title": "Road Closed - Geelong Rd", "description": "Road Closed on Geelong Rd between exits 24 and 79. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -35.313022, "long": 146.130867, "start_date": "2019-05-17T00:00:00", "last_updated": "2019-05-29T07:45:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100131, "incident_type": "Flooding", "title": "Flooding - Western Hwy", "description": "Flooding on Western Hwy between exits 37 and 56. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.918157, "long": 144.737364, "start_date": "2019-05-11T17:00:00", "last_updated": "2019-05-29T19:33:00", "status": "Active", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100132, "incident_type": "Road Closed", "title": "Road Closed - Maroondah Hwy", "description": "Road Closed on Maroondah Hwy between exits 10 and 47. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.596439, "long": 144.634706, "start_date": "2019-05-26T23:00:00", "last_updated": "2019-05-29T03:46:00", "status": "Active", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100133, "incident_type": "Road Closed", "title": "Road Closed - Calder Fwy", "description": "Road Closed on Calder Fwy between exits 25 and 61. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -38.409003, "long": 148.646629, "start_date": "2019-05-20T03:00:00", "last_updated": "2019-05-29T05:29:00", "status": "Active", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100134, "incident_type": "Road Closed", "title": "Road Closed - Hume Hwy", "description": "Road Closed on Hume Hwy between exits 6 and 42. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -34.300026, "long": 149.195028, "start_date": "2019-05-22T16:00:00", "last_updated": "2019-05-29T09:17:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100135, "incident_type": "Road Closed", "title": "Road Closed - Geelong Rd", "description": "Road Closed on Geelong Rd between exits 38 and 48. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.991887, "long": 144.640697, "start_date": "2019-05-19T15:00:00", "last_updated": "2019-05-29T16:56:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100136, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 28 and 45. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.902132, "long": 145.168258, "start_date": "2019-05-24T20:00:00", "last_updated": "2019-05-29T16:38:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100137, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 8 and 51. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.916654, "long": 144.961419, "start_date": "2019-05-02T23:00:00", "last_updated": "2019-05-29T09:42:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100138, "incident_type": "Traffic Alert", "title": "Traffic Alert - Nepean Hwy", "description": "Traffic Alert on Nepean Hwy between exits 27 and 60. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.875436, "long": 144.650228, "start_date": "2019-05-12T15:00:00", "last_updated": "2019-05-29T08:05:00", "status": "Active", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100139, "incident_type": "Flooding", "title": "Flooding - Western Hwy", "description": "Flooding on Western Hwy between exits 38 and 73. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.677634, "long": 145.153066, "start_date": "2019-05-25T17:00:00", "last_updated": "2019-05-29T06:10:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100140, "incident_type": "Hazard", "title": "Hazard - Geelong Rd", "description": "Hazard on Geelong Rd between exits 2 and 72. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.509044, "long": 145.431778, "start_date": "2019-05-07T15:00:00", "last_updated": "2019-05-29T10:36:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100141, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 39 and 53. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.675656, "long": 144.53593, "start_date": "2019-05-05T08:00:00", "last_updated": "2019-05-29T02:03:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100142, "incident_type": "Hazard", "title": "Hazard - Burwood Hwy", "description": "Hazard on Burwood Hwy between exits 23 and 66. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -38.599748, "long": 141.569508, "start_date": "2019-05-21T07:00:00", "last_updated": "2019-05-29T12:43:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100143, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 38 and 58. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.893201, "long": 145.385282, "start_date": "2019-05-01T17:00:00", "last_updated": "2019-05-29T00:20:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100144, "incident_type": "Flooding", "title": "Flooding - Princes Fwy", "description": "Flooding on Princes Fwy between exits 37 and 60. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -35.565089, "long": 146.380366, "start_date": "2019-05-23T16:00:00", "last_updated": "2019-05-29T08:23:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100145, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 28 and 48. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.898799, "long": 145.061692, "start_date": "2019-05-15T08:00:00", "last_updated": "2019-05-29T00:48:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100146, "incident_type": "Traffic Alert", "title": "Traffic Alert - Hume Hwy", "description": "Traffic Alert on Hume Hwy between exits 29 and 61. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.510021, "long": 144.68088, "start_date": "2019-05-26T22:00:00", "last_updated": "2019-05-29T16:26:00", "status": "Active", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100147, "incident_type": "Traffic Alert", "title": "Traffic Alert - Calder Fwy", "description": "Traffic Alert on Calder Fwy between exits 14 and 49. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.751633, "long": 144.415657, "start_date": "2019-05-09T20:00:00", "last_updated": "2019-05-29T15:39:00", "status": "Active", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100148, "incident_type": "Hazard", "title": "Hazard - Maroondah Hwy", "description": "Hazard on Maroondah Hwy between exits 31 and 54. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.76289, "long": 145.492518, "start_date": "2019-05-22T07:00:00", "last_updated": "2019-05-29T18:27:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100149, "incident_type": "Flooding", "title": "Flooding - Calder Fwy", "description": "Flooding on Calder Fwy between exits 40 and 44. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.575002, "long": 148.131077, "start_date": "2019-05-06T09:00:00", "last_updated": "2019-05-29T20:04:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100150, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 21 and 60. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.174171, "long": 145.34987, "start_date": "2019-05-19T23:00:00", "last_updated": "2019-05-29T17:01:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100151, "incident_type": "Traffic Alert", "title": "Traffic Alert - Princes Fwy", "description": "Traffic Alert on Princes Fwy between exits 6 and 72. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.747215, "long": 145.010161, "start_date": "2019-05-18T03:00:00", "last_updated": "2019-05-29T20:26:00", "status": "Active", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100152, "incident_type": "Road Closed", "title": "Road Closed - Hume Hwy", "description": "Road Closed on Hume Hwy between exits 24 and 56. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -35.1654, "long": 148.913883, "start_date": "2019-05-11T05:00:00", "last_updated": "2019-05-29T13:24:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100153, "incident_type": "Road Closed", "title": "Road Closed - Calder Fwy", "description": "Road Closed on Calder Fwy between exits 8 and 68. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.755154, "long": 145.060166, "start_date": "2019-05-10T07:00:00", "last_updated": "2019-05-29T13:02:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100154, "incident_type": "Road Closed", "title": "Road Closed - Eastern Fwy", "description": "Road Closed on Eastern Fwy between exits 18 and 50. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.928659, "long": 144.58176, "start_date": "2019-05-25T20:00:00", "last_updated": "2019-05-29T01:12:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100155, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 33 and 80. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -38.372263, "long": 142.343876, "start_date": "2019-05-16T17:00:00", "last_updated": "2019-05-29T12:17:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100156, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 16 and 69. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -35.180081, "long": 149.710729, "start_date": "2019-05-16T22:00:00", "last_updated": "2019-05-29T02:42:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100157, "incident_type": "Traffic Alert", "title": "Traffic Alert - Hume Hwy", "description": "Traffic Alert on Hume Hwy between exits 17 and 49. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.006889, "long": 144.832723, "start_date": "2019-05-10T21:00:00", "last_updated": "2019-05-29T13:27:00", "status": "Active", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100158, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 20 and 62. Expect delays.", "closed_road_name": "Western Hwy", "lat": -38.019995, "long": 144.90379, "start_date": "2019-05-04T02:00:00", "last_updated": "2019-05-29T08:07:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100159, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 15 and 42. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.51072, "long": 145.540476, "start_date": "2019-05-27T17:00:00", "last_updated": "2019-05-29T22:42:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100160, "incident_type": "Road Closed", "title": "Road Closed - Calder Fwy", "description": "Road Closed on Calder Fwy between exits 21 and 79. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.831924, "long": 145.12419, "start_date": "2019-05-21T05:00:00", "last_updated": "2019-05-29T19:00:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100161, "incident_type": "Hazard", "title": "Hazard - Hume Hwy", "description": "Hazard on Hume Hwy between exits 3 and 67. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -34.42327, "long": 146.440105, "start_date": "2019-05-03T00:00:00", "last_updated": "2019-05-29T13:12:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100162, "incident_type": "Road Closed", "title": "Road Closed - Maroondah Hwy", "description": "Road Closed on Maroondah Hwy between exits 15 and 66. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.40909, "long": 148.208966, "start_date": "2019-05-03T18:00:00", "last_updated": "2019-05-29T22:52:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100163, "incident_type": "Hazard", "title": "Hazard - Western Hwy", "description": "Hazard on Western Hwy between exits 20 and 45. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.886838, "long": 144.526382, "start_date": "2019-05-28T23:00:00", "last_updated": "2019-05-29T07:33:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100164, "incident_type": "Road Closed", "title": "Road Closed - Nepean Hwy", "description": "Road Closed on Nepean Hwy between exits 39 and 49. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.652706, "long": 144.70344, "start_date": "2019-05-15T00:00:00", "last_updated": "2019-05-29T06:04:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100165, "incident_type": "Road Closed", "title": "Road Closed - Maroondah Hwy", "description": "Road Closed on Maroondah Hwy between exits 15 and 41. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -36.484897, "long": 144.175774, "start_date": "2019-05-15T01:00:00", "last_updated": "2019-05-29T23:28:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100166, "incident_type": "Flooding", "title": "Flooding - Maroondah Hwy", "description": "Flooding on Maroondah Hwy between exits 28 and 51. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -38.010124, "long": 144.586033, "start_date": "2019-05-22T16:00:00", "last_updated": "2019-05-29T12:52:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100167, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 5 and 46. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.846014, "long": 145.07794, "start_date": "2019-05-17T10:00:00", "last_updated": "2019-05-29T01:01:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100168, "incident_type": "Hazard", "title": "Hazard - Burwood Hwy", "description": "Hazard on Burwood Hwy between exits 13 and 62. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.984734, "long": 144.663327, "start_date": "2019-05-10T15:00:00", "last_updated": "2019-05-29T00:12:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100169, "incident_type": "Traffic Alert", "title": "Traffic Alert - Monash Fwy", "description": "Traffic Alert on Monash Fwy between exits 23 and 50. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.130843, "long": 144.762044, "start_date": "2019-05-23T07:00:00", "last_updated": "2019-05-29T03:07:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100170, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 40 and 57. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -36.484057, "long": 142.449768, "start_date": "2019-05-28T19:00:00", "last_updated": "2019-05-29T20:01:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100171, "incident_type": "Road Closed", "title": "Road Closed - Hume Hwy", "description": "Road Closed on Hume Hwy between exits 13 and 61. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.825832, "long": 144.863088, "start_date": "2019-05-08T23:00:00", "last_updated": "2019-05-29T18:13:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100172, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 23 and 76. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -36.08907, "long": 142.883539, "start_date": "2019-05-24T08:00:00", "last_updated": "2019-05-29T03:06:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100173, "incident_type": "Flooding", "title": "Flooding - Western Hwy", "description": "Flooding on Western Hwy between exits 29 and 53. Expect delays.", "closed_road_name": "Western Hwy", "lat": -36.10585, "long": 145.755347, "start_date": "2019-05-22T01:00:00", "last_updated": "2019-05-29T18:44:00", "status": "Active", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100174, "incident_type": "Road Closed", "title": "Road Closed - Burwood Hwy", "description": "Road Closed on Burwood Hwy between exits 24 and 77. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -38.091623, "long": 145.398401, "start_date": "2019-05-22T16:00:00", "last_updated": "2019-05-29T16:55:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100175, "incident_type": "Traffic Alert", "title": "Traffic Alert - Eastern Fwy", "description": "Traffic Alert on Eastern Fwy between exits 5 and 78. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -39.068101, "long": 147.132753, "start_date": "2019-05-17T09:00:00", "last_updated": "2019-05-29T14:54:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100176, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 23 and 75. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -38.138881, "long": 145.100535, "start_date": "2019-05-17T11:00:00", "last_updated": "2019-05-29T09:26:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100177, "incident_type": "Hazard", "title": "Hazard - Hume Hwy", "description": "Hazard on Hume Hwy between exits 19 and 59. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.19012, "long": 144.945751, "start_date": "2019-05-03T04:00:00", "last_updated": "2019-05-29T05:43:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100178, "incident_type": "Road Closed", "title": "Road Closed - Calder Fwy", "description": "Road Closed on Calder Fwy between exits 11 and 77. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.859266, "long": 144.843402, "start_date": "2019-05-06T09:00:00", "last_updated": "2019-05-29T11:00:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100179, "incident_type": "Traffic Alert", "title": "Traffic Alert - Calder Fwy", "description": "Traffic Alert on Calder Fwy between exits 23 and 51. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.901066, "long": 145.242159, "start_date": "2019-05-12T20:00:00", "last_updated": "2019-05-29T09:37:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100180, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 26 and 77. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.766263, "long": 145.041454, "start_date": "2019-05-16T05:00:00", "last_updated": "2019-05-29T15:50:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100181, "incident_type": "Flooding", "title": "Flooding - Monash Fwy", "description": "Flooding on Monash Fwy between exits 39 and 59. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.985975, "long": 143.856779, "start_date": "2019-05-23T12:00:00", "last_updated": "2019-05-29T10:00:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100182, "incident_type": "Traffic Alert", "title": "Traffic Alert - Monash Fwy", "description": "Traffic Alert on Monash Fwy between exits 28 and 57. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.948285, "long": 144.660016, "start_date": "2019-05-02T22:00:00", "last_updated": "2019-05-29T18:07:00", "status": "Active", "lanes_affected": 3, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100183, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 18 and 46. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -36.414166, "long": 143.691463, "start_date": "2019-05-22T02:00:00", "last_updated": "2019-05-29T12:50:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100184, "incident_type": "Flooding", "title": "Flooding - Western Hwy", "description": "Flooding on Western Hwy between exits 24 and 53. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.633113, "long": 145.157109, "start_date": "2019-05-27T19:00:00", "last_updated": "2019-05-29T02:36:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100185, "incident_type": "Flooding", "title": "Flooding - Eastern Fwy", "description": "Flooding on Eastern Fwy between exits 22 and 62. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -38.12985, "long": 144.857675, "start_date": "2019-05-27T23:00:00", "last_updated": "2019-05-29T03:38:00", "status": "Active", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100186, "incident_type": "Flooding", "title": "Flooding - Calder Fwy", "description": "Flooding on Calder Fwy between exits 23 and 65. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.893942, "long": 145.213972, "start_date": "2019-05-18T22:00:00", "last_updated": "2019-05-29T02:10:00", "status": "Active", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100187, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 37 and 70. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -38.181837, "long": 145.313794, "start_date": "2019-05-21T12:00:00", "last_updated": "2019-05-29T06:35:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100188, "incident_type": "Traffic Alert", "title": "Traffic Alert - Hume Hwy", "description": "Traffic Alert on Hume Hwy between exits 17 and 42. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.692016, "long": 145.017627, "start_date": "2019-05-01T04:00:00", "last_updated": "2019-05-29T23:31:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100189, "incident_type": "Road Closed", "title": "Road Closed - Western Hwy", "description": "Road Closed on Western Hwy between exits 26 and 47. Expect delays.", "closed_road_name": "Western Hwy", "lat": -35.590475, "long": 148.884622, "start_date": "2019-05-07T21:00:00", "last_updated": "2019-05-29T04:47:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100190, "incident_type": "Hazard", "title": "Hazard - Calder Fwy", "description": "Hazard on Calder Fwy between exits 34 and 58. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.603103, "long": 145.075086, "start_date": "2019-05-28T22:00:00", "last_updated": "2019-05-29T08:01:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100191, "incident_type": "Flooding", "title": "Flooding - Hume Hwy", "description": "Flooding on Hume Hwy between exits 20 and 43. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.549707, "long": 145.539293, "start_date": "2019-05-21T14:00:00", "last_updated": "2019-05-29T14:18:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100192, "incident_type": "Road Closed", "title": "Road Closed - Hume Hwy", "description": "Road Closed on Hume Hwy between exits 7 and 50. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.722089, "long": 145.585113, "start_date": "2019-05-27T16:00:00", "last_updated": "2019-05-29T08:24:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100193, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 14 and 68. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -38.071534, "long": 145.479758, "start_date": "2019-05-27T06:00:00", "last_updated": "2019-05-29T17:41:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100194, "incident_type": "Road Closed", "title": "Road Closed - Monash Fwy", "description": "Road Closed on Monash Fwy between exits 16 and 65. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.625863, "long": 145.463032, "start_date": "2019-05-19T21:00:00", "last_updated": "2019-05-29T01:39:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100195, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 13 and 69. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -34.409766, "long": 141.550321, "start_date": "2019-05-27T18:00:00", "last_updated": "2019-05-29T12:26:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100196, "incident_type": "Flooding", "title": "Flooding - Western Hwy", "description": "Flooding on Western Hwy between exits 22 and 80. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.894743, "long": 145.040117, "start_date": "2019-05-20T12:00:00", "last_updated": "2019-05-29T15:20:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100197, "incident_type": "Hazard", "title": "Hazard - Burwood Hwy", "description": "Hazard on Burwood Hwy between exits 21 and 45. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -36.377567, "long": 144.55808, "start_date": "2019-05-05T23:00:00", "last_updated": "2019-05-29T21:58:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100198, "incident_type": "Flooding", "title": "Flooding - Eastern Fwy", "description": "Flooding on Eastern Fwy between exits 15 and 64. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.820495, "long": 145.502501, "start_date": "2019-05-23T07:00:00", "last_updated": "2019-05-29T01:26:00", "status": "Active", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100199, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 16 and 73. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -39.088057, "long": 148.743706, "start_date": "2019-05-23T14:00:00", "last_updated": "2019-05-29T10:09:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100200, "incident_type": "Road Closed", "title": "Road Closed - Geelong Rd", "description": "Road Closed on Geelong Rd between exits 18 and 77. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.875036, "long": 144.826497, "start_date": "2019-05-03T02:00:00", "last_updated": "2019-05-29T16:16:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100201, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 33 and 58. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.502273, "long": 145.374685, "start_date": "2019-05-15T00:00:00", "last_updated": "2019-05-29T07:51:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100202, "incident_type": "Hazard", "title": "Hazard - Burwood Hwy", "description": "Hazard on Burwood Hwy between exits 5 and 56. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.578112, "long": 144.890981, "start_date": "2019-05-25T22:00:00", "last_updated": "2019-05-29T01:57:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100203, "incident_type": "Hazard", "title": "Hazard - Eastern Fwy", "description": "Hazard on Eastern Fwy between exits 35 and 42. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.592492, "long": 145.417824, "start_date": "2019-05-08T08:00:00", "last_updated": "2019-05-29T14:57:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100204, "incident_type": "Hazard", "title": "Hazard - Calder Fwy", "description": "Hazard on Calder Fwy between exits 11 and 75. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.764165, "long": 144.503742, "start_date": "2019-05-15T22:00:00", "last_updated": "2019-05-29T18:43:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100205, "incident_type": "Hazard", "title": "Hazard - Eastern Fwy", "description": "Hazard on Eastern Fwy between exits 37 and 62. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -38.037181, "long": 145.473226, "start_date": "2019-05-14T06:00:00", "last_updated": "2019-05-29T12:26:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100206, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 40 and 77. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.943645, "long": 145.338431, "start_date": "2019-05-04T08:00:00", "last_updated": "2019-05-29T14:23:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100207, "incident_type": "Hazard", "title": "Hazard - Hume Hwy", "description": "Hazard on Hume Hwy between exits 36 and 55. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.730612, "long": 144.587838, "start_date": "2019-05-21T08:00:00", "last_updated": "2019-05-29T22:02:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100208, "incident_type": "Hazard", "title": "Hazard - Burwood Hwy", "description": "Hazard on Burwood Hwy between exits 36 and 50. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.886384, "long": 145.007964, "start_date": "2019-05-22T03:00:00", "last_updated": "2019-05-29T11:35:00", "status": "Active", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100209, "incident_type": "Hazard", "title": "Hazard - Monash Fwy", "description": "Hazard on Monash Fwy between exits 9 and 75. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.022546, "long": 144.820181, "start_date": "2019-05-26T11:00:00", "last_updated": "2019-05-29T22:49:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100210, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 36 and 71. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.967248, "long": 144.97162, "start_date": "2019-05-08T14:00:00", "last_updated": "2019-05-29T10:15:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100211, "incident_type": "Traffic Alert", "title": "Traffic Alert - Hume Hwy", "description": "Traffic Alert on Hume Hwy between exits 24 and 61. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.889059, "long": 144.79822, "start_date": "2019-05-17T23:00:00", "last_updated": "2019-05-29T02:14:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100212, "incident_type": "Roadworks", "title": "Roadworks - Princes Fwy", "description": "Roadworks on Princes Fwy between exits 12 and 52. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -38.719919, "long": 144.73006, "start_date": "2019-05-16T01:00:00", "last_updated": "2019-05-29T15:16:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100213, "incident_type": "Traffic Alert", "title": "Traffic Alert - Monash Fwy", "description": "Traffic Alert on Monash Fwy between exits 31 and 65. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.682439, "long": 144.987508, "start_date": "2019-05-04T19:00:00", "last_updated": "2019-05-29T14:35:00", "status": "Active", "lanes_affected": 1, "icon": "icon_traffic_alert.png", "source": "VicRoads"}, {"id": 100214, "incident_type": "Hazard", "title": "Hazard - Geelong Rd", "description": "Hazard on Geelong Rd between exits 19 and 49. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -34.422055, "long": 145.371379, "start_date": "2019-05-11T03:00:00", "last_updated": "2019-05-29T13:37:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100215, "incident_type": "Hazard", "title": "Hazard - Hume Hwy", "description": "Hazard on Hume Hwy between exits 21 and 41. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -34.453443, "long": 143.203586, "start_date": "2019-05-06T07:00:00", "last_updated": "2019-05-29T12:15:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100216, "incident_type": "Flooding", "title": "Flooding - Hume Hwy", "description": "Flooding on Hume Hwy between exits 34 and 42. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -35.372528, "long": 141.837352, "start_date": "2019-05-13T05:00:00", "last_updated": "2019-05-29T07:24:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100217, "incident_type": "Flooding", "title": "Flooding - Calder Fwy", "description": "Flooding on Calder Fwy between exits 8 and 66. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -34.252205, "long": 144.907244, "start_date": "2019-05-18T07:00:00", "last_updated": "2019-05-29T18:12:00", "status": "Active", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100218, "incident_type": "Flooding", "title": "Flooding - Burwood Hwy", "description": "Flooding on Burwood Hwy between exits 35 and 73. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.766531, "long": 144.711526, "start_date": "2019-05-17T07:00:00", "last_updated": "2019-05-29T09:42:00", "status": "Active", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100219, "incident_type": "Roadworks", "title": "Roadworks - Princes Fwy", "description": "Roadworks on Princes Fwy between exits 36 and 72. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.666317, "long": 145.053958, "start_date": "2019-05-06T15:00:00", "last_updated": "2019-05-29T19:17:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100220, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 4 and 72. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.558684, "long": 145.117513, "start_date": "2019-05-07T14:00:00", "last_updated": "2019-05-29T07:00:00", "status": "Active", "lanes_affected": 2, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100221, "incident_type": "Hazard", "title": "Hazard - Maroondah Hwy", "description": "Hazard on Maroondah Hwy between exits 20 and 70. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -34.920065, "long": 148.298073, "start_date": "2019-05-04T22:00:00", "last_updated": "2019-05-29T01:05:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100222, "incident_type": "Road Closed", "title": "Road Closed - Western Hwy", "description": "Road Closed on Western Hwy between exits 39 and 47. Expect delays.", "closed_road_name": "Western Hwy", "lat": -38.043318, "long": 144.508844, "start_date": "2019-05-28T01:00:00", "last_updated": "2019-05-29T14:02:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100223, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 4 and 80. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -34.893506, "long": 148.873163, "start_date": "2019-05-17T18:00:00", "last_updated": "2019-05-29T23:27:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100224, "incident_type": "Hazard", "title": "Hazard - Monash Fwy", "description": "Hazard on Monash Fwy between exits 22 and 59. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -35.553664, "long": 144.848843, "start_date": "2019-05-09T04:00:00", "last_updated": "2019-05-29T12:32:00", "status": "Active", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100225, "incident_type": "Hazard", "title": "Hazard - Burwood Hwy", "description": "Hazard on Burwood Hwy between exits 30 and 75. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.725947, "long": 145.528967, "start_date": "2019-05-01T13:00:00", "last_updated": "2019-05-29T17:25:00", "status": "Active", "lanes_affected": 2, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100226, "incident_type": "Road Closed", "title": "Road Closed - Maroondah Hwy", "description": "Road Closed on Maroondah Hwy between exits 5 and 80. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -34.748322, "long": 144.339541, "start_date": "2019-05-16T10:00:00", "last_updated": "2019-05-29T08:30:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100227, "incident_type": "Flooding", "title": "Flooding - Hume Hwy", "description": "Flooding on Hume Hwy between exits 1 and 48. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -36.35854, "long": 144.373617, "start_date": "2019-05-20T16:00:00", "last_updated": "2019-05-29T18:22:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100228, "incident_type": "Roadworks", "title": "Roadworks - Nepean Hwy", "description": "Roadworks on Nepean Hwy between exits 32 and 50. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.100774, "long": 141.261197, "start_date": "2019-05-04T08:00:00", "last_updated": "2019-05-29T05:55:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100229, "incident_type": "Road Closed", "title": "Road Closed - Eastern Fwy", "description": "Road Closed on Eastern Fwy between exits 38 and 45. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -36.60218, "long": 142.442494, "start_date": "2019-05-15T05:00:00", "last_updated": "2019-05-29T23:00:00", "status": "Active", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100230, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 28 and 48. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.78092, "long": 145.396769, "start_date": "2019-05-13T19:00:00", "last_updated": "2019-05-29T17:33:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100231, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 1 and 59. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.020408, "long": 144.827132, "start_date": "2019-05-21T19:00:00", "last_updated": "2019-05-29T20:55:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100232, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 31 and 47. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -37.528783, "long": 149.434451, "start_date": "2019-05-27T12:00:00", "last_updated": "2019-05-29T06:09:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100233, "incident_type": "Hazard", "title": "Hazard - Princes Fwy", "description": "Hazard on Princes Fwy between exits 15 and 50. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -36.492377, "long": 145.521831, "start_date": "2019-05-15T19:00:00", "last_updated": "2019-05-29T02:29:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100234, "incident_type": "Flooding", "title": "Flooding - Princes Fwy", "description": "Flooding on Princes Fwy between exits 27 and 57. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -36.905985, "long": 142.157478, "start_date": "2019-05-02T07:00:00", "last_updated": "2019-05-29T09:25:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100235, "incident_type": "Road Closed", "title": "Road Closed - Princes Fwy", "description": "Road Closed on Princes Fwy between exits 32 and 64. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -37.663017, "long": 144.599074, "start_date": "2019-05-18T18:00:00", "last_updated": "2019-05-29T23:53:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_road_closed.png", "source": "VicRoads"}, {"id": 100236, "incident_type": "Flooding", "title": "Flooding - Nepean Hwy", "description": "Flooding on Nepean Hwy between exits 15 and 52. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -35.353789, "long": 141.848272, "start_date": "2019-05-16T12:00:00", "last_updated": "2019-05-29T09:04:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100237, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 27 and 71. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -34.177581, "long": 146.175728, "start_date": "2019-05-28T22:00:00", "last_updated": "2019-05-29T02:09:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100238, "incident_type": "Flooding", "title": "Flooding - Burwood Hwy", "description": "Flooding on Burwood Hwy between exits 33 and 41. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -38.157511, "long": 144.577381, "start_date": "2019-05-27T21:00:00", "last_updated": "2019-05-29T13:54:00", "status": "Active", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100239, "incident_type": "Flooding", "title": "Flooding - Hume Hwy", "description": "Flooding on Hume Hwy between exits 36 and 80. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.540501, "long": 148.31393, "start_date": "2019-05-13T23:00:00", "last_updated": "2019-05-29T11:51:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100240, "incident_type": "Flooding", "title": "Flooding - Calder Fwy", "description": "Flooding on Calder Fwy between exits 18 and 68. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.766235, "long": 143.379369, "start_date": "2019-05-20T14:00:00", "last_updated": "2019-05-29T00:16:00", "status": "Active", "lanes_affected": 1, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100241, "incident_type": "Flooding", "title": "Flooding - Burwood Hwy", "description": "Flooding on Burwood Hwy between exits 28 and 58. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -34.671484, "long": 143.400718, "start_date": "2019-05-24T11:00:00", "last_updated": "2019-05-29T13:46:00", "status": "Active", "lanes_affected": 2, "icon": "icon_flooding.png", "source": "VicRoads"}, {"id": 100242, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 35 and 80. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.624445, "long": 145.450173, "start_date": "2019-05-20T02:00:00", "last_updated": "2019-05-29T06:31:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100243, "incident_type": "Hazard", "title": "Hazard - Nepean Hwy", "description": "Hazard on Nepean Hwy between exits 5 and 71. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.545842, "long": 144.803186, "start_date": "2019-05-26T00:00:00", "last_updated": "2019-05-29T21:52:00", "status": "Active", "lanes_affected": 3, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100244, "incident_type": "Hazard", "title": "Hazard - Western Hwy", "description": "Hazard on Western Hwy between exits 39 and 60. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.656212, "long": 144.575748, "start_date": "2019-05-22T01:00:00", "last_updated": "2019-05-29T11:57:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100245, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 4 and 52. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -35.837904, "long": 146.881752, "start_date": "2019-05-16T17:00:00", "last_updated": "2019-05-29T09:25:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100246, "incident_type": "Hazard", "title": "Hazard - Maroondah Hwy", "description": "Hazard on Maroondah Hwy between exits 18 and 65. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -38.024459, "long": 145.266937, "start_date": "2019-05-08T22:00:00", "last_updated": "2019-05-29T20:49:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}, {"id": 100247, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 9 and 64. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.790186, "long": 144.608152, "start_date": "2019-05-18T12:00:00", "last_updated": "2019-05-29T03:23:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100248, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 10 and 47. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -38.212856, "long": 145.640133, "start_date": "2019-05-01T23:00:00", "last_updated": "2019-05-29T12:36:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 100249, "incident_type": "Hazard", "title": "Hazard - Geelong Rd", "description": "Hazard on Geelong Rd between exits 9 and 75. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.034608, "long": 144.797652, "start_date": "2019-05-27T16:00:00", "last_updated": "2019-05-29T03:41:00", "status": "Active", "lanes_affected": 1, "icon": "icon_hazard.png", "source": "VicRoads"}], "planned": [{"id": 101000, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 25 and 52. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.083186, "long": 144.705737, "start_date": "2019-05-02T00:00:00", "last_updated": "2019-05-29T23:01:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101001, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 18 and 47. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.127062, "long": 147.807046, "start_date": "2019-05-01T07:00:00", "last_updated": "2019-05-29T21:15:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101002, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 34 and 43. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.107985, "long": 141.098496, "start_date": "2019-05-04T21:00:00", "last_updated": "2019-05-29T14:24:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101003, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 17 and 69. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.028135, "long": 144.827601, "start_date": "2019-05-19T22:00:00", "last_updated": "2019-05-29T03:08:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101004, "incident_type": "Roadworks", "title": "Roadworks - Princes Fwy", "description": "Roadworks on Princes Fwy between exits 31 and 75. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -38.121483, "long": 144.644112, "start_date": "2019-05-27T15:00:00", "last_updated": "2019-05-29T16:27:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101005, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 9 and 58. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.92931, "long": 145.197569, "start_date": "2019-05-10T18:00:00", "last_updated": "2019-05-29T05:54:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101006, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 4 and 45. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -37.508166, "long": 144.824838, "start_date": "2019-05-24T18:00:00", "last_updated": "2019-05-29T02:46:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101007, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 37 and 56. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.55773, "long": 144.774797, "start_date": "2019-05-05T14:00:00", "last_updated": "2019-05-29T16:44:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101008, "incident_type": "Roadworks", "title": "Roadworks - Nepean Hwy", "description": "Roadworks on Nepean Hwy between exits 19 and 80. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -38.105005, "long": 145.341095, "start_date": "2019-05-02T08:00:00", "last_updated": "2019-05-29T20:18:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101009, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 18 and 57. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -34.47745, "long": 141.006249, "start_date": "2019-05-09T06:00:00", "last_updated": "2019-05-29T20:59:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101010, "incident_type": "Roadworks", "title": "Roadworks - Nepean Hwy", "description": "Roadworks on Nepean Hwy between exits 1 and 74. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -37.85727, "long": 145.421313, "start_date": "2019-05-17T21:00:00", "last_updated": "2019-05-29T15:56:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101011, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 19 and 64. Expect delays.", "closed_road_name": "Western Hwy", "lat": -36.887937, "long": 142.578546, "start_date": "2019-05-11T15:00:00", "last_updated": "2019-05-29T12:22:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101012, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 37 and 54. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -35.391299, "long": 147.748568, "start_date": "2019-05-18T13:00:00", "last_updated": "2019-05-29T10:46:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101013, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 15 and 56. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.593402, "long": 145.420806, "start_date": "2019-05-20T11:00:00", "last_updated": "2019-05-29T15:32:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101014, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 38 and 67. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -34.759945, "long": 141.064731, "start_date": "2019-05-23T04:00:00", "last_updated": "2019-05-29T05:22:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101015, "incident_type": "Roadworks", "title": "Roadworks - Maroondah Hwy", "description": "Roadworks on Maroondah Hwy between exits 11 and 55. Expect delays.", "closed_road_name": "Maroondah Hwy", "lat": -38.183164, "long": 144.529027, "start_date": "2019-05-15T13:00:00", "last_updated": "2019-05-29T15:11:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101016, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 25 and 58. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -37.900331, "long": 146.144938, "start_date": "2019-05-21T07:00:00", "last_updated": "2019-05-29T13:22:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101017, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 8 and 54. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -36.408874, "long": 147.8519, "start_date": "2019-05-07T00:00:00", "last_updated": "2019-05-29T19:51:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101018, "incident_type": "Roadworks", "title": "Roadworks - Princes Fwy", "description": "Roadworks on Princes Fwy between exits 37 and 71. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -38.013122, "long": 144.906423, "start_date": "2019-05-25T09:00:00", "last_updated": "2019-05-29T23:04:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101019, "incident_type": "Roadworks", "title": "Roadworks - Princes Fwy", "description": "Roadworks on Princes Fwy between exits 8 and 43. Expect delays.", "closed_road_name": "Princes Fwy", "lat": -35.132622, "long": 144.854183, "start_date": "2019-05-03T02:00:00", "last_updated": "2019-05-29T22:17:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101020, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 25 and 59. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.016625, "long": 143.151262, "start_date": "2019-05-19T15:00:00", "last_updated": "2019-05-29T01:16:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101021, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 30 and 59. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -38.178582, "long": 144.817248, "start_date": "2019-05-22T13:00:00", "last_updated": "2019-05-29T21:08:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101022, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 30 and 61. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.714043, "long": 145.460944, "start_date": "2019-05-28T08:00:00", "last_updated": "2019-05-29T08:22:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101023, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 23 and 67. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.563402, "long": 145.507496, "start_date": "2019-05-04T23:00:00", "last_updated": "2019-05-29T21:46:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101024, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 27 and 80. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.511416, "long": 145.456561, "start_date": "2019-05-26T09:00:00", "last_updated": "2019-05-29T08:38:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101025, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 38 and 43. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -36.128063, "long": 141.192296, "start_date": "2019-05-06T23:00:00", "last_updated": "2019-05-29T01:32:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101026, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 18 and 71. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.621591, "long": 144.962505, "start_date": "2019-05-08T15:00:00", "last_updated": "2019-05-29T09:54:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101027, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 37 and 41. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.127907, "long": 145.409905, "start_date": "2019-05-17T16:00:00", "last_updated": "2019-05-29T08:55:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101028, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 34 and 62. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.627819, "long": 144.910353, "start_date": "2019-05-02T10:00:00", "last_updated": "2019-05-29T16:32:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101029, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 1 and 52. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -37.668344, "long": 145.051659, "start_date": "2019-05-03T03:00:00", "last_updated": "2019-05-29T23:58:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101030, "incident_type": "Roadworks", "title": "Roadworks - Burwood Hwy", "description": "Roadworks on Burwood Hwy between exits 31 and 68. Expect delays.", "closed_road_name": "Burwood Hwy", "lat": -38.849857, "long": 148.071514, "start_date": "2019-05-09T22:00:00", "last_updated": "2019-05-29T13:41:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101031, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 30 and 59. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -36.360252, "long": 142.344636, "start_date": "2019-05-14T04:00:00", "last_updated": "2019-05-29T18:26:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101032, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 13 and 43. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.970381, "long": 145.580452, "start_date": "2019-05-06T09:00:00", "last_updated": "2019-05-29T22:50:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101033, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 14 and 41. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -37.851155, "long": 144.657727, "start_date": "2019-05-15T12:00:00", "last_updated": "2019-05-29T06:26:00", "status": "Planned", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101034, "incident_type": "Roadworks", "title": "Roadworks - Eastern Fwy", "description": "Roadworks on Eastern Fwy between exits 28 and 50. Expect delays.", "closed_road_name": "Eastern Fwy", "lat": -38.938544, "long": 145.600004, "start_date": "2019-05-02T18:00:00", "last_updated": "2019-05-29T20:28:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101035, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 37 and 71. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.068023, "long": 144.769669, "start_date": "2019-05-24T13:00:00", "last_updated": "2019-05-29T03:17:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101036, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 19 and 51. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.799053, "long": 145.587149, "start_date": "2019-05-23T11:00:00", "last_updated": "2019-05-29T04:15:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101037, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 18 and 60. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.008185, "long": 145.457042, "start_date": "2019-05-18T15:00:00", "last_updated": "2019-05-29T01:47:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101038, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 3 and 45. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.09208, "long": 146.182673, "start_date": "2019-05-16T17:00:00", "last_updated": "2019-05-29T20:31:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101039, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 6 and 73. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -38.131088, "long": 145.310586, "start_date": "2019-05-23T03:00:00", "last_updated": "2019-05-29T14:08:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101040, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 3 and 48. Expect delays.", "closed_road_name": "Western Hwy", "lat": -37.636984, "long": 144.659315, "start_date": "2019-05-20T20:00:00", "last_updated": "2019-05-29T15:55:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101041, "incident_type": "Roadworks", "title": "Roadworks - Nepean Hwy", "description": "Roadworks on Nepean Hwy between exits 39 and 77. Expect delays.", "closed_road_name": "Nepean Hwy", "lat": -38.023558, "long": 147.741617, "start_date": "2019-05-19T21:00:00", "last_updated": "2019-05-29T17:55:00", "status": "Active", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101042, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 10 and 55. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.195085, "long": 145.059711, "start_date": "2019-05-17T07:00:00", "last_updated": "2019-05-29T00:50:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101043, "incident_type": "Roadworks", "title": "Roadworks - Calder Fwy", "description": "Roadworks on Calder Fwy between exits 1 and 78. Expect delays.", "closed_road_name": "Calder Fwy", "lat": -37.522447, "long": 145.39769, "start_date": "2019-05-12T18:00:00", "last_updated": "2019-05-29T16:47:00", "status": "Active", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101044, "incident_type": "Roadworks", "title": "Roadworks - Hume Hwy", "description": "Roadworks on Hume Hwy between exits 7 and 56. Expect delays.", "closed_road_name": "Hume Hwy", "lat": -38.119881, "long": 145.241323, "start_date": "2019-05-23T21:00:00", "last_updated": "2019-05-29T03:43:00", "status": "Planned", "lanes_affected": 3, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101045, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 20 and 74. Expect delays.", "closed_road_name": "Western Hwy", "lat": -34.122735, "long": 141.457728, "start_date": "2019-05-02T09:00:00", "last_updated": "2019-05-29T03:18:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101046, "incident_type": "Roadworks", "title": "Roadworks - Geelong Rd", "description": "Roadworks on Geelong Rd between exits 25 and 50. Expect delays.", "closed_road_name": "Geelong Rd", "lat": -36.478277, "long": 142.197487, "start_date": "2019-05-16T10:00:00", "last_updated": "2019-05-29T20:37:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101047, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 30 and 67. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -37.670691, "long": 145.568154, "start_date": "2019-05-24T21:00:00", "last_updated": "2019-05-29T08:19:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101048, "incident_type": "Roadworks", "title": "Roadworks - Western Hwy", "description": "Roadworks on Western Hwy between exits 18 and 79. Expect delays.", "closed_road_name": "Western Hwy", "lat": -35.62583, "long": 147.147956, "start_date": "2019-05-09T19:00:00", "last_updated": "2019-05-29T02:14:00", "status": "Planned", "lanes_affected": 2, "icon": "icon_roadworks.png", "source": "VicRoads"}, {"id": 101049, "incident_type": "Roadworks", "title": "Roadworks - Monash Fwy", "description": "Roadworks on Monash Fwy between exits 6 and 42. Expect delays.", "closed_road_name": "Monash Fwy", "lat": -38.100815, "long": 145.591041, "start_date": "2019-05-28T08:00:00", "last_updated": "2019-05-29T06:33:00", "status": "Active", "lanes_affected": 1, "icon": "icon_roadworks.png", "source": "VicRoads"}], "last_updated": "2019-05-29T10:05:00"};
+function layer_0(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_1(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_2(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_3(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_4(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_5(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_6(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_7(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_8(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_9(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_10(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_11(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_12(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_13(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_14(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_15(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_16(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_17(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_18(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_19(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_20(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_21(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_22(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_23(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_24(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_25(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_26(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_27(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_28(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_29(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_30(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_31(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_32(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_33(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_34(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_35(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_36(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_37(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_38(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_39(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_40(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_41(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_42(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_43(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_44(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_45(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_46(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_47(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_48(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_49(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_50(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_51(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_52(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_53(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_54(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_55(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_56(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_57(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_58(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_59(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_60(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_61(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_62(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_63(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_64(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_65(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_66(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_67(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_68(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_69(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_70(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_71(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_72(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_73(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_74(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_75(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_76(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_77(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_78(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_79(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_80(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_81(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_82(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_83(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_84(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_85(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_86(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_87(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_88(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_89(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_90(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_91(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_92(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_93(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_94(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_95(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_96(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_97(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_98(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_99(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_100(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_101(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_102(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_103(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_104(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_105(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_106(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_107(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_108(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_109(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_110(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_111(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_112(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_113(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_114(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_115(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_116(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_117(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_118(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_119(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_120(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_121(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_122(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_123(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_124(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_125(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_126(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_127(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_128(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_129(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_130(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_131(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_132(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_133(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_134(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_135(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_136(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_137(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_138(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_139(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_140(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_141(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_142(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_143(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_144(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_145(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_146(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_147(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_148(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_149(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_150(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_151(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_152(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_153(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_154(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_155(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_156(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_157(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_158(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_159(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_160(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_161(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_162(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_163(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_164(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_165(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_166(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_167(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_168(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_169(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_170(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_171(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_172(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_173(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_174(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_175(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_176(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_177(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_178(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_179(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_180(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_181(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_182(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_183(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_184(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_185(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_186(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_187(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_188(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_189(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_190(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_191(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_192(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_193(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_194(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_195(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_196(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_197(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_198(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_199(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_200(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_201(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_202(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_203(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_204(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_205(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_206(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_207(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_208(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_209(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_210(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_211(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_212(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_213(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_214(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_215(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_216(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_217(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_218(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_219(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_220(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_221(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_222(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_223(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_224(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_225(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_226(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_227(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_228(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_229(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_230(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_231(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_232(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_233(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_234(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_235(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_236(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_237(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_238(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_239(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_240(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_241(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_242(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_243(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_244(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_245(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_246(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_247(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_248(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_249(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_250(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_251(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_252(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_253(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_254(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_255(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_256(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_257(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_258(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_259(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_260(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_261(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_262(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_263(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_264(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_265(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_266(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_267(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_268(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_269(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_270(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_271(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_272(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_273(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_274(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_275(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_276(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_277(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_278(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_279(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_280(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_281(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_282(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_283(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_284(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_285(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_286(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_287(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_288(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_289(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_290(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_291(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_292(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_293(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_294(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_295(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_296(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_297(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_298(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_299(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_300(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_301(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_302(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_303(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_304(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_305(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_306(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_307(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_308(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_309(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_310(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_311(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_312(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_313(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_314(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_315(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_316(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_317(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_318(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_319(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_320(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_321(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_322(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_323(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_324(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_325(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_326(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_327(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_328(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_329(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_330(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_331(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_332(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_333(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_334(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_335(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_336(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_337(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_338(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_339(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_340(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_341(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_342(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_343(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_344(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_345(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_346(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_347(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_348(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_349(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_350(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_351(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_352(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_353(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_354(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_355(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_356(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_357(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_358(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_359(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_360(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_361(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_362(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_363(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_364(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_365(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_366(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_367(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_368(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_369(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_370(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_371(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_372(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_373(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_374(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_375(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_376(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_377(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_378(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_379(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_380(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_381(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_382(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_383(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_384(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_385(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_386(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_387(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_388(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_389(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_390(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_391(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_392(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_393(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_394(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_395(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_396(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_397(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_398(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_399(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_400(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_401(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_402(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_403(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_404(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_405(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_406(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_407(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_408(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_409(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_410(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_411(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_412(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_413(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_414(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_415(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_416(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_417(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_418(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_419(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_420(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_421(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_422(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_423(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_424(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_425(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_426(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_427(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_428(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_429(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_430(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_431(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_432(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_433(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_434(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_435(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_436(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_437(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_438(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_439(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_440(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_441(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_442(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_443(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_444(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_445(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_446(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_447(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_448(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_449(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_450(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_451(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_452(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_453(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_454(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_455(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_456(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_457(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_458(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_459(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_460(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_461(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_462(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_463(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_464(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_465(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_466(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_467(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_468(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_469(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_470(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_471(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_472(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_473(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_474(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_475(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_476(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_477(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_478(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_479(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_480(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_481(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_482(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_483(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_484(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_485(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_486(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_487(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_488(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_489(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_490(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_491(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_492(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_493(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_494(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_495(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_496(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_497(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_498(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_499(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_500(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_501(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_502(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_503(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_504(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_505(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_506(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_507(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_508(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_509(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_510(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_511(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_512(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_513(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_514(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_515(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_516(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_517(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_518(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_519(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_520(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_521(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_522(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_523(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_524(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_525(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_526(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_527(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_528(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_529(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_530(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_531(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_532(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_533(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_534(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_535(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_536(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_537(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_538(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_539(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_540(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_541(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_542(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_543(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_544(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_545(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_546(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_547(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_548(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_549(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_550(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_551(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_552(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_553(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_554(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_555(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_556(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_557(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_558(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_559(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_560(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_561(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_562(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_563(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_564(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_565(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_566(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_567(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_568(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_569(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_570(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_571(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_572(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_573(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_574(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_575(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_576(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_577(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_578(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_579(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_580(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_581(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_582(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_583(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_584(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_585(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_586(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_587(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_588(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_589(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_590(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_591(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_592(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_593(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_594(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_595(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_596(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_597(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_598(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_599(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_600(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_601(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_602(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_603(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_604(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_605(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_606(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_607(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_608(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_609(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_610(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_611(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_612(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_613(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_614(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_615(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_616(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_617(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_618(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_619(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_620(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_621(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_622(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_623(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_624(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_625(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_626(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_627(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_628(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_629(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_630(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_631(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_632(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_633(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_634(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_635(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_636(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_637(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_638(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_639(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_640(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_641(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_642(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_643(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_644(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_645(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_646(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_647(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_648(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_649(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_650(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_651(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_652(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_653(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_654(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_655(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_656(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_657(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_658(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_659(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_660(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_661(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_662(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_663(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_664(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_665(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_666(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_667(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_668(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_669(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_670(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_671(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_672(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_673(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_674(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_675(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_676(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_677(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_678(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_679(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_680(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_681(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_682(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_683(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_684(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_685(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_686(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_687(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_688(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_689(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_690(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_691(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_692(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_693(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_694(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_695(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_696(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_697(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_698(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_699(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_700(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_701(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_702(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_703(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_704(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_705(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_706(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_707(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_708(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_709(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_710(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_711(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_712(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_713(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_714(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_715(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_716(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_717(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_718(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_719(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_720(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_721(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_722(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_723(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_724(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_725(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_726(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_727(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_728(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_729(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_730(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_731(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_732(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_733(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_734(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_735(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_736(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_737(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_738(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_739(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_740(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_741(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_742(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_743(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_744(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_745(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_746(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_747(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_748(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_749(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_750(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_751(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_752(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_753(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_754(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_755(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_756(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_757(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_758(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_759(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_760(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_761(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_762(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_763(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_764(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_765(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_766(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_767(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_768(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_769(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_770(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_771(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_772(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_773(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_774(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_775(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_776(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_777(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_778(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_779(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_780(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_781(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_782(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_783(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_784(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_785(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_786(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_787(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_788(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_789(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_790(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_791(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_792(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_793(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_794(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_795(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_796(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_797(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_798(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }
+function layer_799(map, data) { var markers = []; for (var i = 0; i < data.length; i++) { markers.push(L.marker([data[i].lat, data[i].long]).bindPopup(data[i].title)); } return L.layerGroup(markers).addTo(map); }